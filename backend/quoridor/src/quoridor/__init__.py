@@ -1,9 +1,34 @@
-from .board import Board
-from .player import Player
-from .cell import Cell
-from .consts import Direction, WallOrientation, Position, MOVEMENT_VECTORS
-from .wall import Wall
-from .game_manager import GameManager
-from .utils.movement_validator import MovementValidator
-from .utils.wall_validator import WallValidator
-from .utils.path_finder import PathFinder
+import importlib
+
+# Public names and the modules that define them. Nothing is imported until a name is first used,
+# so `import quoridor` and worker-process startup stay cheap.
+_EXPORTS = {
+    "Board": ".board",
+    "BitBoard": ".bitboard",
+    "Player": ".player",
+    "Cell": ".cell",
+    "BoardBackend": ".consts",
+    "Direction": ".consts",
+    "WallOrientation": ".consts",
+    "Position": ".consts",
+    "MOVEMENT_VECTORS": ".consts",
+    "Wall": ".wall",
+    "GameManager": ".game_manager",
+    "MovementValidator": ".utils.movement_validator",
+    "WallValidator": ".utils.wall_validator",
+    "PathFinder": ".utils.path_finder",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
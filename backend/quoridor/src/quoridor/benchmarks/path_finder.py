@@ -0,0 +1,74 @@
+import argparse
+import random
+import time
+from typing import Callable
+
+from quoridor.board import Board
+from quoridor.consts import WallOrientation
+from quoridor.player import Player
+from quoridor.utils.path_finder import PathFinder
+from quoridor.utils.wall_validator import WallValidator
+from quoridor.wall import Wall
+
+
+def random_board(size: int, wall_count: int, rng: random.Random) -> tuple[Board, list[Player]]:
+    board = Board(size=size)
+    players = [
+        Player(name="A", position=(0, size // 2), destination={(size - 1, i) for i in range(size)}),
+        Player(name="B", position=(size - 1, size // 2), destination={(0, i) for i in range(size)}),
+    ]
+    board.set_occupation_state(set(players))
+    placed = 0
+    while placed < wall_count:
+        position = (rng.randrange(size - 1), rng.randrange(size - 1))
+        wall = Wall(top_left_cell=board._get_cell_at(position), orientation=rng.choice(list(WallOrientation)))
+        if WallValidator._overlaps_with_existing_wall(board, wall):
+            continue
+        if not WallValidator._players_have_paths(board, players, wall):
+            continue
+        board.place_wall(wall.top_left_cell, wall.orientation)
+        placed += 1
+    return board, players
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare PathFinder.bfs against the indexed BFS modes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 13, 19])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'size':>4} {'walls':>5} {'bfs (us)':>10} {'indexed (us)':>13} {'distance (us)':>14} {'speedup':>8}")
+    for size in args.sizes:
+        wall_count = size + size // 2
+        board, players = random_board(size, wall_count, rng)
+        player = players[0]
+        # PathFinder.bfs follows pawn moves - with the pawns lifted it searches the same wall-only
+        # graph as the indexed modes, so every column times the same shortest-path problem
+        board.set_occupation_state(set())
+        path = PathFinder.bfs(board, player.position, player.destination)
+        assert len(path) == len(PathFinder.indexed_bfs(board, player.position, player.destination))
+        assert len(path) - 1 == PathFinder.distance(board, player.position, player.destination)
+
+        bfs = measure(lambda: PathFinder.bfs(board, player.position, player.destination), args.repeat)
+        indexed = measure(
+            lambda: PathFinder.indexed_bfs(board, player.position, player.destination).positions(), args.repeat
+        )
+        distance = measure(lambda: PathFinder.distance(board, player.position, player.destination), args.repeat)
+        # Both sides return the full path
+        print(
+            f"{size:>4} {wall_count:>5} {bfs * 1e6:>10.1f} {indexed * 1e6:>13.1f} {distance * 1e6:>14.1f}"
+            f" {bfs / indexed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
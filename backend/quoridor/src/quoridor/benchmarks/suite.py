@@ -0,0 +1,172 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Optional
+
+from quoridor.benchmarks.path_finder import random_board
+from quoridor.bitboard import BitBoard
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.game_manager import wall_allowance
+from quoridor.self_play import play_game
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.path_finder import PathFinder
+from quoridor.utils.wall_validator import WallValidator
+
+# Reproducible timings for the rules-engine hot paths. Every case runs on a position generated from
+# the seed, so two runs of the same version time the same work. Results are keyed
+# `benchmark/size/walls/backend` and written as JSON; pass a saved run as --baseline to fail on
+# regressions.
+
+WALL_DENSITIES = {"few": 0.15, "mid": 0.5, "many": 1.0}
+ROUND_SECONDS = 0.05
+DEFAULT_THRESHOLD = 0.15
+PLAYOUT_TURNS = 200
+
+
+def wall_count(size: int, density: str) -> int:
+    # Fraction of all walls in a two-player game
+    return round(2 * wall_allowance(size, 2) * WALL_DENSITIES[density])
+
+
+def build_position(size: int, density: str, backend: BoardBackend, seed: int):
+    board, players = random_board(size, wall_count(size, density), random.Random(f"{seed}/{size}/{density}"))
+    if backend == BoardBackend.BITBOARD:
+        bitboard = BitBoard(size=size)
+        for wall in board.walls:
+            bitboard.place_wall_at(wall.top_left_cell.position, wall.orientation)
+        bitboard.set_occupation_state(set(players))
+        board = bitboard
+    return board, players
+
+
+def time_per_op(function: Callable[[], int], rounds: int) -> float:
+    # `function` runs one batch and returns how many operations it did. The batch is repeated to
+    # fill ROUND_SECONDS, and the best of `rounds` rounds is kept.
+    start = time.perf_counter()
+    ops = function()
+    number = max(1, int(ROUND_SECONDS / max(time.perf_counter() - start, 1e-9)))
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / (number * ops))
+    return best
+
+
+def position_cases(size: int, density: str, backend: BoardBackend, seed: int) -> dict[str, Callable[[], int]]:
+    board, players = build_position(size, density, backend, seed)
+    cells = [(row, col) for row in range(size) for col in range(size)]
+    rng = random.Random(seed)
+    candidates = [board.wall_at(rng.choice(cells), rng.choice(list(WallOrientation))) for _ in range(32)]
+
+    def valid_moves() -> int:
+        for position in cells:
+            MovementValidator.get_position_valid_moves(board, position)
+        return len(cells)
+
+    def validate_walls() -> int:
+        # validate_wall_placement reports rejections on stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            for wall in candidates:
+                board.clear_caches()
+                WallValidator.validate_wall_placement(board, players, wall)
+        return len(candidates)
+
+    def bfs() -> int:
+        for player in players:
+            PathFinder.bfs(board, player.position, player.destination)
+        return len(players)
+
+    def set_occupation_state() -> int:
+        board.set_occupation_state(set(players))
+        return 1
+
+    return {
+        "get_position_valid_moves": valid_moves,
+        "validate_wall_placement": validate_walls,
+        "path_finder_bfs": bfs,
+        "set_occupation_state": set_occupation_state,
+    }
+
+
+def playout_case(size: int, backend: BoardBackend, seed: int) -> Callable[[], int]:
+    def playout() -> int:
+        play_game(seed, ["random", "random"], size, PLAYOUT_TURNS, backend)
+        return 1
+
+    return playout
+
+
+def run_suite(sizes: list[int], backends: list[BoardBackend], seed: int, rounds: int) -> dict:
+    results = {}
+    for size in sizes:
+        for backend in backends:
+            for density in WALL_DENSITIES:
+                for name, case in position_cases(size, density, backend, seed).items():
+                    results[f"{name}/{size}/{density}/{backend.value}"] = time_per_op(case, rounds)
+            results[f"random_playout/{size}/-/{backend.value}"] = time_per_op(playout_case(size, backend, seed), rounds)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "rounds": rounds,
+            "unit": "seconds per operation",
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    # Returns one line per case slower than the baseline by more than `threshold`
+    regressions = []
+    for key, seconds in sorted(current["results"].items()):
+        previous: Optional[float] = baseline["results"].get(key)
+        if previous is None:
+            continue
+        ratio = seconds / previous
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{key:<52} {previous * 1e6:>11.2f} {seconds * 1e6:>11.2f} {ratio:>7.2f}x {marker}", file=sys.stderr)
+        if marker:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the rules engine hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 13])
+    parser.add_argument("--backends", nargs="+", choices=[b.value for b in BoardBackend], default=["pydantic"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", default="-", help="JSON file, or - for stdout")
+    parser.add_argument("--baseline", help="saved JSON run to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.15 = 15%%")
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, [BoardBackend(b) for b in args.backends], args.seed, args.rounds)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"{'case':<52} {'base (us)':>11} {'now (us)':>11} {'ratio':>8}", file=sys.stderr)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
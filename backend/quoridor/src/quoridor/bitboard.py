@@ -0,0 +1,162 @@
+from typing import Union
+
+from quoridor.board import Board
+from quoridor.cell import Cell
+from quoridor.consts import COLUMN_INDEX, ROW_INDEX, SIZE, Position, WallOrientation
+from quoridor.move import MoveMixin
+from quoridor.player import Player
+from quoridor.utils.distance_map import DistanceMap, DistanceMapCache
+from quoridor.utils.graph_analysis import GraphAnalysis, GraphAnalysisCache
+from quoridor.wall import Wall, WallSlots, wall_edges
+from quoridor.zobrist import ZobristMixin
+
+
+class BitBoard(MoveMixin, ZobristMixin):
+    # Compact board backend - pawns, wall slots and blocked edges are integer bitmasks.
+    # Bit `row * size + col` of `_blocked_down` / `_blocked_right` is set when the move
+    # from that cell one step down / right is blocked by a wall.
+
+    def __init__(self, size: int = SIZE) -> None:
+        self.size = size
+        self._players: dict[int, Player] = {}
+        self._pawns = 0
+        self._horizontal_walls = 0
+        self._vertical_walls = 0
+        self._wall_slots = WallSlots(size)
+        self._blocked_down = 0
+        self._blocked_right = 0
+        self._distance_maps = DistanceMapCache()
+        self._graph_analyses = GraphAnalysisCache()
+        self._walls_key = 0
+        self._players_key = 0
+        self._player_slots: dict[str, int] = {}
+
+    def index(self, position: Position) -> int:
+        return position[ROW_INDEX] * self.size + position[COLUMN_INDEX]
+
+    def position(self, index: int) -> Position:
+        return divmod(index, self.size)
+
+    @property
+    def walls(self) -> frozenset[Wall]:
+        walls = set()
+        for orientation, mask in (
+            (WallOrientation.HORIZONTAL, self._horizontal_walls),
+            (WallOrientation.VERTICAL, self._vertical_walls),
+        ):
+            while mask:
+                bit = mask & -mask
+                walls.add(self.wall_at(self.position(bit.bit_length() - 1), orientation))
+                mask ^= bit
+        return frozenset(walls)
+
+    def wall_mask(self, orientation: WallOrientation) -> int:
+        return self._horizontal_walls if orientation == WallOrientation.HORIZONTAL else self._vertical_walls
+
+    def has_wall(self, position: Position, orientation: WallOrientation) -> bool:
+        row, col = position
+        if not (0 <= row < self.size and 0 <= col < self.size):
+            return False
+        mask = self._horizontal_walls if orientation == WallOrientation.HORIZONTAL else self._vertical_walls
+        return bool(mask >> self.index(position) & 1)
+
+    def wall_conflicts(self, position: Position, orientation: WallOrientation) -> bool:
+        return self._wall_slots.conflicts(position, orientation)
+
+    def wall_at(self, position: Position, orientation: WallOrientation) -> Wall:
+        # Walls only need the top-left square - the cell carries no pawn
+        return Wall(top_left_cell=Cell(position=position), orientation=orientation)
+
+    def place_wall(self, top_left_cell: Cell, orientation: WallOrientation) -> bool:
+        return self.place_wall_at(top_left_cell.position, orientation)
+
+    def place_wall_at(self, position: Position, orientation: WallOrientation) -> bool:
+        row, col = position
+        if self._wall_slots.conflicts((row, col), orientation):
+            return False
+        self._wall_slots.add((row, col), orientation)
+        bit = 1 << self.index((row, col))
+
+        if orientation == WallOrientation.HORIZONTAL:
+            self._horizontal_walls |= bit
+            if row + 1 < self.size:
+                self._blocked_down |= bit
+                if col + 1 < self.size:
+                    self._blocked_down |= bit << 1
+        else:
+            self._vertical_walls |= bit
+            if col + 1 < self.size:
+                self._blocked_right |= bit
+                if row + 1 < self.size:
+                    self._blocked_right |= bit << self.size
+        self._toggle_wall_key((row, col), orientation)
+        self._distance_maps.on_edges_blocked(wall_edges((row, col), orientation, self.size))
+        self._graph_analyses.clear()
+        return True
+
+    def remove_wall(self, wall: Wall) -> None:
+        self.remove_wall_at(wall.top_left_cell.position, wall.orientation)
+
+    def remove_wall_at(self, position: Position, orientation: WallOrientation) -> None:
+        row, col = position
+        bit = 1 << self.index(position)
+
+        # Placed walls never overlap, so each blocked edge belongs to exactly one wall
+        if orientation == WallOrientation.HORIZONTAL and self._horizontal_walls & bit:
+            self._horizontal_walls ^= bit
+            self._blocked_down &= ~(bit | bit << 1) if col + 1 < self.size else ~bit
+        elif orientation == WallOrientation.VERTICAL and self._vertical_walls & bit:
+            self._vertical_walls ^= bit
+            self._blocked_right &= ~(bit | bit << self.size) if row + 1 < self.size else ~bit
+        else:
+            return
+        self._wall_slots.remove(position, orientation)
+        self._toggle_wall_key(position, orientation)
+        self._distance_maps.on_edges_opened(wall_edges(position, orientation, self.size))
+        self._graph_analyses.clear()
+
+    def distance_map(self, destination_set: set[Position]) -> DistanceMap:
+        return self._distance_maps.get(self, destination_set)
+
+    def graph_analysis(self, destination_set: set[Position]) -> GraphAnalysis:
+        return self._graph_analyses.get(self, destination_set)
+
+    def clear_caches(self) -> None:
+        # Drops every cached distance map and graph analysis - they are rebuilt on the next request
+        self._distance_maps.clear()
+        self._graph_analyses.clear()
+
+    def is_edge_blocked(self, source: Position, destination: Position) -> bool:
+        return self.is_index_edge_blocked(self.index(source), self.index(destination))
+
+    def is_index_edge_blocked(self, source_index: int, destination_index: int) -> bool:
+        if destination_index == source_index + 1:
+            return bool(self._blocked_right >> source_index & 1)
+        if destination_index == source_index - 1:
+            return bool(self._blocked_right >> destination_index & 1)
+        if destination_index == source_index + self.size:
+            return bool(self._blocked_down >> source_index & 1)
+        return bool(self._blocked_down >> destination_index & 1)
+
+    def move_player(self, player: Player, destination: Position) -> None:
+        source_index = self.index(player.position)
+        destination_index = self.index(destination)
+        self._players.pop(source_index, None)
+        self._players[destination_index] = player
+        self._pawns = self._pawns & ~(1 << source_index) | 1 << destination_index
+        self._toggle_pawn_key(player, player.position)
+        player.jump(destination)
+        self._toggle_pawn_key(player, destination)
+
+    def is_occupied(self, position: Position) -> bool:
+        return bool(self._pawns >> self.index(position) & 1)
+
+    def set_occupation_state(self, players: set[Player]) -> None:
+        self._players = {self.index(player.position): player for player in players}
+        self._pawns = 0
+        for index in self._players:
+            self._pawns |= 1 << index
+        self._reset_players_key(players)
+
+
+AnyBoard = Union[Board, BitBoard]
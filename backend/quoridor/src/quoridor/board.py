@@ -1,69 +1,148 @@
 from typing import Iterable, Optional
-from pydantic import BaseModel, Field, model_validator
-from collections import deque
 
 from quoridor.cell import Cell
 from quoridor.consts import (
     COLUMN_INDEX,
-    MOVEMENT_VECTORS,
     ROW_INDEX,
     SIZE,
     Position,
     WallOrientation,
 )
+from quoridor.move import MoveMixin
 from quoridor.player import Player
-from quoridor.wall import Wall
+from quoridor.utils.distance_map import DistanceMap, DistanceMapCache
+from quoridor.utils.graph_analysis import GraphAnalysis, GraphAnalysisCache
+from quoridor.wall import Wall, WallSlots, wall_edges
+from quoridor.zobrist import ZobristMixin
 
 
-class Board(BaseModel):
-    size: int
-    board: list[list[Cell]] = Field(default_factory=list)
-    walls: set[Wall] = Field(default_factory=set)
+class Board(MoveMixin, ZobristMixin):
+    # Cell-grid board backend - every square is a Cell object and walls are kept as a set of Wall objects
 
-    @model_validator(mode="before")
-    def initialize_board(cls, values):
-        size = values.get("size", SIZE)
-        values["board"] = [[Cell(position=(row, col)) for col in range(size)] for row in range(size)]
-        return values
+    def __init__(self, size: int = SIZE, walls: Optional[Iterable[Wall]] = None) -> None:
+        self.size = size
+        self.board: list[list[Cell]] = [[Cell(position=(row, col)) for col in range(size)] for row in range(size)]
+        self._walls: set[Wall] = set()
 
-    class Config:
-        arbitrary_types_allowed = True
+        # Blocked-edge index - number of walls covering the move one step down / right of each cell,
+        # indexed by `row * size + col`. Counts (rather than flags) make removal a plain decrement.
+        self._blocked_down = bytearray(size * size)
+        self._blocked_right = bytearray(size * size)
+        self._distance_maps = DistanceMapCache()
+        self._graph_analyses = GraphAnalysisCache()
+        self._walls_key = 0
+        self._players_key = 0
+        self._player_slots: dict[str, int] = {}
+        self._pawn_cells: set[Position] = set()
+        self._wall_slots = WallSlots(size)
+        for wall in walls or ():
+            self._walls.add(wall)
+            self._wall_slots.add(wall.top_left_cell.position, wall.orientation)
+            self._update_edge_index(wall, 1)
+            self._toggle_wall_key(wall.top_left_cell.position, wall.orientation)
+
+    def index(self, position: Position) -> int:
+        return position[ROW_INDEX] * self.size + position[COLUMN_INDEX]
+
+    def position(self, index: int) -> Position:
+        return divmod(index, self.size)
+
+    @property
+    def walls(self) -> frozenset[Wall]:
+        # Read-only - walls change only through place_wall/remove_wall, which keep the edge index,
+        # wall slots and position key in step
+        return frozenset(self._walls)
+
+    def wall_mask(self, orientation: WallOrientation) -> int:
+        # Bit `row * size + col` is set for every wall of this orientation, as on BitBoard
+        mask = 0
+        for wall in self._walls:
+            if wall.orientation == orientation:
+                mask |= 1 << self.index(wall.top_left_cell.position)
+        return mask
+
+    def wall_conflicts(self, position: Position, orientation: WallOrientation) -> bool:
+        return self._wall_slots.conflicts(position, orientation)
+
+    def wall_at(self, position: Position, orientation: WallOrientation) -> Wall:
+        return Wall(top_left_cell=self._get_cell_at(position), orientation=orientation)
 
     def place_wall(self, top_left_cell: Cell, orientation: WallOrientation) -> bool:
-        new_wall = Wall(top_left_cell=top_left_cell, orientation=orientation)
-        if any({wall for wall in self.walls if wall.top_left_cell == top_left_cell}):
+        if self._wall_slots.conflicts(top_left_cell.position, orientation):
             return False
-        self.walls.add(new_wall)
+        new_wall = Wall(top_left_cell=top_left_cell, orientation=orientation)
+        self._walls.add(new_wall)
+        self._wall_slots.add(top_left_cell.position, orientation)
+        self._update_edge_index(new_wall, 1)
+        self._toggle_wall_key(top_left_cell.position, orientation)
+        self._distance_maps.on_edges_blocked(wall_edges(top_left_cell.position, orientation, self.size))
+        self._graph_analyses.clear()
         return True
-        queue = deque([(start, [])])  # Start with the player's position
-        visited = set()
-        visited.add(start)
 
-        while queue:
-            current_position, path = queue.popleft()
+    def place_wall_at(self, position: Position, orientation: WallOrientation) -> bool:
+        return self.place_wall(self._get_cell_at(position), orientation)
+
+    def remove_wall(self, wall: Wall) -> None:
+        if wall in self._walls:
+            self._walls.remove(wall)
+            self._wall_slots.remove(wall.top_left_cell.position, wall.orientation)
+            self._update_edge_index(wall, -1)
+            self._toggle_wall_key(wall.top_left_cell.position, wall.orientation)
+            self._distance_maps.on_edges_opened(wall_edges(wall.top_left_cell.position, wall.orientation, self.size))
+            self._graph_analyses.clear()
+
+    def remove_wall_at(self, position: Position, orientation: WallOrientation) -> None:
+        self.remove_wall(self.wall_at(position, orientation))
+
+    def distance_map(self, destination_set: set[Position]) -> DistanceMap:
+        return self._distance_maps.get(self, destination_set)
+
+    def graph_analysis(self, destination_set: set[Position]) -> GraphAnalysis:
+        return self._graph_analyses.get(self, destination_set)
+
+    def clear_caches(self) -> None:
+        # Drops every cached distance map and graph analysis - they are rebuilt on the next request
+        self._distance_maps.clear()
+        self._graph_analyses.clear()
+
+    def is_edge_blocked(self, source: Position, destination: Position) -> bool:
+        return self.is_index_edge_blocked(self.index(source), self.index(destination))
 
-            # If we reach a destination, return the path
-            if current_position in destination_set:
-                return path + [current_position]
+    def is_index_edge_blocked(self, source_index: int, destination_index: int) -> bool:
+        if destination_index == source_index + 1:
+            return self._blocked_right[source_index] > 0
+        if destination_index == source_index - 1:
+            return self._blocked_right[destination_index] > 0
+        if destination_index == source_index + self.size:
+            return self._blocked_down[source_index] > 0
+        return self._blocked_down[destination_index] > 0
 
-            # Explore all valid moves (neighboring cells)
-            for direction, (row_change, col_change) in MOVEMENT_VECTORS.items():
-                new_position = (current_position[ROW_INDEX] + row_change, current_position[COLUMN_INDEX] + col_change)
+    def _update_edge_index(self, wall: Wall, delta: int) -> None:
+        index = self._blocked_down if wall.orientation == WallOrientation.HORIZONTAL else self._blocked_right
+        for source, _ in wall_edges(wall.top_left_cell.position, wall.orientation, self.size):
+            index[self.index(source)] += delta
 
-                # If it's a valid move and hasn't been visited
-                if self.is_valid_move(current_position, new_position) and new_position not in visited:
-                    visited.add(new_position)
-                    queue.append((new_position, path + [current_position]))
+    def move_player(self, player: Player, destination: Position) -> None:
+        self._get_cell_at(player.position).remove_player()
+        self._pawn_cells.discard(player.position)
+        self._toggle_pawn_key(player, player.position)
+        player.jump(destination)
+        self._toggle_pawn_key(player, destination)
+        self._get_cell_at(destination).place_player(player)
+        self._pawn_cells.add(destination)
 
-        return None  # No path found
+    def is_occupied(self, position: Position) -> bool:
+        return self._get_cell_at(position).is_occupied
 
     def set_occupation_state(self, players: set[Player]) -> None:
-        for row in self.board:
-            for cell in row:
-                if cell.position in {player.position for player in players}:
-                    cell.place_player(next(player for player in players if player.position == cell.position))
-                else:
-                    cell.remove_player()
+        # Only cells that held or now hold a pawn are touched
+        positions = {player.position: player for player in players}
+        for position in self._pawn_cells - positions.keys():
+            self._get_cell_at(position).remove_player()
+        for position, player in positions.items():
+            self._get_cell_at(position).place_player(player)
+        self._pawn_cells = set(positions)
+        self._reset_players_key(players)
 
     def _get_cell_at(self, position: Position) -> Cell:
         return self.board[position[ROW_INDEX]][position[COLUMN_INDEX]]
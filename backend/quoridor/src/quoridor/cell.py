@@ -1,17 +1,15 @@
+from dataclasses import dataclass
 from typing import Optional
-from pydantic import BaseModel
 
 from quoridor.consts import Position
 from quoridor.player import Player
 
 
-class Cell(BaseModel):
+@dataclass(slots=True)
+class Cell:
     position: Position
     standing_player: Optional[Player] = None
 
-    class Config:
-        arbitrary_types_allowed = True
-
     @property
     def is_occupied(self) -> bool:
         return self.standing_player is not None
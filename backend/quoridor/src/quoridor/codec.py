@@ -0,0 +1,189 @@
+import struct
+from typing import Iterator, Optional, Union
+
+from quoridor.bitboard import AnyBoard, BitBoard
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.game_manager import GameManager, starting_players
+from quoridor.move import Move, PawnMove, WallMove
+from quoridor.player import Player
+
+# Compact binary encodings for positions and whole games. All integers are little-endian.
+#
+# Position:  size, player count, side to move (u8 each)
+#            per player - pawn square `row * size + col` (u16), walls remaining (u8)
+#            horizontal then vertical wall bitmap, ceil(size * size / 8) bytes each
+#
+# Game:      magic "QG", version, size, player count, winner (0xFF if unfinished) (u8 each),
+#            move count (u16), then one u16 per move - the kind in the top two bits and the
+#            square in the low fourteen. Kind 3 is a pass, for a player left with no legal move.
+#
+# Game records are self-delimiting, so a corpus is just records written back to back. The view
+# classes read fields straight out of any buffer (bytes, memoryview, mmap) on demand.
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+POSITION_HEADER = struct.Struct("<BBB")
+PLAYER_ENTRY = struct.Struct("<HB")
+GAME_HEADER = struct.Struct("<2sBBBBH")
+MOVE_CODE = struct.Struct("<H")
+
+GAME_MAGIC = b"QG"
+GAME_VERSION = 1
+NO_WINNER = 0xFF
+
+PAWN_KIND = 0
+MOVE_KINDS = {WallOrientation.HORIZONTAL: 1, WallOrientation.VERTICAL: 2}
+KIND_ORIENTATIONS = {kind: orientation for orientation, kind in MOVE_KINDS.items()}
+PASS_KIND = 3
+KIND_SHIFT = 14
+SQUARE_MASK = (1 << KIND_SHIFT) - 1
+
+
+def bitmap_bytes(size: int) -> int:
+    return (size * size + 7) // 8
+
+
+def encode_move(move: Optional[Move], size: int) -> int:
+    if move is None:
+        return PASS_KIND << KIND_SHIFT
+    if isinstance(move, PawnMove):
+        row, col = move.destination
+        return PAWN_KIND << KIND_SHIFT | row * size + col
+    row, col = move.position
+    return MOVE_KINDS[move.orientation] << KIND_SHIFT | row * size + col
+
+
+def decode_move(code: int, size: int) -> Optional[Move]:
+    kind, square = code >> KIND_SHIFT, code & SQUARE_MASK
+    if kind == PASS_KIND:
+        return None
+    if kind == PAWN_KIND:
+        return PawnMove(divmod(square, size))
+    return WallMove(divmod(square, size), KIND_ORIENTATIONS[kind])
+
+
+def encode_position(board: AnyBoard, players: list[Player], side: int) -> bytes:
+    size = board.size
+    parts = [POSITION_HEADER.pack(size, len(players), side)]
+    parts.extend(PLAYER_ENTRY.pack(board.index(player.position), player.wall_count) for player in players)
+    for orientation in WallOrientation:
+        parts.append(board.wall_mask(orientation).to_bytes(bitmap_bytes(size), "little"))
+    return b"".join(parts)
+
+
+class PositionView:
+    # Reads an encoded position in place - nothing is decoded until a field is asked for
+
+    def __init__(self, buffer: Buffer, offset: int = 0) -> None:
+        self.buffer = buffer
+        self.offset = offset
+        self.size, self.player_count, self.side = POSITION_HEADER.unpack_from(buffer, offset)
+
+    @property
+    def nbytes(self) -> int:
+        return POSITION_HEADER.size + self.player_count * PLAYER_ENTRY.size + 2 * bitmap_bytes(self.size)
+
+    def square(self, player_index: int) -> int:
+        return PLAYER_ENTRY.unpack_from(
+            self.buffer, self.offset + POSITION_HEADER.size + player_index * PLAYER_ENTRY.size
+        )[0]
+
+    def walls_left(self, player_index: int) -> int:
+        return PLAYER_ENTRY.unpack_from(
+            self.buffer, self.offset + POSITION_HEADER.size + player_index * PLAYER_ENTRY.size
+        )[1]
+
+    def wall_mask(self, orientation: WallOrientation) -> int:
+        length = bitmap_bytes(self.size)
+        start = self.offset + POSITION_HEADER.size + self.player_count * PLAYER_ENTRY.size
+        if orientation == WallOrientation.VERTICAL:
+            start += length
+        return int.from_bytes(self.buffer[start : start + length], "little")
+
+    def build(self) -> tuple[BitBoard, list[Player]]:
+        size = self.size
+        board = BitBoard(size=size)
+        players = starting_players(size, self.player_count)
+        for index, player in enumerate(players):
+            player.position = divmod(self.square(index), size)
+            player.wall_count = self.walls_left(index)
+        for orientation in WallOrientation:
+            mask = self.wall_mask(orientation)
+            while mask:
+                bit = mask & -mask
+                board.place_wall_at(board.position(bit.bit_length() - 1), orientation)
+                mask ^= bit
+        board.set_occupation_state(set(players))
+        return board, players
+
+
+def decode_position(buffer: Buffer, offset: int = 0) -> tuple[BitBoard, list[Player], int]:
+    view = PositionView(buffer, offset)
+    board, players = view.build()
+    return board, players, view.side
+
+
+def encode_game(game: GameManager) -> bytes:
+    winner = game.winner()
+    return encode_game_moves(
+        game.board.size,
+        len(game.player_states),
+        None if winner is None else game.players.index(winner),
+        [None if record is None else record.move for _, record in game.history],
+    )
+
+
+def encode_game_moves(size: int, player_count: int, winner: Optional[int], moves: list[Optional[Move]]) -> bytes:
+    codes = [encode_move(move, size) for move in moves]
+    header = GAME_HEADER.pack(
+        GAME_MAGIC, GAME_VERSION, size, player_count, NO_WINNER if winner is None else winner, len(codes)
+    )
+    return header + struct.pack(f"<{len(codes)}H", *codes)
+
+
+class GameRecordView:
+    # A game record read in place. Move codes are unpacked one at a time from the buffer.
+
+    def __init__(self, buffer: Buffer, offset: int = 0) -> None:
+        magic, version, size, player_count, winner, move_count = GAME_HEADER.unpack_from(buffer, offset)
+        if magic != GAME_MAGIC or version != GAME_VERSION:
+            raise ValueError(f"Not a game record at offset {offset}")
+        self.buffer = buffer
+        self.offset = offset
+        self.size = size
+        self.player_count = player_count
+        self.winner: Optional[int] = None if winner == NO_WINNER else winner
+        self.move_count = move_count
+
+    @property
+    def nbytes(self) -> int:
+        return GAME_HEADER.size + self.move_count * MOVE_CODE.size
+
+    def move_code(self, index: int) -> int:
+        return MOVE_CODE.unpack_from(self.buffer, self.offset + GAME_HEADER.size + index * MOVE_CODE.size)[0]
+
+    def move_codes(self) -> Iterator[int]:
+        start = self.offset + GAME_HEADER.size
+        for (code,) in MOVE_CODE.iter_unpack(self.buffer[start : start + self.move_count * MOVE_CODE.size]):
+            yield code
+
+    def moves(self) -> Iterator[Optional[Move]]:
+        for code in self.move_codes():
+            yield decode_move(code, self.size)
+
+    def replay(self, backend: BoardBackend = BoardBackend.BITBOARD) -> GameManager:
+        game = GameManager(size=self.size, backend=backend, player_count=self.player_count)
+        for move in self.moves():
+            if move is None:
+                game.pass_turn()
+            else:
+                game.apply(move)
+        return game
+
+
+def iter_game_records(buffer: Buffer, offset: int = 0, end: Optional[int] = None) -> Iterator[GameRecordView]:
+    end = len(buffer) if end is None else end
+    while offset < end:
+        record = GameRecordView(buffer, offset)
+        yield record
+        offset += record.nbytes
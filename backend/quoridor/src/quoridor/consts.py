@@ -1,8 +1,7 @@
 from enum import Enum
 
-from pydantic import BaseModel
-
 SIZE = 9
+PLAYER_COUNTS = (2, 4)
 
 
 Position = tuple[int, int]
@@ -63,3 +62,9 @@ MOVEMENT_VECTORS = {
 class WallOrientation(str, Enum):
     HORIZONTAL = "horizontal"
     VERTICAL = "vertical"
+
+
+class BoardBackend(str, Enum):
+    # The cell-grid Board - named for the pydantic model it used to be, kept so saved runs and configs still match
+    PYDANTIC = "pydantic"
+    BITBOARD = "bitboard"
@@ -0,0 +1,166 @@
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from quoridor.bitboard import AnyBoard, BitBoard
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import starting_players
+from quoridor.move import PawnMove
+from quoridor.player import Player
+from quoridor.utils.movement_validator import MovementValidator
+
+# Exact solutions for two-player positions where neither player has walls left. The wall layout is
+# then fixed and the game is a pawn race, so every (side to move, pawn, pawn) state of one layout is
+# solved at once by retrograde analysis and kept in a table cached per layout.
+#
+# Table entries are signed ply counts for the side to move - `plies + 1` for a win, `-(plies + 1)`
+# for a loss, 0 for a draw (both pawns can stall forever by blocking each other).
+
+LOSS = -1
+DRAW = 0
+WIN = 1
+TABLE_CACHE_SIZE = 64
+
+
+class EndgameOutcome(NamedTuple):
+    result: int
+    plies: Optional[int]  # until the game ends under perfect play, None for a draw
+
+
+class EndgameTable:
+    # Indexed by `(side * cells + mover) * cells + other`, squares as `row * size + col`. `mover` is
+    # the side to move's pawn.
+
+    def __init__(self, size: int, values: array) -> None:
+        self.size = size
+        self.values = values
+
+    def outcome(self, side: int, mover: int, other: int) -> EndgameOutcome:
+        cells = self.size * self.size
+        value = self.values[(side * cells + mover) * cells + other]
+        if value > 0:
+            return EndgameOutcome(WIN, value - 1)
+        if value < 0:
+            return EndgameOutcome(LOSS, -value - 1)
+        return EndgameOutcome(DRAW, None)
+
+    def probe(self, players: list[Player], side: int) -> EndgameOutcome:
+        size = self.size
+        (mover_row, mover_col), (other_row, other_col) = players[side].position, players[1 - side].position
+        return self.outcome(side, mover_row * size + mover_col, other_row * size + other_col)
+
+
+def is_endgame(players: list[Player]) -> bool:
+    return len(players) == 2 and all(player.wall_count == 0 for player in players)
+
+
+def layout_key(board: AnyBoard) -> tuple[int, int, int]:
+    return board.size, board.wall_mask(WallOrientation.HORIZONTAL), board.wall_mask(WallOrientation.VERTICAL)
+
+
+def table_for(board: AnyBoard) -> EndgameTable:
+    return endgame_table(*layout_key(board))
+
+
+def probe(board: AnyBoard, players: list[Player], side: int) -> EndgameOutcome:
+    if len(players) != 2:
+        raise ValueError(f"Endgame tables are two-player only, got {len(players)} players")
+    return table_for(board).probe(players, side)
+
+
+def best_move(board: AnyBoard, players: list[Player], side: int) -> Optional[PawnMove]:
+    # The quickest win, else a draw, else the slowest loss
+    table = table_for(board)
+    size = table.size
+    other_row, other_col = players[1 - side].position
+    other = other_row * size + other_col
+
+    def rank(destination) -> tuple:
+        reply = table.outcome(1 - side, other, destination[0] * size + destination[1])
+        if reply.result == LOSS:
+            return 0, reply.plies
+        if reply.result == DRAW:
+            return 1, 0
+        return 2, -reply.plies
+
+    destinations = MovementValidator.get_player_valid_moves(board, players[side]).values()
+    return PawnMove(min(destinations, key=rank)) if destinations else None
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def endgame_table(size: int, horizontal_walls: int, vertical_walls: int) -> EndgameTable:
+    board = BitBoard(size=size)
+    for orientation, mask in (
+        (WallOrientation.HORIZONTAL, horizontal_walls),
+        (WallOrientation.VERTICAL, vertical_walls),
+    ):
+        while mask:
+            bit = mask & -mask
+            board.place_wall_at(board.position(bit.bit_length() - 1), orientation)
+            mask ^= bit
+    return EndgameTable(size, solve(board))
+
+
+def solve(board: BitBoard) -> array:
+    size = board.size
+    cells = size * size
+    goals = [[False] * cells for _ in range(2)]
+    for side, player in enumerate(starting_players(size)):
+        for position in player.destination:
+            goals[side][board.index(position)] = True
+
+    # Pawn moves from every square with the other pawn on every other square, from the rules engine
+    # itself. Only the other pawn is placed on the board - a pawn never moves onto or over its own square.
+    moves: list[tuple[int, ...]] = [()] * (cells * cells)
+    blocker = Player(name="blocker", position=(0, 0))
+    for other in range(cells):
+        blocker.position = board.position(other)
+        board.set_occupation_state({blocker})
+        for mover in range(cells):
+            if mover != other:
+                destinations = MovementValidator.get_position_valid_moves(board, board.position(mover)).values()
+                moves[mover * cells + other] = tuple(sorted({board.index(position) for position in destinations}))
+
+    states = 2 * cells * cells
+    values = array("h", bytes(2 * states))
+    remaining = [0] * states
+    predecessors: list[list[int]] = [[] for _ in range(states)]
+    queue = deque()
+    for side in range(2):
+        for mover in range(cells):
+            for other in range(cells):
+                if mover == other:
+                    continue
+                state = (side * cells + mover) * cells + other
+                if goals[1 - side][other]:
+                    values[state] = -1
+                    queue.append(state)
+                    continue
+                if goals[side][mover]:
+                    values[state] = 1
+                    queue.append(state)
+                    continue
+                # A pawn with no move passes
+                successors = moves[mover * cells + other] or (mover,)
+                remaining[state] = len(successors)
+                for destination in successors:
+                    predecessors[((1 - side) * cells + other) * cells + destination].append(state)
+
+    # Breadth-first from the finished games: a state is won once any move reaches a lost state and
+    # lost once every move reaches a won state. Whatever is never resolved is a draw.
+    while queue:
+        state = queue.popleft()
+        value = values[state]
+        for previous in predecessors[state]:
+            if values[previous]:
+                continue
+            if value < 0:
+                values[previous] = 1 - value
+                queue.append(previous)
+            else:
+                remaining[previous] -= 1
+                if remaining[previous] == 0:
+                    values[previous] = -(value + 1)
+                    queue.append(previous)
+    return values
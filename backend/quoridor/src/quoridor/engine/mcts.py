@@ -0,0 +1,447 @@
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+from quoridor.bitboard import AnyBoard
+from quoridor.codec import decode_position, encode_position
+from quoridor.consts import SIZE, BoardBackend, WallOrientation
+from quoridor.engine import endgame
+from quoridor.game_manager import GameManager
+from quoridor.move import Move, MoveRecord, PawnMove, WallMove
+from quoridor.player import Player
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+from quoridor.wall import wall_edges
+
+EXPLORATION = 1.4
+WIDENING_SCALE = 1.0
+WIDENING_EXPONENT = 0.5
+DEFAULT_MAX_NODES = 200_000
+PATH_BIAS = 0.8
+ROLLOUT_WALL_PROBABILITY = 0.1
+ROLLOUT_WALL_SAMPLES = 8
+ROLLOUT_MAX_PLIES = 100
+UNREACHABLE_DISTANCE = 1_000
+
+
+class Node:
+    # `wins` counts playouts won by `mover`, the player whose move led here, so a parent always
+    # picks the child that is best for the player choosing. `untried` stays None until the node is
+    # first expanded.
+    __slots__ = ("move", "mover", "parent", "key", "winner", "children", "untried", "visits", "wins")
+
+    def __init__(self, move: Optional[Move], mover: int, parent: Optional["Node"], key: int) -> None:
+        self.move = move
+        self.mover = mover
+        self.parent = parent
+        self.key = key
+        self.winner: Optional[int] = None
+        self.children: list[Node] = []
+        self.untried: Optional[list[Move]] = None
+        self.visits = 0
+        self.wins = 0
+
+
+class MCTSResult(NamedTuple):
+    move: Optional[Move]
+    visits: int
+    value: float
+    playouts: int
+    nodes: int
+    elapsed: float
+    workers: int = 1
+    busy: float = 0.0  # summed worker seconds, for per-core throughput
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def playouts_per_core_second(self) -> float:
+        busy = self.busy or self.elapsed
+        return self.playouts / busy if busy else 0.0
+
+
+class RolloutPolicy:
+    # Cheap playout to the end of the game. A pawn steps along a shortest path with probability
+    # `path_bias` and to a random legal square otherwise. With probability `wall_probability` a
+    # player with walls left instead tries a few sampled slots that cut an opponent's shortest path.
+    # Playouts still running after `max_plies` go to the player closest to their goal. Two-player
+    # playouts end early with the exact result once neither player has walls left.
+
+    def __init__(
+        self,
+        path_bias: float = PATH_BIAS,
+        wall_probability: float = ROLLOUT_WALL_PROBABILITY,
+        wall_samples: int = ROLLOUT_WALL_SAMPLES,
+        max_plies: int = ROLLOUT_MAX_PLIES,
+    ) -> None:
+        self.path_bias = path_bias
+        self.wall_probability = wall_probability
+        self.wall_samples = wall_samples
+        self.max_plies = max_plies
+
+    def play(self, board: AnyBoard, players: list[Player], side: int, rng: random.Random) -> int:
+        # Returns the winner's index. The board is restored before returning.
+        records: list[tuple[Player, MoveRecord]] = []
+        try:
+            for _ in range(self.max_plies):
+                if endgame.is_endgame(players):
+                    return self._endgame_winner(board, players, side)
+                player = players[side]
+                move = self._choose(board, players, side, rng)
+                if move is None:
+                    break
+                records.append((player, board.apply(player, move)))
+                if player.has_reached_destination():
+                    return side
+                side = (side + 1) % len(players)
+            return self._closest(board, players, side)
+        finally:
+            for player, record in reversed(records):
+                board.revert(player, record)
+
+    def _choose(self, board: AnyBoard, players: list[Player], side: int, rng: random.Random) -> Optional[Move]:
+        player = players[side]
+        if player.wall_count > 0 and rng.random() < self.wall_probability:
+            wall = self._sample_wall(board, players, side, rng)
+            if wall is not None:
+                return wall
+        destinations = list(MovementValidator.get_player_valid_moves(board, player).values())
+        if not destinations:
+            return None
+        if rng.random() < self.path_bias:
+            distance_map = board.distance_map(player.destination)
+            return PawnMove(min(destinations, key=lambda position: _distance(distance_map, position)))
+        return PawnMove(rng.choice(destinations))
+
+    def _sample_wall(self, board: AnyBoard, players: list[Player], side: int, rng: random.Random) -> Optional[Move]:
+        size = board.size
+        opponent = players[rng.choice([index for index in range(len(players)) if index != side])]
+        opponent_map = board.distance_map(opponent.destination)
+        candidates = []
+        for _ in range(self.wall_samples):
+            position = (rng.randrange(size - 1), rng.randrange(size - 1))
+            orientation = rng.choice((WallOrientation.HORIZONTAL, WallOrientation.VERTICAL))
+            if not board.wall_conflicts(position, orientation) and opponent_map.is_cut_by(
+                wall_edges(position, orientation, size)
+            ):
+                candidates.append((position, orientation))
+        if not candidates:
+            return None
+        legal = WallValidator.legal_wall_slots(board, players, candidates)
+        return WallMove(*legal[0]) if legal else None
+
+    @classmethod
+    def _endgame_winner(cls, board: AnyBoard, players: list[Player], side: int) -> int:
+        outcome = endgame.probe(board, players, side)
+        if outcome.result == endgame.DRAW:
+            return cls._closest(board, players, side)
+        return side if outcome.result == endgame.WIN else 1 - side
+
+    @staticmethod
+    def _closest(board: AnyBoard, players: list[Player], side: int) -> int:
+        # Ties go to whoever moves first from here
+        order = [(side + offset) % len(players) for offset in range(len(players))]
+        return min(
+            order, key=lambda index: _distance(board.distance_map(players[index].destination), players[index].position)
+        )
+
+
+def _distance(distance_map, position) -> int:
+    distance = distance_map.distance(position)
+    return UNREACHABLE_DISTANCE if distance is None else distance
+
+
+class MCTS:
+    # UCT over the live board: every playout applies its tree path and rollout moves and reverts
+    # them, so the board is never copied. Works for any player count.
+    #
+    # The tree holds at most `max_nodes` nodes - once full, playouts keep refining the existing
+    # tree and start rollouts from its leaves. Nodes are keyed by position, so a later search from a
+    # position a few plies below the last root reuses that subtree and drops the rest.
+
+    def __init__(
+        self,
+        playouts: Optional[int] = None,
+        time_budget: float = 1.0,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        exploration: float = EXPLORATION,
+        widening_scale: float = WIDENING_SCALE,
+        widening_exponent: float = WIDENING_EXPONENT,
+        rollout: Optional[RolloutPolicy] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.max_nodes = max_nodes
+        self.exploration = exploration
+        self.widening_scale = widening_scale
+        self.widening_exponent = widening_exponent
+        self.rollout = rollout or RolloutPolicy()
+        self.rng = random.Random(seed)
+        self.root: Optional[Node] = None
+        self.nodes = 0
+
+    def search(self, board: AnyBoard, players: list[Player], side: int) -> MCTSResult:
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        root = self._find_root(board.position_key(side), len(players))
+        if root is None:
+            root = Node(None, (side - 1) % len(players), None, board.position_key(side))
+            self.nodes = 1
+        else:
+            root.parent = None
+            self.nodes = _count(root)
+        self.root = root
+
+        playouts = 0
+        while self.playouts is None or playouts < self.playouts:
+            if time.perf_counter() >= deadline:
+                break
+            self._playout(board, players, side)
+            playouts += 1
+
+        best = max(root.children, key=lambda child: child.visits, default=None)
+        return MCTSResult(
+            move=None if best is None else best.move,
+            visits=0 if best is None else best.visits,
+            value=best.wins / best.visits if best is not None and best.visits else 0.0,
+            playouts=playouts,
+            nodes=self.nodes,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _playout(self, board: AnyBoard, players: list[Player], side: int) -> None:
+        node = self.root
+        records: list[tuple[Player, MoveRecord]] = []
+        try:
+            # Selection and expansion
+            while node.winner is None:
+                if node.untried is None:
+                    node.untried = self._candidate_moves(board, players, side)[::-1]
+                if node.untried and self.nodes < self.max_nodes and self._can_widen(node):
+                    node = self._expand(node, board, players, side, records)
+                    side = (side + 1) % len(players)
+                    break
+                if not node.children:
+                    break
+                node = self._select(node)
+                records.append((players[side], board.apply(players[side], node.move)))
+                side = (side + 1) % len(players)
+
+            winner = node.winner
+            if winner is None:
+                winner = self.rollout.play(board, players, side, self.rng)
+        finally:
+            for player, record in reversed(records):
+                board.revert(player, record)
+
+        while node is not None:
+            node.visits += 1
+            if node.mover == winner:
+                node.wins += 1
+            node = node.parent
+
+    def _expand(
+        self, node: Node, board: AnyBoard, players: list[Player], side: int, records: list[tuple[Player, MoveRecord]]
+    ) -> Node:
+        move = node.untried.pop()
+        player = players[side]
+        records.append((player, board.apply(player, move)))
+        child = Node(move, side, node, board.position_key((side + 1) % len(players)))
+        if player.has_reached_destination():
+            child.winner = side
+        node.children.append(child)
+        self.nodes += 1
+        return child
+
+    def _can_widen(self, node: Node) -> bool:
+        # Progressive widening - a node tries its next-best move only once the ones it has are
+        # well visited, so the few good moves among ~100 walls get real statistics
+        return len(node.children) < max(1.0, self.widening_scale * node.visits**self.widening_exponent)
+
+    def _select(self, node: Node) -> Node:
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        return max(
+            node.children,
+            key=lambda child: child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    @staticmethod
+    def _candidate_moves(board: AnyBoard, players: list[Player], side: int) -> list[Move]:
+        # Best first: pawn moves closest to the goal, then the walls that cut some opponent's
+        # shortest path, nearest to an opponent first - a wall anywhere else cannot slow anyone down
+        player = players[side]
+        distance_map = board.distance_map(player.destination)
+        moves: list[Move] = [
+            PawnMove(destination)
+            for destination in sorted(
+                MovementValidator.get_player_valid_moves(board, player).values(),
+                key=lambda position: _distance(distance_map, position),
+            )
+        ]
+        if player.wall_count > 0:
+            size = board.size
+            opponent_maps = [
+                board.distance_map(opponent.destination) for index, opponent in enumerate(players) if index != side
+            ]
+            candidates = [
+                ((row, col), orientation)
+                for row in range(size - 1)
+                for col in range(size - 1)
+                for orientation in WallOrientation
+                if any(
+                    opponent_map.is_cut_by(wall_edges((row, col), orientation, size)) for opponent_map in opponent_maps
+                )
+            ]
+            opponents = [opponent.position for index, opponent in enumerate(players) if index != side]
+            walls = [
+                WallMove(position, orientation)
+                for position, orientation in WallValidator.legal_wall_slots(board, players, candidates)
+            ]
+            walls.sort(
+                key=lambda wall: min(
+                    abs(wall.position[0] - row) + abs(wall.position[1] - col) for row, col in opponents
+                )
+            )
+            moves.extend(walls)
+        return moves
+
+    def _find_root(self, key: int, player_count: int) -> Optional[Node]:
+        # The new position is the old root or at most one full round of moves below it
+        if self.root is None:
+            return None
+        level = [self.root]
+        for _ in range(player_count + 1):
+            for node in level:
+                if node.key == key:
+                    return node
+            level = [child for node in level for child in node.children]
+        return None
+
+    def root_stats(self) -> list[tuple[Move, int, int]]:
+        return [(child.move, child.visits, child.wins) for child in self.root.children] if self.root else []
+
+
+def _count(root: Node) -> int:
+    count, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+# Root parallelism - every lane grows its own tree from the same position with its own seed, and the
+# root statistics of all lanes are summed. Lanes share nothing, so the result does not depend on how
+# the executor spreads them over processes.
+
+
+class WorkerReport(NamedTuple):
+    stats: list[tuple[Move, int, int]]
+    playouts: int
+    nodes: int
+    elapsed: float
+
+
+def _worker_search(position: bytes, settings: dict, seed: int) -> WorkerReport:
+    engine = MCTS(seed=seed, **settings)
+    board, players, side = decode_position(position)
+    result = engine.search(board, players, side)
+    return WorkerReport(engine.root_stats(), result.playouts, result.nodes, result.elapsed)
+
+
+class ParallelMCTS:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        playouts: Optional[int] = None,
+        time_budget: float = 1.0,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        exploration: float = EXPLORATION,
+        rollout: Optional[RolloutPolicy] = None,
+        seed: int = 0,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.settings = {
+            # Split between workers, so the total matches a single-process search
+            "playouts": None if playouts is None else -(-playouts // self.workers),
+            "time_budget": time_budget,
+            "max_nodes": max_nodes,
+            "exploration": exploration,
+            "rollout": rollout or RolloutPolicy(),
+        }
+        self.seed = seed
+        self._searches = 0
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self) -> "ParallelMCTS":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def search(self, board: AnyBoard, players: list[Player], side: int) -> MCTSResult:
+        start = time.perf_counter()
+        position = encode_position(board, players, side)
+        base_seed = self.seed + self._searches * self.workers
+        self._searches += 1
+        futures = [
+            self._executor.submit(_worker_search, position, self.settings, base_seed + lane)
+            for lane in range(self.workers)
+        ]
+        reports = [future.result() for future in futures]
+
+        totals: dict[Move, list[int]] = {}
+        for report in reports:
+            for move, visits, wins in report.stats:
+                total = totals.setdefault(move, [0, 0])
+                total[0] += visits
+                total[1] += wins
+
+        best = max(totals, key=lambda move: totals[move][0], default=None)
+        visits, wins = totals[best] if best is not None else (0, 0)
+        return MCTSResult(
+            move=best,
+            visits=visits,
+            value=wins / visits if visits else 0.0,
+            playouts=sum(report.playouts for report in reports),
+            nodes=sum(report.nodes for report in reports),
+            elapsed=time.perf_counter() - start,
+            workers=self.workers,
+            busy=sum(report.elapsed for report in reports),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure MCTS playout throughput from the opening position")
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--time", type=float, default=2.0, help="seconds per search")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    game = GameManager(size=args.size, backend=BoardBackend.BITBOARD, player_count=args.players)
+    print(f"{'workers':>7} {'playouts':>9} {'playouts/s':>11} {'per core':>9} {'nodes':>8}  best move")
+    for workers in args.workers:
+        with ParallelMCTS(workers, time_budget=args.time, max_nodes=args.max_nodes, seed=args.seed) as engine:
+            result = engine.search(game.board, game.players, game.current_player_index)
+        print(
+            f"{workers:>7} {result.playouts:>9} {result.playouts_per_second:>11.1f}"
+            f" {result.playouts_per_core_second:>9.1f} {result.nodes:>8}  {result.move}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from quoridor.engine.mcts import MCTS
+from quoridor.engine.search import Searcher
+from quoridor.game_manager import GameManager
+from quoridor.move import Move, PawnMove, WallMove
+from quoridor.utils.wall_validator import WallValidator
+
+RANDOM_WALL_PROBABILITY = 0.2
+
+
+class MovePolicy(ABC):
+    # Picks the current player's next move, or None to pass when there is no legal move.
+    # Policies never mutate the game.
+
+    @abstractmethod
+    def choose(self, game: GameManager, rng: random.Random) -> Optional[Move]: ...
+
+
+class RandomPolicy(MovePolicy):
+    def __init__(self, wall_probability: float = RANDOM_WALL_PROBABILITY) -> None:
+        self.wall_probability = wall_probability
+
+    def choose(self, game: GameManager, rng: random.Random) -> Optional[Move]:
+        # A cornered pawn always places a wall if it can
+        destinations = sorted(game.current_player_state.possible_movements.values())
+        if game.current_player.wall_count > 0 and (not destinations or rng.random() < self.wall_probability):
+            slots = WallValidator.legal_wall_slots(game.board, [ps.player for ps in game.player_states])
+            if slots:
+                return WallMove(*rng.choice(slots))
+        if not destinations:
+            return None
+        return PawnMove(rng.choice(destinations))
+
+
+class GreedyPolicy(MovePolicy):
+    # Steps along a shortest path to the goal, breaking ties at random. With no pawn move that leads
+    # anywhere it plays any legal move at random, and passes if there is none.
+
+    def choose(self, game: GameManager, rng: random.Random) -> Optional[Move]:
+        player = game.current_player
+        distance_map = game.board.distance_map(player.destination)
+        destinations = sorted(game.current_player_state.possible_movements.values())
+        distances = {destination: distance_map.distance(destination) for destination in destinations}
+        reachable = [distance for distance in distances.values() if distance is not None]
+        if not reachable:
+            moves = game.legal_moves()
+            return rng.choice(moves) if moves else None
+        best = min(reachable)
+        return PawnMove(rng.choice([destination for destination in destinations if distances[destination] == best]))
+
+
+class SearchPolicy(MovePolicy):
+    # Depth-limited by default so games are reproducible - set a finite time budget to play on the clock
+
+    def __init__(self, max_depth: int = 2, time_budget: float = float("inf")) -> None:
+        self.searcher = Searcher(time_budget=time_budget, max_depth=max_depth)
+
+    def choose(self, game: GameManager, rng: random.Random) -> Optional[Move]:
+        players = [ps.player for ps in game.player_states]
+        return self.searcher.search(game.board, players, game.current_player_index).move
+
+
+class MCTSPolicy(MovePolicy):
+    # Fixed playout count by default so games are reproducible. The tree is kept between turns.
+
+    def __init__(self, playouts: int = 400, time_budget: float = float("inf")) -> None:
+        self.engine = MCTS(playouts=playouts, time_budget=time_budget)
+
+    def choose(self, game: GameManager, rng: random.Random) -> Optional[Move]:
+        self.engine.rng.seed(rng.getrandbits(64))
+        return self.engine.search(game.board, game.players, game.current_player_index).move
+
+
+POLICIES: dict[str, type[MovePolicy]] = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "search": SearchPolicy,
+    "mcts": MCTSPolicy,
+}
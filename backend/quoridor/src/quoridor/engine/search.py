@@ -0,0 +1,260 @@
+import time
+from typing import NamedTuple, Optional
+
+from quoridor.bitboard import AnyBoard
+from quoridor.consts import WallOrientation
+from quoridor.engine import endgame
+from quoridor.move import Move, MoveRecord, PawnMove, WallMove
+from quoridor.player import Player
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+from quoridor.wall import wall_edges
+
+WIN_SCORE = 1_000_000
+MAX_PLY = 256
+INFINITY = WIN_SCORE + 1
+PATH_WEIGHT = 10
+WALL_WEIGHT = 1
+UNREACHABLE_DISTANCE = 1_000
+TIMEOUT_CHECK_INTERVAL = 256
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchResult(NamedTuple):
+    move: Optional[Move]
+    score: int
+    depth: int
+    nodes: int
+    elapsed: float
+
+
+class TranspositionEntry(NamedTuple):
+    key: int
+    depth: int
+    score: int
+    flag: int
+    move: Optional[Move]
+    generation: int
+
+
+class TranspositionTable:
+    # Fixed number of slots indexed by the low key bits. A slot is replaced when it holds the same
+    # position, an entry from an older search, or an entry searched no deeper than the new one.
+
+    def __init__(self, size_bits: int = 16) -> None:
+        self.mask = (1 << size_bits) - 1
+        self.entries: list[Optional[TranspositionEntry]] = [None] * (1 << size_bits)
+        self.generation = 0
+
+    def new_search(self) -> None:
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[TranspositionEntry]:
+        entry = self.entries[key & self.mask]
+        return entry if entry is not None and entry.key == key else None
+
+    def store(self, key: int, depth: int, score: int, flag: int, move: Optional[Move]) -> None:
+        slot = key & self.mask
+        entry = self.entries[slot]
+        if entry is None or entry.key == key or entry.generation != self.generation or depth >= entry.depth:
+            self.entries[slot] = TranspositionEntry(key, depth, score, flag, move, self.generation)
+
+
+class Searcher:
+    # Iterative-deepening negamax with alpha-beta pruning for two players. Moves are made and unmade
+    # on the live board, so the search never copies it - the board is restored when search returns.
+    # Transpositions are keyed by the board's incremental Zobrist key.
+
+    def __init__(self, time_budget: float = 1.0, max_depth: int = 32, table_bits: int = 16) -> None:
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table = TranspositionTable(table_bits)
+
+    def search(self, board: AnyBoard, players: list[Player], side: int) -> SearchResult:
+        if len(players) != 2:
+            raise ValueError(f"Search is two-player only, got {len(players)} players")
+        start = time.perf_counter()
+        self._board = board
+        self._players = players
+        self._deadline = start + self.time_budget
+        self._nodes = 0
+        self.table.new_search()
+
+        if endgame.is_endgame(players):
+            move = endgame.best_move(board, players, side)
+            score = self._endgame_score(side, 0)
+            return SearchResult(move, score, 0, 0, time.perf_counter() - start)
+
+        best_move, best_score, completed_depth = None, -INFINITY, 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                move, score = self._search_root(depth, side, best_move)
+            except SearchTimeout:
+                break
+            best_move, best_score, completed_depth = move, score, depth
+            if abs(score) >= WIN_SCORE - MAX_PLY:
+                break
+
+        if best_move is None:
+            moves = self._ordered_moves(side, None)
+            best_move = moves[0] if moves else None
+        return SearchResult(best_move, best_score, completed_depth, self._nodes, time.perf_counter() - start)
+
+    def _search_root(self, depth: int, side: int, previous_best: Optional[Move]) -> tuple[Move, int]:
+        alpha, beta = -INFINITY, INFINITY
+        best_move, best_score = None, -INFINITY
+        for move in self._ordered_moves(side, previous_best):
+            undo = self._make(move, side)
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, 1 - side, 1)
+            finally:
+                self._unmake(move, side, undo)
+            if score > best_score:
+                best_move, best_score = move, score
+            alpha = max(alpha, score)
+        self.table.store(self._board.position_key(side), depth, best_score, EXACT, best_move)
+        return best_move, best_score
+
+    def _negamax(self, depth: int, alpha: int, beta: int, side: int, ply: int) -> int:
+        self._nodes += 1
+        if self._nodes % TIMEOUT_CHECK_INTERVAL == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        # The previous mover won
+        mover = self._players[1 - side]
+        if mover.has_reached_destination():
+            return -WIN_SCORE + ply
+        if endgame.is_endgame(self._players):
+            return self._endgame_score(side, ply)
+        if depth == 0:
+            return self._evaluate(side)
+
+        original_alpha = alpha
+        key = self._board.position_key(side)
+        entry = self.table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move = entry.move
+            if entry.depth >= depth:
+                score = self._score_from_table(entry.score, ply)
+                if entry.flag == EXACT:
+                    return score
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif entry.flag == UPPER_BOUND:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        moves = self._ordered_moves(side, table_move)
+        if not moves:
+            return self._evaluate(side)
+
+        best_move, best_score = None, -INFINITY
+        for move in moves:
+            undo = self._make(move, side)
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, 1 - side, ply + 1)
+            finally:
+                self._unmake(move, side, undo)
+            if score > best_score:
+                best_move, best_score = move, score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(key, depth, self._score_to_table(best_score, ply), flag, best_move)
+        return best_score
+
+    @staticmethod
+    def _score_to_table(score: int, ply: int) -> int:
+        # Win scores are stored relative to the node, not the root
+        if score >= WIN_SCORE - MAX_PLY:
+            return score + ply
+        if score <= -WIN_SCORE + MAX_PLY:
+            return score - ply
+        return score
+
+    @staticmethod
+    def _score_from_table(score: int, ply: int) -> int:
+        if score >= WIN_SCORE - MAX_PLY:
+            return score - ply
+        if score <= -WIN_SCORE + MAX_PLY:
+            return score + ply
+        return score
+
+    def _endgame_score(self, side: int, ply: int) -> int:
+        # Exact once neither player has walls left
+        outcome = endgame.probe(self._board, self._players, side)
+        if outcome.result == endgame.WIN:
+            return WIN_SCORE - ply - outcome.plies
+        if outcome.result == endgame.LOSS:
+            return -WIN_SCORE + ply + outcome.plies
+        return 0
+
+    def _distance(self, player: Player) -> int:
+        return _or_unreachable(self._board.distance_map(player.destination).distance(player.position))
+
+    def _evaluate(self, side: int) -> int:
+        player, opponent = self._players[side], self._players[1 - side]
+        return PATH_WEIGHT * (self._distance(opponent) - self._distance(player)) + WALL_WEIGHT * (
+            player.wall_count - opponent.wall_count
+        )
+
+    def _ordered_moves(self, side: int, first: Optional[Move]) -> list[Move]:
+        board = self._board
+        player, opponent = self._players[side], self._players[1 - side]
+
+        # Pawn moves, closest to the goal first
+        distance_map = board.distance_map(player.destination)
+        pawn_moves = sorted(
+            MovementValidator.get_player_valid_moves(board, player).values(),
+            key=lambda position: _or_unreachable(distance_map.distance(position)),
+        )
+        moves: list[Move] = [PawnMove(position) for position in pawn_moves]
+
+        # Only walls that cut the opponent's shortest paths can lengthen them, nearest to the opponent first
+        if player.wall_count > 0:
+            opponent_map = board.distance_map(opponent.destination)
+            candidates = [
+                ((row, col), orientation)
+                for row in range(board.size - 1)
+                for col in range(board.size - 1)
+                for orientation in WallOrientation
+                if opponent_map.is_cut_by(wall_edges((row, col), orientation, board.size))
+            ]
+            row, col = opponent.position
+            walls = [
+                WallMove(position, orientation)
+                for position, orientation in WallValidator.legal_wall_slots(board, self._players, candidates)
+            ]
+            walls.sort(key=lambda wall: abs(wall.position[0] - row) + abs(wall.position[1] - col))
+            moves.extend(walls)
+
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def _make(self, move: Move, side: int) -> MoveRecord:
+        return self._board.apply(self._players[side], move)
+
+    def _unmake(self, move: Move, side: int, record: MoveRecord) -> None:
+        self._board.revert(self._players[side], record)
+
+
+def _or_unreachable(distance: Optional[int]) -> int:
+    return UNREACHABLE_DISTANCE if distance is None else distance
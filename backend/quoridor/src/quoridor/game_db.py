@@ -0,0 +1,276 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from quoridor.bitboard import BitBoard
+from quoridor.codec import GameRecordView, encode_game, encode_game_moves, iter_game_records
+from quoridor.game_manager import GameManager, starting_players
+from quoridor.self_play import decode_move
+from quoridor.zobrist import MAX_PLAYERS
+
+# Append-only game store with an on-disk position index.
+#
+# `<path>` holds codec game records back to back. `<path>.index` is an open-addressing hash table
+# from position key (Zobrist key with side to move) to the number of games that reached the
+# position and how many of them each player won. Both files are read through mmap, so lookups
+# never load either into memory. The maps stay open until close(), so records from games() can be
+# read for as long as the database is open.
+
+INDEX_MAGIC = b"QGIX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sHBxQQ")  # magic, version, slot bits, entries, indexed data bytes
+INDEX_SLOT = struct.Struct(f"<QI{MAX_PLAYERS}I")  # key, games, wins per player
+EMPTY_KEY = 0
+MIN_SLOT_BITS = 12
+MAX_LOAD = 0.7
+DEFAULT_PENDING_ENTRIES = 1 << 18
+
+
+class PositionStats(NamedTuple):
+    games: int
+    wins: tuple[int, ...]
+
+    @property
+    def unfinished(self) -> int:
+        return self.games - sum(self.wins)
+
+
+def position_keys(record: GameRecordView) -> set[int]:
+    # Every position the game passed through, each counted once per game
+    board = BitBoard(size=record.size)
+    players = starting_players(record.size, record.player_count)
+    board.set_occupation_state(set(players))
+    side = 0
+    keys = {board.position_key(side)}
+    for move in record.moves():
+        if move is not None:
+            board.apply(players[side], move)
+        side = (side + 1) % record.player_count
+        keys.add(board.position_key(side))
+    return keys
+
+
+class GameDatabase:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.index_path = path + ".index"
+        self._index: Optional[mmap.mmap] = None
+        self._index_file = None
+        self._data: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> "GameDatabase":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._close_index()
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def _close_index(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index_file.close()
+            self._index = self._index_file = None
+
+    # Writing
+
+    def append(self, game: GameManager) -> None:
+        # The index catches up on the next build_index
+        with open(self.path, "ab") as f:
+            f.write(encode_game(game))
+
+    def bulk_import(self, records: Iterable[bytes]) -> int:
+        count = 0
+        with open(self.path, "ab", buffering=1 << 20) as f:
+            for record in records:
+                f.write(record)
+                count += 1
+        return count
+
+    def import_self_play(self, lines: Iterable[str]) -> int:
+        # JSON lines as written by quoridor.self_play
+        def records() -> Iterator[bytes]:
+            for line in lines:
+                if not line.strip():
+                    continue
+                game = json.loads(line)
+                player_count = len(game["policies"])
+                names = [player.name for player in starting_players(game["size"], player_count)]
+                winner = None if game["winner"] is None else names.index(game["winner"])
+                moves = [decode_move(code) for code in game["moves"]]
+                yield encode_game_moves(game["size"], player_count, winner, moves)
+
+        return self.bulk_import(records())
+
+    # Indexing
+
+    def build_index(self, max_pending: int = DEFAULT_PENDING_ENTRIES) -> int:
+        # Indexes every game appended since the last build. Counts are aggregated in memory for at
+        # most `max_pending` positions at a time and then merged into the on-disk table, which
+        # doubles in place whenever it passes MAX_LOAD.
+        self._close_index()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return 0
+        if not os.path.exists(self.index_path):
+            self._create_index(MIN_SLOT_BITS)
+
+        indexed = 0
+        with open(self.path, "rb") as data, open(self.index_path, "r+b") as f:
+            table = mmap.mmap(f.fileno(), 0)
+            start = INDEX_HEADER.unpack_from(table)[4]
+            games = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+            pending: dict[int, list[int]] = {}
+            try:
+                for record in iter_game_records(games, start):
+                    for key in position_keys(record):
+                        counts = pending.get(key)
+                        if counts is None:
+                            counts = pending[key] = [0] * (MAX_PLAYERS + 1)
+                        counts[0] += 1
+                        if record.winner is not None:
+                            counts[record.winner + 1] += 1
+                    indexed += 1
+                    if len(pending) >= max_pending:
+                        table = self._merge(f, table, pending)
+                        pending.clear()
+                table = self._merge(f, table, pending)
+                self._set_indexed_bytes(table, len(games))
+            finally:
+                games.close()
+                table.close()
+        return indexed
+
+    def _create_index(self, slot_bits: int, path: Optional[str] = None) -> None:
+        with open(path or self.index_path, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, slot_bits, 0, 0))
+            f.truncate(INDEX_HEADER.size + (1 << slot_bits) * INDEX_SLOT.size)
+
+    @staticmethod
+    def _set_indexed_bytes(table: mmap.mmap, indexed_bytes: int) -> None:
+        magic, version, slot_bits, entries, _ = INDEX_HEADER.unpack_from(table)
+        INDEX_HEADER.pack_into(table, 0, magic, version, slot_bits, entries, indexed_bytes)
+
+    def _merge(self, f, table: mmap.mmap, pending: dict[int, list[int]]) -> mmap.mmap:
+        magic, version, slot_bits, entries, indexed_bytes = INDEX_HEADER.unpack_from(table)
+        while entries + len(pending) > MAX_LOAD * (1 << slot_bits):
+            table = self._grow(f, table)
+            slot_bits += 1
+
+        mask = (1 << slot_bits) - 1
+        for key, counts in pending.items():
+            slot = key & mask
+            while True:
+                offset = INDEX_HEADER.size + slot * INDEX_SLOT.size
+                stored = INDEX_SLOT.unpack_from(table, offset)
+                if stored[0] == key or stored[0] == EMPTY_KEY:
+                    break
+                slot = (slot + 1) & mask
+            if stored[0] == EMPTY_KEY:
+                entries += 1
+            INDEX_SLOT.pack_into(table, offset, key, *(old + new for old, new in zip(stored[1:], counts)))
+
+        INDEX_HEADER.pack_into(table, 0, magic, version, slot_bits, entries, indexed_bytes)
+        return table
+
+    def _grow(self, f, table: mmap.mmap) -> mmap.mmap:
+        # Rehashes into a table twice the size, slot by slot - memory use does not depend on table size
+        magic, version, slot_bits, entries, indexed_bytes = INDEX_HEADER.unpack_from(table)
+        new_bits = slot_bits + 1
+        new_mask = (1 << new_bits) - 1
+        new_path = self.index_path + ".tmp"
+        self._create_index(new_bits, new_path)
+        with open(new_path, "r+b") as new_file:
+            new_table = mmap.mmap(new_file.fileno(), 0)
+            for slot in range(1 << slot_bits):
+                stored = INDEX_SLOT.unpack_from(table, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+                if stored[0] == EMPTY_KEY:
+                    continue
+                new_slot = stored[0] & new_mask
+                while INDEX_SLOT.unpack_from(new_table, INDEX_HEADER.size + new_slot * INDEX_SLOT.size)[0] != EMPTY_KEY:
+                    new_slot = (new_slot + 1) & new_mask
+                INDEX_SLOT.pack_into(new_table, INDEX_HEADER.size + new_slot * INDEX_SLOT.size, *stored)
+            INDEX_HEADER.pack_into(new_table, 0, magic, version, new_bits, entries, indexed_bytes)
+            new_table.close()
+        table.close()
+
+        # Swap the grown table in under the same open file object
+        f.seek(0)
+        f.truncate(0)
+        with open(new_path, "rb") as new_file:
+            while chunk := new_file.read(1 << 20):
+                f.write(chunk)
+        f.flush()
+        os.remove(new_path)
+        return mmap.mmap(f.fileno(), 0)
+
+    # Reading
+
+    def lookup(self, key: int) -> Optional[PositionStats]:
+        table = self._open_index()
+        if table is None:
+            return None
+        slot_bits = INDEX_HEADER.unpack_from(table)[2]
+        mask = (1 << slot_bits) - 1
+        slot = key & mask
+        while True:
+            stored = INDEX_SLOT.unpack_from(table, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+            if stored[0] == key:
+                return PositionStats(stored[1], stored[2:])
+            if stored[0] == EMPTY_KEY:
+                return None
+            slot = (slot + 1) & mask
+
+    def position_stats(self, game: GameManager) -> Optional[PositionStats]:
+        return self.lookup(game.position_key)
+
+    def games(self) -> Iterator[GameRecordView]:
+        # The views read straight from the data map and stay valid until close()
+        data = self._open_data()
+        if data is not None:
+            yield from iter_game_records(data)
+
+    def _open_data(self) -> Optional[mmap.mmap]:
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size == 0:
+            return None
+        # Games appended since the last map need a larger one. The old map is left to the views
+        # still reading from it.
+        if self._data is None or len(self._data) != size:
+            with open(self.path, "rb") as f:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._data
+
+    def _open_index(self) -> Optional[mmap.mmap]:
+        if self._index is None and os.path.exists(self.index_path):
+            self._index_file = open(self.index_path, "rb")
+            self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version = INDEX_HEADER.unpack_from(self._index)[:2]
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                self._close_index()
+                raise ValueError(f"{self.index_path} is not a game index")
+        return self._index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import self-play games and index their positions")
+    parser.add_argument("database")
+    parser.add_argument("games", nargs="*", help="self-play JSON lines files to import")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_PENDING_ENTRIES)
+    args = parser.parse_args()
+
+    with GameDatabase(args.database) as database:
+        for path in args.games:
+            with open(path) as f:
+                print(f"{path}: imported {database.import_self_play(f)} games")
+        print(f"indexed {database.build_index(args.max_pending)} games")
+
+
+if __name__ == "__main__":
+    main()
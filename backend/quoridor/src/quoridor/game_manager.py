@@ -1,13 +1,19 @@
 import sys
 from typing import Callable, Iterable, Optional
-from pydantic import BaseModel, Field
-from quoridor.consts import SIZE, Direction, Position, WallOrientation
+from quoridor.consts import PLAYER_COUNTS, SIZE, BoardBackend, Direction, Position, WallOrientation
 from quoridor.player import Player
 from quoridor.board import Board
+from quoridor.bitboard import BitBoard
+from quoridor.instrumentation import EngineStats
+from quoridor.move import Move, MoveRecord, PawnMove, TurnResult, WallMove
 from quoridor.player_state import PlayerState
-from quoridor.utils.movement_validator import MovementValidator
+from quoridor.renderer import render_frame
+from quoridor.utils.turn_validator import TurnValidator
 from quoridor.utils.wall_validator import WallValidator
-from quoridor.wall import Wall
+from quoridor.wall import wall_edges
+
+# Jumps and diagonal side-steps look at most two steps away from the pawn
+MOVEMENT_RADIUS = 2
 
 
 def process_position_string(s: str) -> Optional[Position]:
@@ -17,29 +23,41 @@ def process_position_string(s: str) -> Optional[Position]:
     return tuple(s) if len(s) == 2 else None
 
 
+def wall_allowance(size: int, player_count: int) -> int:
+    # 20 walls shared out on the standard 9x9 board, growing with the board side
+    return 2 * (size + 1) // player_count
+
+
+def starting_players(size: int, player_count: int = 2) -> list[Player]:
+    # Seats in turn order - top, bottom, left, right - each racing to the opposite edge
+    if player_count not in PLAYER_COUNTS:
+        raise ValueError(f"Quoridor is played by {' or '.join(map(str, PLAYER_COUNTS))} players, not {player_count}")
+    middle, last = int(size / 2), size - 1
+    seats = [
+        ("A", (0, middle), {(last, i) for i in range(size)}),
+        ("B", (last, middle), {(0, i) for i in range(size)}),
+        ("C", (middle, 0), {(i, last) for i in range(size)}),
+        ("D", (middle, last), {(i, 0) for i in range(size)}),
+    ]
+    walls = wall_allowance(size, player_count)
+    return [
+        Player(name=name, position=position, destination=destination, wall_count=walls)
+        for name, position, destination in seats[:player_count]
+    ]
+
+
 class GameManager:
-    def __init__(self, size: int = SIZE) -> None:
-        self.board = Board(size=size)
-        self.player_states: list[PlayerState] = [
-            PlayerState(
-                player=Player(
-                    name="A".capitalize(),
-                    position=(0, int(size / 2)),
-                    destination={(size - 1, i) for i in range(size)},
-                )
-            ),
-            PlayerState(
-                player=Player(
-                    name="B".capitalize(),
-                    position=(size - 1, int(size / 2)),
-                    destination={(0, i) for i in range(size)},
-                )
-            ),
-        ]
+    def __init__(self, size: int = SIZE, backend: BoardBackend = BoardBackend.PYDANTIC, player_count: int = 2) -> None:
+        self.board = BitBoard(size=size) if backend == BoardBackend.BITBOARD else Board(size=size)
+        self.player_states = [PlayerState(player=player) for player in starting_players(size, player_count)]
         self.current_player_index = 0
         self.current_player_state = self.player_states[self.current_player_index]
         self.current_player = self.current_player_state.player
         self.turn = 1
+        self.history: list[tuple[int, Optional[MoveRecord]]] = []
+        self.stats = EngineStats()
+        for ps in self.player_states:
+            ps.attach(self.board)
         self.reload_state()
 
     def prompt(self, validator: any, message: str, try_again: str) -> str:
@@ -48,48 +66,46 @@ class GameManager:
             op = input(try_again)
         return op
 
-    def movement_turn(self) -> bool:
-        direction_name = self.prompt(
-            validator=lambda op: not self.where_this_goes(op) is None,
-            message="Enter direction: ",
-            try_again="This direction is not valid, enter another: ",
-        )
-        dst_position = self.where_this_goes(direction_name)
-        self.current_player.jump(dst_position)
-        return self.check_win()
-
-    def _validate_wall_position(self, wall_position: str, orientation: WallOrientation) -> bool:
-        if process_position_string(wall_position) is None:
-            return False
-        return WallValidator.validate_wall_placement(
-            self.board,
-            [ps.player for ps in self.player_states],
-            Wall(
-                top_left_cell=self.board._get_cell_at(process_position_string(wall_position)), orientation=orientation
-            ),
-        )
+    def movement_turn(self) -> Optional[Player]:
+        message = "Enter direction: "
+        while True:
+            destination = self.where_this_goes(input(message))
+            if destination is not None and self.submit_move(PawnMove(destination)).ok:
+                return self.check_win()
+            message = "This direction is not valid, enter another: "
 
-    def wall_turn(self) -> None:
+    def wall_turn(self) -> bool:
+        # Returns False when the player backs out, or no wall of the chosen orientation fits
         orientation_name = self.prompt(
             validator=lambda op: op in ("H", "V"), message="H for horizontal, V for vertical: ", try_again="H/V: "
         )
         orientation = WallOrientation.HORIZONTAL if orientation_name == "H" else WallOrientation.VERTICAL
+        if not any(isinstance(move, WallMove) and move.orientation == orientation for move in self.legal_moves()):
+            print(f"Err: no {orientation.value} wall can be placed")
+            return False
 
-        position_name = self.prompt(
-            validator=lambda op: self._validate_wall_position(op, orientation),
-            message="Enter the wall's top-left-cell position - row, col: ",
-            try_again="This position is not valid, enter another: ",
-        )
-        self.board.place_wall(self.board._get_cell_at(process_position_string(position_name)), orientation)
+        message = "Enter the wall's top-left-cell position - row, col (blank to go back): "
+        while True:
+            entry = input(message)
+            if not entry.strip():
+                return False
+            position = process_position_string(entry)
+            if position is not None:
+                result = self.submit_wall(*position, orientation)
+                if result.ok:
+                    return True
+                print(f"Err: {result.error}")
+            message = "This position is not valid, enter another (blank to go back): "
 
     def play(self) -> None:
         winner = None
         while winner is None:
-            self.reload_state()
             self.reload_screen()
 
             op = self.prompt(
-                validator=lambda op: op in ("M", "W"), message="M for movement, W for wall: ", try_again="M/F: "
+                validator=lambda op: op == "M" or (op == "W" and self.current_player.wall_count > 0),
+                message="M for movement, W for wall: ",
+                try_again="M/W: ",
             )
 
             if op == "M":
@@ -97,13 +113,81 @@ class GameManager:
             elif op == "W":
                 self.wall_turn()
 
-            self.next_turn()
+    @property
+    def players(self) -> list[Player]:
+        return [ps.player for ps in self.player_states]
+
+    def legal_moves(self) -> list[Move]:
+        if self.winner() is not None:
+            return []
+        moves: list[Move] = [
+            PawnMove(destination) for destination in self.current_player_state.possible_movements.values()
+        ]
+        if self.current_player.wall_count > 0:
+            moves.extend(
+                WallMove(position, orientation)
+                for position, orientation in WallValidator.legal_wall_slots(self.board, self.players)
+            )
+        return moves
+
+    def submit_move(self, move: Move) -> TurnResult:
+        # Validates and plays a move for the current player - no I/O, the caller reports the result
+        if self.winner() is not None:
+            return TurnResult(move, error="game is over")
+        error = TurnValidator.move_error(self.board, self.players, self.current_player, move)
+        if error is not None:
+            return TurnResult(move, error=error)
+        self.apply(move)
+        return TurnResult(move, winner=self.winner())
+
+    def submit_wall(self, row: int, col: int, orientation: WallOrientation) -> TurnResult:
+        try:
+            orientation = WallOrientation(orientation)
+        except ValueError:
+            return TurnResult(WallMove((row, col), orientation), error=f"unknown wall orientation: {orientation!r}")
+        return self.submit_move(WallMove((row, col), orientation))
+
+    def apply(self, move: Move) -> None:
+        # Plays a move for the current player without validating it, and passes the turn
+        record = self.board.apply(self.current_player, move)
+        self.history.append((self.current_player_index, record))
+        self.next_turn()
+        self._invalidate_movements(move, record)
+
+    def pass_turn(self) -> None:
+        # For a player with no legal move. Nothing changes on the board, so no cache is touched.
+        self.history.append((self.current_player_index, None))
+        self.next_turn()
+
+    @property
+    def position_key(self) -> int:
+        return self.board.position_key(self.current_player_index)
+
+    def undo(self) -> Optional[Move]:
+        if not self.history:
+            return None
+        player_index, record = self.history.pop()
+        if record is None:
+            self.turn -= 1
+            self._set_current_player(player_index)
+            return None
+        self.board.revert(self.player_states[player_index].player, record)
+        self.turn -= 1
+        self._set_current_player(player_index)
+        self._invalidate_movements(record.move, record)
+        return record.move
 
     def check_win(self) -> Optional[Player]:
+        winner = self.winner()
+        if winner is not None:
+            print(f"{winner.name} Won!")
+        return winner
+
+    def winner(self) -> Optional[Player]:
         for ps in self.player_states:
             if ps.player.position in ps.player.destination:
-                print(f"{ps.player.name} Won!")
                 return ps.player
+        return None
 
     def where_this_goes(self, dirstring: str) -> Position:
         str_rep = {d.value: d for d in self.current_player_state.possible_movements.keys()}
@@ -114,81 +198,39 @@ class GameManager:
 
     def next_turn(self) -> None:
         self.turn += 1
-        self.current_player_index = abs(self.current_player_index - 1)
+        self._set_current_player((self.current_player_index + 1) % len(self.player_states))
+
+    def _set_current_player(self, index: int) -> None:
+        self.current_player_index = index
         self.current_player = self.player_states[self.current_player_index].player
         self.current_player_state = self.player_states[self.current_player_index]
 
     def reload_state(self) -> None:
         self.board.set_occupation_state({ps.player for ps in self.player_states})
         for ps in self.player_states:
-            ps.possible_movements = MovementValidator.get_player_valid_moves(self.board, ps.player)
+            ps.invalidate_movements()
+
+    def _invalidate_movements(self, move: Move, record: MoveRecord) -> None:
+        # Pawns and walls are updated in place by board.apply/revert. A pawn's moves only depend on
+        # walls and pawns within MOVEMENT_RADIUS steps, so only players near the change recompute.
+        if isinstance(move, PawnMove):
+            changed = [record.previous_position, move.destination]
+        else:
+            changed = [cell for edge in wall_edges(move.position, move.orientation, self.board.size) for cell in edge]
+        for ps in self.player_states:
+            row, col = ps.player.position
+            if any(
+                abs(row - changed_row) + abs(col - changed_col) <= MOVEMENT_RADIUS
+                for changed_row, changed_col in changed
+            ):
+                ps.invalidate_movements()
 
     def reload_screen(self):
         self.print_game()
 
     def print_game(self):
-        possible_movements = [
-            {pm: ps.player.name.lower() for pm in ps.possible_movements.items()} for ps in self.player_states
-        ]
-
-        for row in range(self.board.size):
-            # Print cells and vertical walls
-            for col in range(self.board.size):
-                cell = self.board._get_cell_at((row, col))
-
-                # Display cell content (e.g., players)
-                if cell.standing_player:
-                    print(f" {cell.standing_player.name[0]} ", end="")  # Player's first letter
-                else:
-                    value = "."
-                    for ps in self.player_states:
-                        if ps.player.position == (row, col):
-                            value = ps.player.name
-
-                    for pm, s in possible_movements[self.current_player_index].items():
-                        # print((row, col) == pm[1])
-                        # exit
-                        if (row, col) == pm[1]:
-                            value = s
-
-                    print(f" {value} ", end="")  # Empty cell
-
-                # Check if there is a vertical wall to the right of the cell
-                if col < self.board.size - 1:  # Ensure we're not at the rightmost edge
-                    vertical_wall_exists = any(
-                        wall.orientation == WallOrientation.VERTICAL
-                        and (
-                            (wall.top_left_cell == self.board._get_cell_at((row, col)))
-                            or (row > 0 and wall.top_left_cell == self.board._get_cell_at((row - 1, col)))
-                        )
-                        for wall in self.board.walls
-                    )
-                    if vertical_wall_exists:
-                        print("|", end="")  # Vertical wall
-                    else:
-                        print(" ", end="")  # No wall
-
-            print()  # Newline after each row of cells
-
-            # Print horizontal walls (if not on the last row)
-            if row < self.board.size - 1:
-                for col in range(self.board.size):
-                    horizontal_wall_exists = any(
-                        wall.orientation == WallOrientation.HORIZONTAL
-                        and (
-                            (wall.top_left_cell == self.board._get_cell_at((row, col)))
-                            or (col > 0 and wall.top_left_cell == self.board._get_cell_at((row, col - 1)))
-                        )
-                        for wall in self.board.walls
-                    )
-                    if horizontal_wall_exists:
-                        print("---", end="")  # Horizontal wall
-                    else:
-                        print("   ", end="")  # No wall
-
-                    # Add spacing between columns
-                    if col < self.board.size - 1:
-                        print(" ", end="")
-
-                print()  # Newline after each row of walls
-        print(f"{self.current_player.name}'s turn")
+        frame = render_frame(
+            self.board, self.players, self.current_player_index, self.current_player_state.possible_movements.values()
+        )
+        sys.stdout.write(frame)
+        sys.stdout.flush()
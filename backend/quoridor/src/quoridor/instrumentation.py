@@ -0,0 +1,222 @@
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+# Opt-in counters and timers for the rules-engine hot paths. enable() swaps instrumented wrappers
+# onto the engine classes and disable() puts the originals back, so a process that never enables
+# instrumentation runs exactly the uninstrumented code.
+#
+# Every measurement lands in the process-wide GLOBAL_STATS and, while a GameManager method is on
+# the stack, in that manager's `stats`. Work done in other processes (a process-pool executor) is
+# not visible here.
+
+
+class EngineStats:
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"counts": dict(self.counts), "seconds": dict(self.seconds)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+            self.seconds.clear()
+
+
+GLOBAL_STATS = EngineStats()
+
+_current_stats: ContextVar[Optional[EngineStats]] = ContextVar("quoridor_current_stats", default=None)
+_local = threading.local()
+_patched: list[tuple[type, str, object]] = []
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def count(name: str, amount: int = 1) -> None:
+    GLOBAL_STATS.count(name, amount)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count(name, amount)
+
+
+def observe(name: str, seconds: float) -> None:
+    GLOBAL_STATS.observe(name, seconds)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.observe(name, seconds)
+
+
+def export_text(stats: EngineStats = GLOBAL_STATS) -> str:
+    # Prometheus text exposition format
+    snapshot = stats.snapshot()
+    lines = []
+    for name, value in sorted(snapshot["counts"].items()):
+        metric = "quoridor_" + name.replace(".", "_")
+        lines.append(f"# TYPE {metric}_total counter")
+        lines.append(f"{metric}_total {value}")
+    for name, value in sorted(snapshot["seconds"].items()):
+        metric = "quoridor_" + name.replace(".", "_")
+        lines.append(f"# TYPE {metric}_seconds_total counter")
+        lines.append(f"{metric}_seconds_total {value:.9f}")
+    return "\n".join(lines) + "\n"
+
+
+# Wrappers
+
+
+def _timed(name: str) -> Callable:
+    def wrap(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return wrap
+
+
+def _counted(name: str) -> Callable:
+    def wrap(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            count(name)
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    return wrap
+
+
+def _expanding(function: Callable) -> Callable:
+    # Every node PathFinder.bfs expands asks for that cell's moves
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        _local.expanded = getattr(_local, "expanded", 0) + 1
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def _bfs(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        expanded = getattr(_local, "expanded", 0)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            observe("path_finder.bfs", time.perf_counter() - start)
+            count("path_finder.bfs.nodes", getattr(_local, "expanded", 0) - expanded)
+
+    return wrapper
+
+
+def _wall_check(reason: str) -> Callable:
+    # validate_wall_placement stops at the first failing check, so the last one run names the reason
+    def wrap(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            _local.wall_check = reason
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    return wrap
+
+
+def _wall_validation(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        valid = function(*args, **kwargs)
+        count("wall_validation.accepted" if valid else f"wall_validation.rejected.{_local.wall_check}")
+        return valid
+
+    return wrapper
+
+
+def _turn_validation(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        error = function(*args, **kwargs)
+        count("turn_validation.accepted" if error is None else "turn_validation.rejected." + error.replace(" ", "_"))
+        return error
+
+    return wrapper
+
+
+def _scoped(function: Callable) -> Callable:
+    # Attributes everything below a GameManager method to that manager's stats
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        token = _current_stats.set(self.stats)
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _current_stats.reset(token)
+
+    return wrapper
+
+
+def _patch(owner: type, name: str, *wraps: Callable) -> None:
+    original = owner.__dict__[name]
+    function = original.__func__ if isinstance(original, (classmethod, staticmethod)) else original
+    for wrap in wraps:
+        function = wrap(function)
+    if isinstance(original, (classmethod, staticmethod)):
+        function = type(original)(function)
+    _patched.append((owner, name, original))
+    setattr(owner, name, function)
+
+
+def enable() -> None:
+    if is_enabled():
+        return
+    from quoridor.game_manager import GameManager
+    from quoridor.utils.movement_validator import MovementValidator
+    from quoridor.utils.path_finder import PathFinder
+    from quoridor.utils.turn_validator import TurnValidator
+    from quoridor.utils.wall_validator import WallValidator
+
+    _patch(PathFinder, "bfs", _bfs)
+    _patch(PathFinder, "distance", _timed("path_finder.distance"))
+    _patch(PathFinder, "indexed_bfs", _timed("path_finder.indexed_bfs"))
+    _patch(MovementValidator, "get_position_valid_moves", _expanding)
+    _patch(MovementValidator, "_is_blocked_by_wall", _counted("movement.is_blocked_by_wall"))
+    _patch(WallValidator, "_is_within_boundaries", _wall_check("out_of_bounds"))
+    _patch(WallValidator, "_overlaps_with_existing_wall", _wall_check("overlap"))
+    _patch(WallValidator, "_players_have_paths", _wall_check("blocks_path"))
+    _patch(WallValidator, "validate_wall_placement", _wall_validation, _timed("wall_validation"))
+    _patch(WallValidator, "legal_wall_slots", _timed("wall_validator.legal_wall_slots"))
+    _patch(TurnValidator, "move_error", _turn_validation, _timed("turn_validation"))
+    _patch(GameManager, "reload_state", _timed("game.reload_state"), _scoped)
+    _patch(GameManager, "apply", _timed("game.apply"), _scoped)
+    _patch(GameManager, "undo", _scoped)
+    _patch(GameManager, "submit_move", _scoped)
+    _patch(GameManager, "legal_moves", _timed("game.legal_moves"), _scoped)
+
+
+def disable() -> None:
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
@@ -0,0 +1,60 @@
+from typing import NamedTuple, Optional, Union
+
+from quoridor.consts import Position, WallOrientation
+from quoridor.player import Player
+
+
+class PawnMove(NamedTuple):
+    destination: Position
+
+
+class WallMove(NamedTuple):
+    position: Position
+    orientation: WallOrientation
+
+
+Move = Union[PawnMove, WallMove]
+
+
+class MoveRecord(NamedTuple):
+    move: Move
+    previous_position: Position
+    previous_wall_count: int
+
+
+class TurnResult(NamedTuple):
+    # Outcome of a submitted move - the move is played only when error is None
+    move: Move
+    error: Optional[str] = None
+    winner: Optional[Player] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MoveMixin:
+    # Reversible moves for any board backend. Moves are applied as-is - validation is the caller's job -
+    # except that a wall the board refuses raises ValueError rather than being half-applied.
+
+    def apply(self, player: Player, move: Move) -> MoveRecord:
+        record = MoveRecord(move, player.position, player.wall_count)
+        if isinstance(move, PawnMove):
+            self.move_player(player, move.destination)
+        else:
+            if not self.place_wall_at(move.position, move.orientation):
+                raise ValueError(f"Wall {move.orientation.value} at {move.position} overlaps an existing wall")
+            self._toggle_wall_count_key(player)
+            player.wall_count -= 1
+            self._toggle_wall_count_key(player)
+        return record
+
+    def revert(self, player: Player, record: MoveRecord) -> None:
+        move = record.move
+        if isinstance(move, PawnMove):
+            self.move_player(player, record.previous_position)
+        else:
+            self.remove_wall_at(move.position, move.orientation)
+            self._toggle_wall_count_key(player)
+            player.wall_count = record.previous_wall_count
+            self._toggle_wall_count_key(player)
@@ -0,0 +1,138 @@
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+from quoridor.bitboard import AnyBoard
+from quoridor.codec import decode_position, encode_position
+from quoridor.consts import SIZE, BoardBackend
+from quoridor.game_manager import GameManager
+from quoridor.move import Move, PawnMove, WallMove
+from quoridor.player import Player
+from quoridor.self_play import encode_move
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+
+# Counts every legal move sequence of a given length - pawn moves from MovementValidator and walls
+# from WallValidator, with no moves once someone has won (as GameManager.legal_moves). Two move
+# generators that agree on every count to some depth agree on every position in that tree, which
+# makes perft a cheap oracle when checking a new board backend or validator.
+
+
+class PerftResult(NamedTuple):
+    nodes: int
+    divide: dict[Move, int]
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+def legal_moves(board: AnyBoard, players: list[Player], side: int) -> list[Move]:
+    if any(player.has_reached_destination() for player in players):
+        return []
+    player = players[side]
+    moves: list[Move] = [
+        PawnMove(destination) for destination in MovementValidator.get_player_valid_moves(board, player).values()
+    ]
+    if player.wall_count > 0:
+        moves.extend(
+            WallMove(position, orientation) for position, orientation in WallValidator.legal_wall_slots(board, players)
+        )
+    return moves
+
+
+def perft(board: AnyBoard, players: list[Player], side: int, depth: int) -> int:
+    if depth == 0:
+        return 1
+    moves = legal_moves(board, players, side)
+    # Leaves are counted, not played
+    if depth == 1:
+        return len(moves)
+    player = players[side]
+    next_side = (side + 1) % len(players)
+    nodes = 0
+    for move in moves:
+        record = board.apply(player, move)
+        nodes += perft(board, players, next_side, depth - 1)
+        board.revert(player, record)
+    return nodes
+
+
+def divide(board: AnyBoard, players: list[Player], side: int, depth: int) -> PerftResult:
+    # Counts per first move, so two generators that disagree can be bisected move by move
+    if depth == 0:
+        return PerftResult(1, {}, 0.0)
+    start = time.perf_counter()
+    player = players[side]
+    next_side = (side + 1) % len(players)
+    counts = {}
+    for move in legal_moves(board, players, side):
+        record = board.apply(player, move)
+        counts[move] = perft(board, players, next_side, depth - 1)
+        board.revert(player, record)
+    return PerftResult(sum(counts.values()), counts, time.perf_counter() - start)
+
+
+def _perft_after(position: bytes, move: Move, depth: int) -> int:
+    board, players, side = decode_position(position)
+    board.apply(players[side], move)
+    return perft(board, players, (side + 1) % len(players), depth - 1)
+
+
+def parallel_divide(
+    board: AnyBoard, players: list[Player], side: int, depth: int, workers: Optional[int] = None
+) -> PerftResult:
+    # Root moves are shared out between processes. Workers rebuild the position as a BitBoard.
+    if depth <= 1:
+        return divide(board, players, side, depth)
+    start = time.perf_counter()
+    position = encode_position(board, players, side)
+    moves = legal_moves(board, players, side)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(_perft_after, [position] * len(moves), moves, [depth] * len(moves))
+        counts = dict(zip(moves, counts))
+    return PerftResult(sum(counts.values()), counts, time.perf_counter() - start)
+
+
+def format_move(move: Move) -> str:
+    kind, row, col = encode_move(move)
+    return f"{kind} {row},{col}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Count legal move sequences from a position")
+    parser.add_argument("depth", type=int)
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--position", help="hex-encoded position from quoridor.codec, instead of the opening")
+    parser.add_argument(
+        "--backend",
+        choices=[b.value for b in BoardBackend],
+        default=BoardBackend.BITBOARD.value,
+        help="board for the opening position - decoded positions and workers always use a BitBoard",
+    )
+    parser.add_argument("--divide", action="store_true", help="print the count after each first move")
+    parser.add_argument("--workers", type=int, default=0, help="split root moves over this many processes")
+    args = parser.parse_args()
+
+    if args.position:
+        board, players, side = decode_position(bytes.fromhex(args.position))
+    else:
+        game = GameManager(size=args.size, backend=BoardBackend(args.backend), player_count=args.players)
+        board, players, side = game.board, game.players, game.current_player_index
+
+    if args.workers:
+        result = parallel_divide(board, players, side, args.depth, args.workers)
+    else:
+        result = divide(board, players, side, args.depth)
+
+    if args.divide:
+        for move, count in sorted(result.divide.items(), key=lambda item: encode_move(item[0])):
+            print(f"{format_move(move)}: {count}")
+    print(f"nodes {result.nodes}  time {result.elapsed:.3f}s  {result.nodes_per_second:,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    main()
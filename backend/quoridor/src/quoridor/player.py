@@ -1,16 +1,14 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 
 from quoridor.consts import MOVEMENT_VECTORS, Direction, Position
 
 
-class Player(BaseModel):
+@dataclass(slots=True)
+class Player:
     name: str
     position: Position
-    destination: set[Position] = Field(default={})
-    wall_count: int = Field(default=10)
-
-    class Config:
-        arbitrary_types_allowed = True
+    destination: set[Position] = field(default_factory=set)
+    wall_count: int = 10
 
     def has_reached_destination(self) -> bool:
         return self.position in self.destination
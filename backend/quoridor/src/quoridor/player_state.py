@@ -1,8 +1,31 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Optional
+
+from quoridor.bitboard import AnyBoard
 from quoridor.consts import Direction, Position
 from quoridor.player import Player
+from quoridor.utils.movement_validator import MovementValidator
 
 
-class PlayerState(BaseModel):
+@dataclass(slots=True)
+class PlayerState:
     player: Player
-    possible_movements: dict[Direction, Position] = Field(default={})
+
+    # Pawn moves are computed on first access and kept until invalidate_movements
+    _board: Optional[AnyBoard] = field(default=None, init=False, repr=False, compare=False)
+    _possible_movements: Optional[dict[Direction, Position]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def attach(self, board: AnyBoard) -> None:
+        self._board = board
+        self._possible_movements = None
+
+    def invalidate_movements(self) -> None:
+        self._possible_movements = None
+
+    @property
+    def possible_movements(self) -> dict[Direction, Position]:
+        if self._possible_movements is None:
+            self._possible_movements = MovementValidator.get_player_valid_moves(self._board, self.player)
+        return self._possible_movements
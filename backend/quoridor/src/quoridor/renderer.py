@@ -0,0 +1,90 @@
+import sys
+from typing import Iterable, Optional, TextIO
+
+from quoridor.bitboard import AnyBoard
+from quoridor.consts import Position
+from quoridor.player import Player
+
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_BELOW = "\x1b[J"
+# Unchanged runs shorter than a cursor move are cheaper to rewrite than to skip
+MERGE_GAP = 8
+
+
+def render_frame(board: AnyBoard, players: list[Player], current: int, moves: Iterable[Position]) -> str:
+    # The whole board as one string - pawns by initial, the current player's moves by their lowercased
+    # name, `|` and `---` for blocked edges
+    size = board.size
+    pawns = {player.position: player.name[0] for player in players}
+    marker = players[current].name.lower()
+    targets = set(moves)
+
+    lines = []
+    for row in range(size):
+        cells = []
+        for col in range(size):
+            index = row * size + col
+            value = pawns.get((row, col)) or (marker if (row, col) in targets else ".")
+            cells.append(f" {value} ")
+            if col < size - 1:
+                cells.append("|" if board.is_index_edge_blocked(index, index + 1) else " ")
+        lines.append("".join(cells))
+
+        if row < size - 1:
+            lines.append(
+                " ".join(
+                    "---" if board.is_index_edge_blocked(row * size + col, (row + 1) * size + col) else "   "
+                    for col in range(size)
+                )
+            )
+    lines.append(f"{players[current].name}'s turn")
+    return "\n".join(lines) + "\n"
+
+
+class TerminalRenderer:
+    # Writes each frame with a single write. With `ansi`, the first frame clears the screen and every
+    # later one only rewrites the characters that changed, addressed by cursor moves - a pawn step
+    # costs a few dozen bytes instead of the whole board.
+
+    def __init__(self, stream: Optional[TextIO] = None, ansi: bool = False) -> None:
+        self.stream = stream or sys.stdout
+        self.ansi = ansi
+        self._previous: Optional[list[str]] = None
+
+    def draw(self, frame: str) -> None:
+        self.stream.write(self._diff(frame.split("\n")[:-1]) if self.ansi else frame)
+        self.stream.flush()
+
+    def reset(self) -> None:
+        # The next ANSI frame is drawn in full, e.g. after something else wrote to the terminal
+        self._previous = None
+
+    def _diff(self, lines: list[str]) -> str:
+        previous, self._previous = self._previous, lines
+        if previous is None:
+            return CURSOR_HOME + CLEAR_SCREEN + "\n".join(lines) + "\n"
+
+        parts = []
+        for row, line in enumerate(lines):
+            old = previous[row] if row < len(previous) else ""
+            if line == old:
+                continue
+            width = max(len(line), len(old))
+            line, old = line.ljust(width), old.ljust(width)
+            col = 0
+            while col < width:
+                if line[col] == old[col]:
+                    col += 1
+                    continue
+                start = end = col
+                while col < width and col - end <= MERGE_GAP:
+                    if line[col] != old[col]:
+                        end = col + 1
+                    col += 1
+                parts.append(f"\x1b[{row + 1};{start + 1}H{line[start:end]}")
+        if len(lines) < len(previous):
+            parts.append(f"\x1b[{len(lines) + 1};1H{CLEAR_BELOW}")
+        # Leave the cursor below the frame
+        parts.append(f"\x1b[{len(lines) + 1};1H")
+        return "".join(parts)
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from quoridor.consts import Position, WallOrientation
+from quoridor.move import Move, PawnMove, WallMove
+from quoridor.player import Player
+from quoridor.wall import Wall
+
+# Wire formats for the API boundary. The engine's own types are plain slotted classes - these models
+# validate what comes in from clients and shape what goes out, and are only imported by the server.
+
+
+class SquareSchema(BaseModel):
+    row: int
+    col: int
+
+    @classmethod
+    def from_position(cls, position: Position) -> "SquareSchema":
+        return cls(row=position[0], col=position[1])
+
+
+class PlayerSchema(BaseModel):
+    name: str
+    row: int
+    col: int
+    wall_count: int
+
+    @classmethod
+    def from_player(cls, player: Player) -> "PlayerSchema":
+        return cls(name=player.name, row=player.position[0], col=player.position[1], wall_count=player.wall_count)
+
+
+class WallSchema(BaseModel):
+    row: int
+    col: int
+    orientation: WallOrientation
+
+    @classmethod
+    def from_wall(cls, wall: Wall) -> "WallSchema":
+        row, col = wall.top_left_cell.position
+        return cls(row=row, col=col, orientation=wall.orientation)
+
+
+class MoveSchema(BaseModel):
+    type: str
+    row: int
+    col: int
+    orientation: Optional[WallOrientation] = None
+
+    def to_move(self) -> Move:
+        if self.type == "move":
+            return PawnMove((self.row, self.col))
+        if self.type == "wall":
+            if self.orientation is None:
+                raise ValueError("malformed move: a wall needs an orientation")
+            return WallMove((self.row, self.col), self.orientation)
+        raise ValueError(f"unknown move type: {self.type}")
+
+
+class GameStateSchema(BaseModel):
+    type: str = "state"
+    id: str
+    size: int
+    turn: int
+    current_player: int
+    winner: Optional[str]
+    players: list[PlayerSchema]
+    walls: list[WallSchema]
+    moves: list[SquareSchema]
@@ -0,0 +1,141 @@
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, Optional
+
+from quoridor.consts import SIZE, BoardBackend, WallOrientation
+from quoridor.engine.policies import POLICIES
+from quoridor.game_manager import GameManager
+from quoridor.move import Move, PawnMove, WallMove
+from quoridor.renderer import TerminalRenderer, render_frame
+
+MAX_TURNS = 300
+
+WALL_CODES = {WallOrientation.HORIZONTAL: "H", WallOrientation.VERTICAL: "V"}
+
+
+def encode_move(move: Optional[Move]) -> Optional[list]:
+    # A pass is written as null
+    if move is None:
+        return None
+    if isinstance(move, PawnMove):
+        return ["P", *move.destination]
+    return [WALL_CODES[move.orientation], *move.position]
+
+
+def decode_move(code: Optional[list]) -> Optional[Move]:
+    if code is None:
+        return None
+    kind, row, col = code
+    if kind == "P":
+        return PawnMove((row, col))
+    orientation = WallOrientation.HORIZONTAL if kind == "H" else WallOrientation.VERTICAL
+    return WallMove((row, col), orientation)
+
+
+def play_game(
+    seed: int,
+    policy_names: list[str],
+    size: int = SIZE,
+    max_turns: int = MAX_TURNS,
+    backend: BoardBackend = BoardBackend.BITBOARD,
+    on_move: Optional[Callable[[GameManager], None]] = None,
+) -> dict:
+    rng = random.Random(seed)
+    policies = [POLICIES[name]() for name in policy_names]
+    game = GameManager(size=size, backend=backend, player_count=len(policy_names))
+
+    moves = []
+    winner = None
+    passes = 0
+    if on_move is not None:
+        on_move(game)
+    # A player with no legal move passes. Once every player has passed in a row nothing can change, and
+    # the game ends without a winner.
+    while winner is None and len(moves) < max_turns and passes < len(policies):
+        move = policies[game.current_player_index].choose(game, rng)
+        if move is None:
+            game.pass_turn()
+            passes += 1
+        else:
+            game.apply(move)
+            passes = 0
+        moves.append(encode_move(move))
+        winner = game.winner()
+        if on_move is not None:
+            on_move(game)
+
+    return {
+        "seed": seed,
+        "size": size,
+        "policies": policy_names,
+        "winner": None if winner is None else winner.name,
+        "turns": len(moves),
+        "moves": moves,
+    }
+
+
+def run_self_play(
+    games: int,
+    policy_names: list[str],
+    seed: int = 0,
+    workers: Optional[int] = None,
+    size: int = SIZE,
+    max_turns: int = MAX_TURNS,
+) -> Iterator[dict]:
+    # Yields games as they finish, in completion order - each record carries its seed for replay
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_game, seed + index, policy_names, size, max_turns) for index in range(games)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def watch(seed: int, policy_names: list[str], size: int, max_turns: int, delay: float) -> None:
+    # Plays one game in this process, redrawing only what changed after every move
+    renderer = TerminalRenderer(ansi=True)
+
+    def draw(game: GameManager) -> None:
+        state = game.current_player_state
+        renderer.draw(
+            render_frame(game.board, game.players, game.current_player_index, state.possible_movements.values())
+        )
+        time.sleep(delay)
+
+    record = play_game(seed, policy_names, size, max_turns, on_move=draw)
+    print(f"{record['winner'] or 'Nobody'} won after {record['turns']} turns")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play headless games in parallel and stream them as JSON lines")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument(
+        "--policies", nargs="+", choices=sorted(POLICIES), default=["greedy", "random"], help="one per player"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    parser.add_argument("--output", default="-", help="JSON lines file, or - for stdout")
+    parser.add_argument("--watch", action="store_true", help="play a single game here and draw it in the terminal")
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds between frames with --watch")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(args.seed, args.policies, args.size, args.max_turns, args.delay)
+        return
+
+    output = sys.stdout if args.output == "-" else open(args.output, "a")
+    try:
+        for record in run_self_play(args.games, args.policies, args.seed, args.workers, args.size, args.max_turns):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from quoridor.bitboard import AnyBoard
+from quoridor.codec import PLAYER_ENTRY, POSITION_HEADER, PositionView, bitmap_bytes
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import starting_players
+from quoridor.player import Player
+
+# Distance-to-goal for many positions at once. numpy is an optional dependency, so this module is
+# not imported by the package - `pip install quoridor_game[numpy]` to use it.
+#
+# Distances are wall-only, like every other distance in the engine: pawns never block a path.
+# That matches PathFinder.bfs on a board with walls but no pawns placed.
+
+UNREACHABLE = -1
+DEFAULT_CHUNK_SIZE = 1 << 14
+
+
+class PositionBatch(NamedTuple):
+    size: int
+    pawns: np.ndarray  # (N, players) flat squares `row * size + col`
+    horizontal_walls: np.ndarray  # (N, size, size) bool, set at each wall's top-left cell
+    vertical_walls: np.ndarray
+
+
+def _mask_bits(masks: np.ndarray, size: int) -> np.ndarray:
+    # (N, bitmap bytes) little-endian wall bitmaps -> (N, size, size) bool
+    bits = np.unpackbits(masks, axis=1, bitorder="little")[:, : size * size]
+    return bits.reshape(-1, size, size).astype(bool)
+
+
+def _squares(entries: np.ndarray) -> np.ndarray:
+    # (N, players * PLAYER_ENTRY.size) bytes -> (N, players) little-endian u16 squares
+    low = entries[:, 0 :: PLAYER_ENTRY.size].astype(np.intp)
+    return low | entries[:, 1 :: PLAYER_ENTRY.size].astype(np.intp) << 8
+
+
+def batch_from_boards(boards: Sequence[AnyBoard], players: Sequence[Sequence[Player]]) -> PositionBatch:
+    size = boards[0].size
+    length = bitmap_bytes(size)
+    pawns = np.array([[board.index(player.position) for player in group] for board, group in zip(boards, players)])
+    walls = {
+        orientation: np.frombuffer(
+            b"".join(board.wall_mask(orientation).to_bytes(length, "little") for board in boards), dtype=np.uint8
+        ).reshape(len(boards), length)
+        for orientation in WallOrientation
+    }
+    return PositionBatch(
+        size,
+        pawns.reshape(len(boards), -1),
+        _mask_bits(walls[WallOrientation.HORIZONTAL], size),
+        _mask_bits(walls[WallOrientation.VERTICAL], size),
+    )
+
+
+def batch_from_encoded(buffer, count: Optional[int] = None) -> PositionBatch:
+    # Codec positions written back to back, all with the same size and player count. The buffer
+    # is viewed in place, not copied.
+    first = PositionView(buffer)
+    size, player_count, record = first.size, first.player_count, first.nbytes
+    count = len(buffer) // record if count is None else count
+    rows = np.frombuffer(buffer, dtype=np.uint8, count=count * record).reshape(count, record)
+    players_end = POSITION_HEADER.size + player_count * PLAYER_ENTRY.size
+    length = bitmap_bytes(size)
+    return PositionBatch(
+        size,
+        _squares(rows[:, POSITION_HEADER.size : players_end]),
+        _mask_bits(rows[:, players_end : players_end + length], size),
+        _mask_bits(rows[:, players_end + length : players_end + 2 * length], size),
+    )
+
+
+def edge_masks(horizontal_walls: np.ndarray, vertical_walls: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # A horizontal wall blocks the moves down from its cell and the cell to its right, a vertical
+    # wall the moves right from its cell and the cell below - the same edges as wall_edges
+    blocked_down = horizontal_walls.copy()
+    blocked_down[:, :, 1:] |= horizontal_walls[:, :, :-1]
+    blocked_down[:, -1, :] = False
+    blocked_right = vertical_walls.copy()
+    blocked_right[:, 1:, :] |= vertical_walls[:, :-1, :]
+    blocked_right[:, :, -1] = False
+    return blocked_down, blocked_right
+
+
+def goal_masks(size: int, player_count: int) -> np.ndarray:
+    goals = np.zeros((player_count, size, size), dtype=bool)
+    for index, player in enumerate(starting_players(size, player_count)):
+        for row, col in player.destination:
+            goals[index, row, col] = True
+    return goals
+
+
+def batch_distances(
+    batch: PositionBatch, goals: Optional[np.ndarray] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+    # (N, players) shortest distance of every pawn to its goal, UNREACHABLE where walled off
+    count, player_count = batch.pawns.shape
+    if goals is None:
+        goals = goal_masks(batch.size, player_count)
+    goal_rows = _row_bits(goals)
+    distances = np.empty((count, player_count), dtype=np.int32)
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        blocked_down, blocked_right = edge_masks(batch.horizontal_walls[start:stop], batch.vertical_walls[start:stop])
+        distances[start:stop] = _propagate(
+            _row_bits(~blocked_down), _row_bits(~blocked_right), goal_rows, batch.pawns[start:stop], batch.size
+        )
+    return distances
+
+
+def _row_bits(cells: np.ndarray) -> np.ndarray:
+    # (..., size, size) bool -> (..., size) masks with bit `col` of each row
+    size = cells.shape[-1]
+    dtype = np.uint16 if size <= 16 else np.uint32 if size <= 32 else np.uint64
+    weights = (np.ones(size, dtype=dtype) << np.arange(size, dtype=dtype)).astype(dtype)
+    return (cells * weights).sum(axis=-1, dtype=dtype)
+
+
+def _propagate(
+    open_down: np.ndarray, open_right: np.ndarray, goals: np.ndarray, pawns: np.ndarray, size: int
+) -> np.ndarray:
+    # Breadth-first frontier expansion outward from every goal row, for all positions and players
+    # at once. Each board row is one integer mask, so a step is a handful of shifts and ANDs over
+    # (N, players, size). Stops once every pawn is reached or no frontier can grow.
+    count, player_count = pawns.shape
+    open_down, open_right = open_down[:, None], open_right[:, None]
+    frontier = np.broadcast_to(goals, (count, *goals.shape)).copy()
+    reached = frontier.copy()
+    full = frontier.dtype.type((1 << size) - 1)
+
+    pawn_rows, pawn_cols = np.divmod(pawns, size)
+    pawn_bits = (np.ones_like(pawn_cols, dtype=frontier.dtype) << pawn_cols.astype(frontier.dtype)).astype(
+        frontier.dtype
+    )
+    index = np.arange(count)[:, None], np.arange(player_count)[None, :], pawn_rows
+
+    distances = np.where(reached[index] & pawn_bits, 0, UNREACHABLE).astype(np.int32)
+    pending = distances == UNREACHABLE
+
+    step = 0
+    while pending.any():
+        step += 1
+        grown = (frontier >> 1) & open_right
+        grown |= ((frontier & open_right) << 1) & full
+        grown[..., :-1] |= frontier[..., 1:] & open_down[..., :-1]
+        grown[..., 1:] |= frontier[..., :-1] & open_down[..., :-1]
+        grown &= ~reached
+        if not grown.any():
+            break
+        reached |= grown
+        frontier = grown
+
+        arrived = pending & (reached[index] & pawn_bits).astype(bool)
+        distances[arrived] = step
+        pending &= ~arrived
+    return distances
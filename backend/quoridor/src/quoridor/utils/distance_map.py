@@ -0,0 +1,101 @@
+from collections import deque
+from typing import Iterable, Optional
+
+from quoridor.consts import Position
+from quoridor.utils.grid import neighbor_table
+
+UNREACHABLE = -1
+
+Edge = tuple[Position, Position]
+
+
+def blocked_edge_keys(board, edges: Iterable[Edge]) -> set[int]:
+    # Both directions of every edge, encoded as `source * cells + destination`
+    cells = board.size * board.size
+    keys = set()
+    for a, b in edges:
+        a, b = board.index(a), board.index(b)
+        keys.add(a * cells + b)
+        keys.add(b * cells + a)
+    return keys
+
+
+class DistanceMap:
+    # Wall-only distance from every cell to the closest destination cell, indexed by `row * size + col`.
+    # Pawns never block a path, so only walls are taken into account.
+
+    def __init__(self, size: int, distances: list[int]) -> None:
+        self.size = size
+        self.distances = distances
+
+    @classmethod
+    def compute(cls, board, destination_set: Iterable[Position], extra_blocked: Iterable[Edge] = ()) -> "DistanceMap":
+        size = board.size
+        neighbors = neighbor_table(size)
+        blocked = blocked_edge_keys(board, extra_blocked)
+        distances = [UNREACHABLE] * (size * size)
+        queue = deque()
+        for position in destination_set:
+            index = board.index(position)
+            distances[index] = 0
+            queue.append(index)
+
+        # Multi-source BFS outwards from the destination cells
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            for neighbor in neighbors[current]:
+                if (
+                    distances[neighbor] == UNREACHABLE
+                    and not board.is_index_edge_blocked(current, neighbor)
+                    and (not blocked or current * size * size + neighbor not in blocked)
+                ):
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+        return cls(size, distances)
+
+    def distance(self, position: Position) -> Optional[int]:
+        distance = self.distances[position[0] * self.size + position[1]]
+        return None if distance == UNREACHABLE else distance
+
+    def is_cut_by(self, edges: Iterable[Edge]) -> bool:
+        # Blocking an edge changes the map only if the edge lies on a shortest path (the distance DAG)
+        for a, b in edges:
+            distance_a, distance_b = self.distance(a), self.distance(b)
+            if distance_a is not None and distance_b is not None and abs(distance_a - distance_b) == 1:
+                return True
+        return False
+
+    def is_shortened_by(self, edges: Iterable[Edge]) -> bool:
+        # Opening an edge changes the map only if it joins cells more than one step apart
+        for a, b in edges:
+            distance_a, distance_b = self.distance(a), self.distance(b)
+            if distance_a is None and distance_b is None:
+                continue
+            if distance_a is None or distance_b is None or abs(distance_a - distance_b) > 1:
+                return True
+        return False
+
+
+class DistanceMapCache:
+    # Per-board cache of distance maps keyed by destination set. A map is dropped only when a wall
+    # change actually touches its shortest-path DAG, so most wall placements keep every entry.
+
+    def __init__(self) -> None:
+        self._maps: dict[frozenset[Position], DistanceMap] = {}
+
+    def get(self, board, destination_set: Iterable[Position]) -> DistanceMap:
+        key = frozenset(destination_set)
+        distance_map = self._maps.get(key)
+        if distance_map is None:
+            distance_map = self._maps[key] = DistanceMap.compute(board, key)
+        return distance_map
+
+    def on_edges_blocked(self, edges: list[Edge]) -> None:
+        self._maps = {key: dm for key, dm in self._maps.items() if not dm.is_cut_by(edges)}
+
+    def on_edges_opened(self, edges: list[Edge]) -> None:
+        self._maps = {key: dm for key, dm in self._maps.items() if not dm.is_shortened_by(edges)}
+
+    def clear(self) -> None:
+        self._maps.clear()
@@ -0,0 +1,166 @@
+import random
+from collections import defaultdict
+from typing import Iterable, Iterator
+
+from quoridor.consts import Position
+from quoridor.utils.distance_map import Edge
+from quoridor.utils.grid import neighbor_table
+
+NOT_VISITED = -1
+LABEL_SEED = 0x51D0
+
+
+class GraphAnalysis:
+    # Cut structure of the wall-only cell graph towards one destination set.
+    #
+    # All destination cells hang off a virtual root node, and a DFS from that root labels every
+    # non-tree edge with a random 64-bit value. A tree edge is labelled with the XOR of the non-tree
+    # edges spanning it. Bridges are exactly the tree edges labelled 0, and two non-bridge edges form a
+    # cut exactly when their labels are equal, so "does removing these edges disconnect X" is O(1).
+
+    def __init__(self, board, destination_set: Iterable[Position]) -> None:
+        self.size = size = board.size
+        cells = size * size
+        self.root = root = cells
+        neighbors = neighbor_table(size)
+
+        adjacency: list[list[int]] = [[] for _ in range(cells + 1)]
+        for index in range(cells):
+            for neighbor in neighbors[index]:
+                if not board.is_index_edge_blocked(index, neighbor):
+                    adjacency[index].append(neighbor)
+        for position in destination_set:
+            index = board.index(position)
+            adjacency[index].append(root)
+            adjacency[root].append(index)
+
+        self.parent = [NOT_VISITED] * (cells + 1)
+        self.entry = [NOT_VISITED] * (cells + 1)
+        self.exit = [NOT_VISITED] * (cells + 1)
+        order = self._depth_first(adjacency)
+
+        # Random labels for non-tree edges, folded into their endpoints
+        rng = random.Random(LABEL_SEED)
+        self.non_tree_labels: dict[tuple[int, int], int] = {}
+        node_xor = [0] * (cells + 1)
+        for node in order:
+            for neighbor in adjacency[node]:
+                if node < neighbor and self.parent[neighbor] != node and self.parent[node] != neighbor:
+                    label = rng.getrandbits(64)
+                    self.non_tree_labels[(node, neighbor)] = label
+                    node_xor[node] ^= label
+                    node_xor[neighbor] ^= label
+
+        # Tree edge label (stored on the child) = XOR of node values over the child's subtree
+        self.tree_labels = node_xor
+        for node in reversed(order):
+            if node != root:
+                self.tree_labels[self.parent[node]] ^= self.tree_labels[node]
+
+    def _depth_first(self, adjacency: list[list[int]]) -> list[int]:
+        order = [self.root]
+        clock = 0
+        self.entry[self.root] = clock
+        stack = [(self.root, iter(adjacency[self.root]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if self.entry[child] == NOT_VISITED:
+                    clock += 1
+                    self.parent[child] = node
+                    self.entry[child] = clock
+                    order.append(child)
+                    stack.append((child, iter(adjacency[child])))
+                    break
+            else:
+                self.exit[node] = clock
+                stack.pop()
+        return order
+
+    def _in_subtree(self, node: int, subtree_root: int) -> bool:
+        return self.entry[subtree_root] <= self.entry[node] <= self.exit[subtree_root]
+
+    def _classify(self, a: int, b: int) -> tuple[int, int]:
+        # (label, child) for a tree edge, (label, NOT_VISITED) for a non-tree edge, (0, NOT_VISITED) if absent
+        if self.parent[b] == a:
+            return self.tree_labels[b], b
+        if self.parent[a] == b:
+            return self.tree_labels[a], a
+        return self.non_tree_labels.get((min(a, b), max(a, b)), 0), NOT_VISITED
+
+    def is_reachable(self, position: Position) -> bool:
+        return self.entry[position[0] * self.size + position[1]] != NOT_VISITED
+
+    def disconnects(self, position: Position, edges: Iterable[Edge]) -> bool:
+        node = position[0] * self.size + position[1]
+        if self.entry[node] == NOT_VISITED:
+            return True
+
+        removed = []
+        for a, b in {tuple(sorted((a[0] * self.size + a[1], b[0] * self.size + b[1]))) for a, b in edges}:
+            label, child = self._classify(a, b)
+            if child != NOT_VISITED and label == 0:
+                # Bridge - cuts off the child's subtree
+                if self._in_subtree(node, child):
+                    return True
+            elif label:
+                removed.append((label, child))
+
+        for i, (label, child) in enumerate(removed):
+            for other_label, other_child in removed[i + 1 :]:
+                if label != other_label:
+                    continue
+                if child == NOT_VISITED and other_child == NOT_VISITED:
+                    # Two non-tree edges never cut the spanning tree - equal labels here are a 64-bit
+                    # collision, and there is no subtree to test
+                    continue
+                if child == NOT_VISITED or other_child == NOT_VISITED:
+                    # A tree edge and the only non-tree edge spanning it - cuts off the tree edge's subtree
+                    tree_child = other_child if child == NOT_VISITED else child
+                    if self._in_subtree(node, tree_child):
+                        return True
+                else:
+                    # Two tree edges on one root path - cuts off the band between them
+                    upper, lower = (
+                        (child, other_child) if self._in_subtree(other_child, child) else (other_child, child)
+                    )
+                    if self._in_subtree(node, upper) and not self._in_subtree(node, lower):
+                        return True
+        return False
+
+    def bridges(self) -> list[Edge]:
+        return [
+            (divmod(self.parent[node], self.size), divmod(node, self.size))
+            for node in range(self.root)
+            if self.parent[node] not in (NOT_VISITED, self.root) and self.tree_labels[node] == 0
+        ]
+
+    def two_edge_cuts(self) -> Iterator[tuple[Edge, Edge]]:
+        groups: dict[int, list[Edge]] = defaultdict(list)
+        for node in range(self.root):
+            if self.parent[node] not in (NOT_VISITED, self.root) and self.tree_labels[node]:
+                groups[self.tree_labels[node]].append((divmod(self.parent[node], self.size), divmod(node, self.size)))
+        for (a, b), label in self.non_tree_labels.items():
+            if b != self.root:
+                groups[label].append((divmod(a, self.size), divmod(b, self.size)))
+        for group in groups.values():
+            for i, edge in enumerate(group):
+                for other in group[i + 1 :]:
+                    yield edge, other
+
+
+class GraphAnalysisCache:
+    # Analyses are only valid for one wall layout, so any wall change clears the cache
+
+    def __init__(self) -> None:
+        self._analyses: dict[frozenset[Position], GraphAnalysis] = {}
+
+    def get(self, board, destination_set: Iterable[Position]) -> GraphAnalysis:
+        key = frozenset(destination_set)
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = self._analyses[key] = GraphAnalysis(board, key)
+        return analysis
+
+    def clear(self) -> None:
+        self._analyses.clear()
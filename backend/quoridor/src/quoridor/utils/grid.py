@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(size: int) -> tuple[tuple[int, ...], ...]:
+    # Orthogonal neighbors of every cell, indexed by `row * size + col`
+    table = []
+    for index in range(size * size):
+        row, col = divmod(index, size)
+        neighbors = []
+        if row > 0:
+            neighbors.append(index - size)
+        if row < size - 1:
+            neighbors.append(index + size)
+        if col > 0:
+            neighbors.append(index - 1)
+        if col < size - 1:
+            neighbors.append(index + 1)
+        table.append(tuple(neighbors))
+    return tuple(table)
@@ -1,24 +1,22 @@
-from quoridor.board import Board
+from quoridor.bitboard import AnyBoard
 from quoridor.consts import (
     COLUMN_INDEX,
     MOVEMENT_VECTORS,
     ROW_INDEX,
     Direction,
     Position,
-    WallOrientation,
 )
 from quoridor.player import Player
-from quoridor.wall import Wall
 
 
 class MovementValidator:
 
     @classmethod
-    def get_player_valid_moves(cls, board: Board, player: Player) -> dict[Direction, Position]:
+    def get_player_valid_moves(cls, board: AnyBoard, player: Player) -> dict[Direction, Position]:
         return cls.get_position_valid_moves(board, player.position)
 
     @classmethod
-    def get_position_valid_moves(cls, board: Board, position: Position) -> dict[Direction, Position]:
+    def get_position_valid_moves(cls, board: AnyBoard, position: Position) -> dict[Direction, Position]:
         valid_moves = {}
         for direction, (row_change, col_change) in MOVEMENT_VECTORS.items():
             new_position = (position[ROW_INDEX] + row_change, position[COLUMN_INDEX] + col_change)
@@ -28,7 +26,7 @@ class MovementValidator:
                 continue
 
             # Occupied cell
-            if board._get_cell_at(new_position).is_occupied:
+            if board.is_occupied(new_position):
                 after_skip_position = (new_position[ROW_INDEX] + row_change, new_position[COLUMN_INDEX] + col_change)
 
                 # Skippable
@@ -55,12 +53,12 @@ class MovementValidator:
         return valid_moves
 
     @classmethod
-    def _is_valid_move(cls, board: Board, source: Position, destination: Position, can_skip: bool = False) -> bool:
+    def _is_valid_move(cls, board: AnyBoard, source: Position, destination: Position, can_skip: bool = False) -> bool:
         # Illegal move
         if not cls._basic_validation(board, source, destination):
             return False
         # Occupied
-        if not can_skip and board._get_cell_at(destination).is_occupied:
+        if not can_skip and board.is_occupied(destination):
             return False
         # Blocked by wall
         if cls._is_blocked_by_wall(board, source, destination):
@@ -68,7 +66,7 @@ class MovementValidator:
         return True
 
     @staticmethod
-    def _basic_validation(board: Board, source: Position, destination: Position) -> bool:
+    def _basic_validation(board: AnyBoard, source: Position, destination: Position) -> bool:
         source_row, source_col = source
         destination_row, destination_col = destination
         # Illegal move
@@ -80,75 +78,5 @@ class MovementValidator:
         return True
 
     @staticmethod
-    def _is_blocked_by_wall(board: Board, source: Position, destination: Position) -> bool:
-        source_row, source_col = source
-        destination_row, destination_col = destination
-        wall_to_check = None
-
-        if source_row == destination_row and abs(source_col - destination_col) == 1:
-            # Horizontal move
-
-            if source_col < destination_col:
-                # Right
-                walls_to_check = {
-                    Wall(
-                        top_left_cell=board._get_cell_at((source_row, source_col)), orientation=WallOrientation.VERTICAL
-                    )
-                }
-                if source_row > 0:
-                    walls_to_check.add(
-                        Wall(
-                            top_left_cell=board._get_cell_at((source_row - 1, source_col)),
-                            orientation=WallOrientation.VERTICAL,
-                        )
-                    )
-            else:
-                # Left
-                walls_to_check = {
-                    Wall(
-                        top_left_cell=board._get_cell_at((destination_row, destination_col)),
-                        orientation=WallOrientation.VERTICAL,
-                    )
-                }
-                if destination_row > 0:
-                    walls_to_check.add(
-                        Wall(
-                            top_left_cell=board._get_cell_at((destination_row - 1, destination_col)),
-                            orientation=WallOrientation.VERTICAL,
-                        )
-                    )
-
-        elif source_col == destination_col and abs(source_row - destination_row) == 1:
-            # Vertical move
-            if source_row < destination_row:
-                # Down
-                walls_to_check = {
-                    Wall(
-                        top_left_cell=board._get_cell_at((source_row, source_col)),
-                        orientation=WallOrientation.HORIZONTAL,
-                    )
-                }
-                if source_col > 0:
-                    walls_to_check.add(
-                        Wall(
-                            top_left_cell=board._get_cell_at((source_row, source_col - 1)),
-                            orientation=WallOrientation.HORIZONTAL,
-                        )
-                    )
-            else:
-                # Up
-                walls_to_check = {
-                    Wall(
-                        top_left_cell=board._get_cell_at((destination_row, destination_col)),
-                        orientation=WallOrientation.HORIZONTAL,
-                    )
-                }
-                if destination_col > 0:
-                    walls_to_check.add(
-                        Wall(
-                            top_left_cell=board._get_cell_at((destination_row, destination_col - 1)),
-                            orientation=WallOrientation.HORIZONTAL,
-                        )
-                    )
-
-        return any(wall in walls_to_check for wall in board.walls)
+    def _is_blocked_by_wall(board: AnyBoard, source: Position, destination: Position) -> bool:
+        return board.is_edge_blocked(source, destination)
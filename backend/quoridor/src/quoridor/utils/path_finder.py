@@ -1,8 +1,9 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+import threading
+from array import array
+from typing import Iterable, Optional
 from collections import deque
 
-from quoridor.board import Board
+from quoridor.bitboard import AnyBoard
 from quoridor.cell import Cell
 from quoridor.consts import (
     COLUMN_INDEX,
@@ -10,17 +11,63 @@ from quoridor.consts import (
     ROW_INDEX,
     Position,
 )
+from quoridor.utils.distance_map import Edge, blocked_edge_keys
+from quoridor.utils.grid import neighbor_table
 from quoridor.utils.movement_validator import MovementValidator
 
+NO_PARENT = -1
+
+
+class IndexedPath:
+    # Result of PathFinder.indexed_bfs - the path is rebuilt from the parent array only when asked for
+
+    def __init__(self, size: int, parents: array, target: int, distance: int) -> None:
+        self.size = size
+        self.parents = parents
+        self.target = target
+        self.distance = distance
+
+    def __len__(self) -> int:
+        return self.distance + 1
+
+    def positions(self) -> list[Position]:
+        path = []
+        index = self.target
+        while index != NO_PARENT:
+            path.append(divmod(index, self.size))
+            index = self.parents[index]
+        path.reverse()
+        return path
+
+
+class _SearchBuffers(threading.local):
+    # Scratch arrays for PathFinder._flat_search, one pair per board size and thread. A search hands
+    # them back as it found them - every distance -1 and no target marked.
+
+    def __init__(self) -> None:
+        self.by_size: dict[int, tuple[array, bytearray]] = {}
+
+    def get(self, size: int) -> tuple[array, bytearray]:
+        buffers = self.by_size.get(size)
+        if buffers is None:
+            cells = size * size
+            buffers = self.by_size[size] = (array("i", [-1] * cells), bytearray(cells))
+        return buffers
+
+
+_search_buffers = _SearchBuffers()
+
 
 class PathFinder:
 
     @classmethod
-    def shortest_path(cls, board: Board, start: Position, destination_set: set[Position]) -> Optional[list[Position]]:
+    def shortest_path(
+        cls, board: AnyBoard, start: Position, destination_set: set[Position]
+    ) -> Optional[list[Position]]:
         return cls.bfs(board, start, destination_set)
 
     @staticmethod
-    def bfs(board: Board, start: Position, destination_set: set[Position]) -> Optional[list[Position]]:
+    def bfs(board: AnyBoard, start: Position, destination_set: set[Position]) -> Optional[list[Position]]:
         queue = deque([(start, [])])
         visited = set()
         visited.add(start)
@@ -43,3 +90,73 @@ class PathFinder:
                     visited.add(new_position)
                     queue.append((new_position, path + [current_position]))
         return None
+
+    @classmethod
+    def indexed_bfs(
+        cls, board: AnyBoard, start: Position, destination_set: set[Position], extra_blocked: Iterable[Edge] = ()
+    ) -> Optional[IndexedPath]:
+        parents = array("i", [NO_PARENT] * (board.size * board.size))
+        found = cls._flat_search(board, start, destination_set, extra_blocked, parents)
+        if found is None:
+            return None
+        target, distance = found
+        return IndexedPath(board.size, parents, target, distance)
+
+    @classmethod
+    def distance(
+        cls, board: AnyBoard, start: Position, destination_set: set[Position], extra_blocked: Iterable[Edge] = ()
+    ) -> Optional[int]:
+        found = cls._flat_search(board, start, destination_set, extra_blocked, None)
+        return None if found is None else found[1]
+
+    @staticmethod
+    def _flat_search(
+        board: AnyBoard,
+        start: Position,
+        destination_set: set[Position],
+        extra_blocked: Iterable[Edge],
+        parents: Optional[array],
+    ) -> Optional[tuple[int, int]]:
+        # Wall-only BFS over flat arrays indexed by `row * size + col`.
+        # Stops as soon as any destination cell is discovered, and records parents only when asked to.
+        # Distances and targets live in per-size scratch buffers, reset from the visited list on the way out.
+        size = board.size
+        cells = size * size
+        neighbors = neighbor_table(size)
+        blocked = blocked_edge_keys(board, extra_blocked)
+        distances, is_target = _search_buffers.get(size)
+        targets = [board.index(position) for position in destination_set]
+        for target in targets:
+            is_target[target] = 1
+
+        start_index = board.index(start)
+        distances[start_index] = 0
+        visited = [start_index]
+        try:
+            if is_target[start_index]:
+                return start_index, 0
+
+            # `visited` doubles as the queue
+            head = 0
+            while head < len(visited):
+                current = visited[head]
+                head += 1
+                next_distance = distances[current] + 1
+                for neighbor in neighbors[current]:
+                    if (
+                        distances[neighbor] == -1
+                        and not board.is_index_edge_blocked(current, neighbor)
+                        and (not blocked or current * cells + neighbor not in blocked)
+                    ):
+                        distances[neighbor] = next_distance
+                        visited.append(neighbor)
+                        if parents is not None:
+                            parents[neighbor] = current
+                        if is_target[neighbor]:
+                            return neighbor, next_distance
+            return None
+        finally:
+            for index in visited:
+                distances[index] = -1
+            for target in targets:
+                is_target[target] = 0
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from quoridor.bitboard import AnyBoard
+from quoridor.move import Move, PawnMove
+from quoridor.player import Player
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+
+
+class TurnValidator:
+    # Full rule check for one move, without side effects - returns the reason a move is illegal, or None
+
+    @classmethod
+    def move_error(cls, board: AnyBoard, players: list[Player], player: Player, move: Move) -> Optional[str]:
+        if isinstance(move, PawnMove):
+            if move.destination not in MovementValidator.get_player_valid_moves(board, player).values():
+                return "illegal move"
+            return None
+
+        row, col = move.position
+        if player.wall_count <= 0:
+            return "no walls left"
+        # A wall covers two squares from its top-left one, so it cannot start on the last row or column
+        if not (0 <= row < board.size - 1 and 0 <= col < board.size - 1):
+            return "wall out of bounds"
+        if not WallValidator.legal_wall_slots(board, players, [(move.position, move.orientation)]):
+            return "illegal wall"
+        return None
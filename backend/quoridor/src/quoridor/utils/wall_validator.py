@@ -1,25 +1,24 @@
-from quoridor.board import Board
-from quoridor.consts import (
-    COLUMN_INDEX,
-    ROW_INDEX,
-    WallOrientation,
-)
+from typing import Iterable, Optional
+
+from quoridor.bitboard import AnyBoard
+from quoridor.consts import Position, WallOrientation
 from quoridor.player import Player
-from quoridor.utils.path_finder import PathFinder
-from quoridor.wall import Wall
+from quoridor.utils.distance_map import Edge
+from quoridor.utils.graph_analysis import GraphAnalysis
+from quoridor.wall import Wall, wall_edges
 
 
 class WallValidator:
 
     @classmethod
-    def validate_wall_placement(cls, board: Board, players: list[Player], wall: Wall) -> bool:
+    def validate_wall_placement(cls, board: AnyBoard, players: list[Player], wall: Wall) -> bool:
         # 1. Check if the wall is within boundaries
         if not cls._is_within_boundaries(wall=wall, board_size=board.size):
             print("Err: not in boundaries")
             return False
 
         # 2. Check if the wall overlaps with an existing wall
-        if cls._overlaps_with_existing_wall(board.walls, wall):
+        if cls._overlaps_with_existing_wall(board, wall):
             print("Err: overlaps")
             return False
 
@@ -30,55 +29,59 @@ class WallValidator:
 
         return True
 
-    @staticmethod
-    def _is_within_boundaries(wall: Wall, board_size: int) -> bool:
-        row, col = wall.top_left_cell.position
-        if not (0 <= row < board_size and 0 <= col < board_size):
-            return False
-        return True
+    @classmethod
+    def legal_walls(cls, board: AnyBoard, players: list[Player]) -> list[Wall]:
+        return [board.wall_at(position, orientation) for position, orientation in cls.legal_wall_slots(board, players)]
+
+    @classmethod
+    def legal_wall_slots(
+        cls,
+        board: AnyBoard,
+        players: list[Player],
+        candidates: Optional[Iterable[tuple[Position, WallOrientation]]] = None,
+    ) -> list[tuple[Position, WallOrientation]]:
+        # Every legal wall placement in one pass - one cut analysis per player for the whole batch,
+        # so no candidate needs a BFS. A wall spans two squares, so its top-left square is never on the
+        # last row or column - (size - 1) ** 2 anchors, 128 slots on an empty 9x9 board.
+        size = board.size
+        analyses = [board.graph_analysis(player.destination) for player in players]
+        if candidates is None:
+            candidates = (
+                ((row, col), orientation)
+                for row in range(size - 1)
+                for col in range(size - 1)
+                for orientation in WallOrientation
+            )
+
+        legal = []
+        for position, orientation in candidates:
+            if not cls._is_anchor(position, size) or board.wall_conflicts(position, orientation):
+                continue
+            if cls._paths_survive(players, analyses, wall_edges(position, orientation, size)):
+                legal.append((position, orientation))
+        return legal
+
+    @classmethod
+    def _is_within_boundaries(cls, wall: Wall, board_size: int) -> bool:
+        return cls._is_anchor(wall.top_left_cell.position, board_size)
 
     @staticmethod
-    def _overlaps_with_existing_wall(walls: set[Wall], new_wall: Wall) -> bool:
-        for wall in walls:
-            # Exact wall already exists
-            if wall == new_wall:
-                return True
-            # Top-left cell conflict
-            if wall.top_left_cell == new_wall.top_left_cell:
-                return True
-            else:
-                # Partial overlap - vertical
-                if (
-                    new_wall.orientation == WallOrientation.VERTICAL
-                    and wall.orientation == WallOrientation.VERTICAL
-                    and abs(wall.top_left_cell.position[ROW_INDEX] - new_wall.top_left_cell.position[ROW_INDEX]) == 1
-                    and wall.top_left_cell.position[COLUMN_INDEX] == new_wall.top_left_cell.position[COLUMN_INDEX]
-                ):
-                    return True
-                # Partial overlap - horizontal
-                elif (
-                    new_wall.orientation == WallOrientation.HORIZONTAL
-                    and wall.orientation == WallOrientation.HORIZONTAL
-                    and abs(wall.top_left_cell.position[COLUMN_INDEX] - new_wall.top_left_cell.position[COLUMN_INDEX])
-                    == 1
-                    and wall.top_left_cell.position[ROW_INDEX] == new_wall.top_left_cell.position[ROW_INDEX]
-                ):
-                    return True
-        return False
+    def _is_anchor(position: Position, board_size: int) -> bool:
+        row, col = position
+        return 0 <= row < board_size - 1 and 0 <= col < board_size - 1
 
     @staticmethod
-    def _players_have_paths(board: Board, players: list[Player], proposed_wall: Wall) -> bool:
-        # Temporarily add the wall for pathfinding test
-        board.walls.add(proposed_wall)
-        all_players_have_paths = True
+    def _overlaps_with_existing_wall(board: AnyBoard, new_wall: Wall) -> bool:
+        # Exact overlaps, partial overlaps and crossings, from the board's wall-slot grid
+        return board.wall_conflicts(new_wall.top_left_cell.position, new_wall.orientation)
 
-        for player in players:
-            destination_set = player.destination
-            path = PathFinder.shortest_path(board, player.position, destination_set)
-            if path is None:
-                all_players_have_paths = False
-                break
+    @classmethod
+    def _players_have_paths(cls, board: AnyBoard, players: list[Player], proposed_wall: Wall) -> bool:
+        edges = wall_edges(proposed_wall.top_left_cell.position, proposed_wall.orientation, board.size)
+        analyses = [board.graph_analysis(player.destination) for player in players]
+        return cls._paths_survive(players, analyses, edges)
 
-        # Remove the wall after testing
-        board.walls.remove(proposed_wall)
-        return all_players_have_paths
+    @staticmethod
+    def _paths_survive(players: list[Player], analyses: list[GraphAnalysis], edges: list[Edge]) -> bool:
+        # A wall can only disconnect a player by removing a bridge or a 2-edge cut - O(1) per player
+        return not any(analysis.disconnects(player.position, edges) for player, analysis in zip(players, analyses))
@@ -1,16 +1,14 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 from quoridor.cell import Cell
-from quoridor.consts import WallOrientation
+from quoridor.consts import Position, WallOrientation
 
 
-class Wall(BaseModel):
+@dataclass(slots=True)
+class Wall:
     top_left_cell: Cell
     orientation: WallOrientation
 
-    class Config:
-        arbitrary_types_allowed = True
-
     def __eq__(self, other):
         if not isinstance(other, Wall):
             return False
@@ -18,3 +16,50 @@ class Wall(BaseModel):
 
     def __hash__(self):
         return hash((self.top_left_cell.position, self.orientation))
+
+
+def wall_edges(top_left: Position, orientation: WallOrientation, size: int) -> list[tuple[Position, Position]]:
+    row, col = top_left
+    if orientation == WallOrientation.HORIZONTAL:
+        # Blocks the two downward moves below the wall
+        if row + 1 >= size:
+            return []
+        return [((row, c), (row + 1, c)) for c in (col, col + 1) if c < size]
+    # Blocks the two rightward moves beside the wall
+    if col + 1 >= size:
+        return []
+    return [((r, col), (r, col + 1)) for r in (row, row + 1) if r < size]
+
+
+class WallSlots:
+    # Conflict counts for every wall slot, indexed by `row * size + col` of the top-left cell.
+    # Placing a wall marks every slot it rules out - the same slot in both orientations (exact
+    # overlap and crossing at the shared midpoint) and the two slots along its own axis (partial
+    # overlap) - so checking a slot is a single lookup. Walls that only touch end to end, or form a
+    # T, do not conflict. Counts make removal a plain decrement.
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._conflicts = {orientation: bytearray(size * size) for orientation in WallOrientation}
+
+    def conflicts(self, position: Position, orientation: WallOrientation) -> bool:
+        return self._conflicts[orientation][position[0] * self.size + position[1]] > 0
+
+    def add(self, position: Position, orientation: WallOrientation) -> None:
+        self._update(position, orientation, 1)
+
+    def remove(self, position: Position, orientation: WallOrientation) -> None:
+        self._update(position, orientation, -1)
+
+    def _update(self, position: Position, orientation: WallOrientation, delta: int) -> None:
+        size = self.size
+        row, col = position
+        for conflicts in self._conflicts.values():
+            conflicts[row * size + col] += delta
+        if orientation == WallOrientation.VERTICAL:
+            neighbors = ((row - 1, col), (row + 1, col))
+        else:
+            neighbors = ((row, col - 1), (row, col + 1))
+        for neighbor_row, neighbor_col in neighbors:
+            if 0 <= neighbor_row < size and 0 <= neighbor_col < size:
+                self._conflicts[orientation][neighbor_row * size + neighbor_col] += delta
@@ -0,0 +1,60 @@
+import random
+from functools import lru_cache
+
+from quoridor.consts import Position, WallOrientation
+from quoridor.player import Player
+
+ZOBRIST_SEED = 0x0B5E55ED
+MAX_PLAYERS = 4
+MAX_WALL_COUNT = 32
+
+
+class ZobristTable:
+    # Random 64-bit keys for every pawn square, wall slot, walls-remaining count and side to move.
+    # The seed is fixed so keys agree across boards and processes.
+
+    def __init__(self, size: int, seed: int = ZOBRIST_SEED) -> None:
+        rng = random.Random(seed ^ size)
+        cells = size * size
+        self.pawns = [[rng.getrandbits(64) for _ in range(cells)] for _ in range(MAX_PLAYERS)]
+        self.walls = {orientation: [rng.getrandbits(64) for _ in range(cells)] for orientation in WallOrientation}
+        self.wall_counts = [[rng.getrandbits(64) for _ in range(MAX_WALL_COUNT + 1)] for _ in range(MAX_PLAYERS)]
+        self.side = [rng.getrandbits(64) for _ in range(MAX_PLAYERS)]
+
+
+@lru_cache(maxsize=None)
+def zobrist_table(size: int) -> ZobristTable:
+    return ZobristTable(size)
+
+
+class ZobristMixin:
+    # Incremental position key for any board backend. Walls are folded in by place_wall/remove_wall,
+    # pawns and walls-remaining by set_occupation_state, move_player and apply/revert. Players get a
+    # key slot by name order, so the same position always hashes the same way.
+
+    @property
+    def zobrist_key(self) -> int:
+        return self._walls_key ^ self._players_key
+
+    def position_key(self, side: int) -> int:
+        return self.zobrist_key ^ zobrist_table(self.size).side[side]
+
+    def _toggle_wall_key(self, position: Position, orientation: WallOrientation) -> None:
+        self._walls_key ^= zobrist_table(self.size).walls[orientation][self.index(position)]
+
+    def _toggle_pawn_key(self, player: Player, position: Position) -> None:
+        self._players_key ^= zobrist_table(self.size).pawns[self._player_slot(player)][self.index(position)]
+
+    def _toggle_wall_count_key(self, player: Player) -> None:
+        table = zobrist_table(self.size)
+        self._players_key ^= table.wall_counts[self._player_slot(player)][min(player.wall_count, MAX_WALL_COUNT)]
+
+    def _reset_players_key(self, players: set[Player]) -> None:
+        self._player_slots = {name: slot for slot, name in enumerate(sorted(player.name for player in players))}
+        self._players_key = 0
+        for player in players:
+            self._toggle_pawn_key(player, player.position)
+            self._toggle_wall_count_key(player)
+
+    def _player_slot(self, player: Player) -> int:
+        return self._player_slots.setdefault(player.name, len(self._player_slots))
@@ -21,10 +21,14 @@ setup(
     version="0.1.0",
     description="Quoridor game logic module",
     install_requires=get_requirements(),
+    extras_require={"numpy": ["numpy"]},
     python_requires=">=3.12",
     entry_points={
         "console_scripts": [
             "quoridor = quoridor.main:main",
+            "quoridor-self-play = quoridor.self_play:main",
+            "quoridor-game-db = quoridor.game_db:main",
+            "quoridor-perft = quoridor.perft:main",
         ],
     },
 )
@@ -0,0 +1,161 @@
+import random
+
+import pytest
+
+from quoridor.bitboard import BitBoard
+from quoridor.board import Board
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove, WallMove
+from quoridor.player import Player
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+
+# Board and BitBoard must agree on every rule. Random games are played on both backends side by side
+# and compared after every ply.
+
+SEEDS = range(8)
+
+
+def move_key(move) -> tuple:
+    if isinstance(move, PawnMove):
+        return 0, move.destination, ""
+    return 1, move.position, move.orientation.value
+
+
+def assert_same_state(board_game: GameManager, bit_game: GameManager) -> None:
+    for board_player, bit_player in zip(board_game.players, bit_game.players):
+        assert board_player.position == bit_player.position
+        assert board_player.wall_count == bit_player.wall_count
+        # Pawn moves, including jumps and side-steps
+        assert MovementValidator.get_player_valid_moves(
+            board_game.board, board_player
+        ) == MovementValidator.get_player_valid_moves(bit_game.board, bit_player)
+    assert WallValidator.legal_wall_slots(board_game.board, board_game.players) == WallValidator.legal_wall_slots(
+        bit_game.board, bit_game.players
+    )
+    assert sorted(board_game.legal_moves(), key=move_key) == sorted(bit_game.legal_moves(), key=move_key)
+    assert board_game.board.wall_mask(WallOrientation.HORIZONTAL) == bit_game.board.wall_mask(
+        WallOrientation.HORIZONTAL
+    )
+    assert board_game.board.wall_mask(WallOrientation.VERTICAL) == bit_game.board.wall_mask(WallOrientation.VERTICAL)
+    assert (board_game.winner() is None) == (bit_game.winner() is None)
+    if board_game.winner() is not None:
+        assert board_game.winner().name == bit_game.winner().name
+    assert board_game.position_key == bit_game.position_key
+
+
+@pytest.mark.parametrize("player_count", [2, 4])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_random_games_agree(seed: int, player_count: int) -> None:
+    rng = random.Random(seed)
+    board_game = GameManager(size=7, backend=BoardBackend.PYDANTIC, player_count=player_count)
+    bit_game = GameManager(size=7, backend=BoardBackend.BITBOARD, player_count=player_count)
+    assert_same_state(board_game, bit_game)
+    for _ in range(200):
+        moves = sorted(board_game.legal_moves(), key=move_key)
+        if not moves:
+            break
+        # Walls are most of the moves - pick a pawn move half the time so games also reach a winner
+        pawn_moves = [move for move in moves if isinstance(move, PawnMove)]
+        move = rng.choice(pawn_moves if pawn_moves and rng.random() < 0.5 else moves)
+        assert board_game.submit_move(move).ok
+        assert bit_game.submit_move(move).ok
+        assert_same_state(board_game, bit_game)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_undo_restores_both_backends(seed: int) -> None:
+    rng = random.Random(seed)
+    board_game = GameManager(size=7, backend=BoardBackend.PYDANTIC)
+    bit_game = GameManager(size=7, backend=BoardBackend.BITBOARD)
+    keys = [board_game.position_key]
+    for _ in range(30):
+        moves = sorted(board_game.legal_moves(), key=move_key)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        board_game.submit_move(move)
+        bit_game.submit_move(move)
+        keys.append(board_game.position_key)
+    while board_game.history:
+        assert board_game.position_key == keys.pop()
+        board_game.undo()
+        bit_game.undo()
+        assert_same_state(board_game, bit_game)
+    assert board_game.position_key == keys.pop()
+
+
+def facing_pawns(board_type: type, wall_behind: bool):
+    board = board_type(size=9)
+    a = Player(name="A", position=(4, 4), destination={(8, col) for col in range(9)})
+    b = Player(name="B", position=(5, 4), destination={(0, col) for col in range(9)})
+    board.set_occupation_state({a, b})
+    if wall_behind:
+        # Closes the square behind B
+        board.place_wall_at((5, 4), WallOrientation.HORIZONTAL)
+    return board, a
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+def test_straight_jump(board_type: type) -> None:
+    board, a = facing_pawns(board_type, wall_behind=False)
+    moves = set(MovementValidator.get_player_valid_moves(board, a).values())
+    assert moves == {(3, 4), (4, 3), (4, 5), (6, 4)}
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+def test_diagonal_jump_when_blocked_behind(board_type: type) -> None:
+    board, a = facing_pawns(board_type, wall_behind=True)
+    moves = set(MovementValidator.get_player_valid_moves(board, a).values())
+    assert moves == {(3, 4), (4, 3), (4, 5), (5, 3), (5, 5)}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_wall_placement_and_keys_agree(seed: int) -> None:
+    rng = random.Random(seed)
+    board, bitboard = Board(size=9), BitBoard(size=9)
+    placed = []
+    for _ in range(60):
+        position = (rng.randrange(8), rng.randrange(8))
+        orientation = rng.choice(list(WallOrientation))
+        accepted = board.place_wall_at(position, orientation)
+        assert bitboard.place_wall_at(position, orientation) == accepted
+        assert board.zobrist_key == bitboard.zobrist_key
+        if accepted:
+            placed.append((position, orientation))
+    assert {(wall.top_left_cell.position, wall.orientation) for wall in board.walls} == {
+        (wall.top_left_cell.position, wall.orientation) for wall in bitboard.walls
+    }
+    for position, orientation in reversed(placed):
+        board.remove_wall_at(position, orientation)
+        bitboard.remove_wall_at(position, orientation)
+        assert board.zobrist_key == bitboard.zobrist_key
+    assert board.zobrist_key == bitboard.zobrist_key == 0
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+def test_walls_are_read_only(board_type: type) -> None:
+    board = board_type(size=9)
+    board.place_wall_at((3, 3), WallOrientation.VERTICAL)
+    with pytest.raises(AttributeError):
+        board.walls.add(board.wall_at((0, 0), WallOrientation.HORIZONTAL))
+    with pytest.raises(AttributeError):
+        board.walls = set()
+    assert [(wall.top_left_cell.position, wall.orientation) for wall in board.walls] == [
+        ((3, 3), WallOrientation.VERTICAL)
+    ]
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+def test_refused_wall_leaves_state_untouched(board_type: type) -> None:
+    board = board_type(size=9)
+    player = Player(name="A", position=(0, 4), destination={(8, col) for col in range(9)})
+    board.set_occupation_state({player})
+    board.apply(player, WallMove((3, 3), WallOrientation.HORIZONTAL))
+    key, wall_count = board.zobrist_key, player.wall_count
+    with pytest.raises(ValueError):
+        board.apply(player, WallMove((3, 3), WallOrientation.VERTICAL))
+    assert board.zobrist_key == key
+    assert player.wall_count == wall_count
+    assert len(board.walls) == 1
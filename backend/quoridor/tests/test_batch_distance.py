@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from quoridor.bitboard import BitBoard  # noqa: E402
+from quoridor.codec import encode_position  # noqa: E402
+from quoridor.consts import WallOrientation  # noqa: E402
+from quoridor.game_manager import starting_players  # noqa: E402
+from quoridor.utils.batch_distance import (  # noqa: E402
+    UNREACHABLE,
+    batch_distances,
+    batch_from_boards,
+    batch_from_encoded,
+)
+from quoridor.utils.path_finder import PathFinder  # noqa: E402
+from quoridor.utils.wall_validator import WallValidator  # noqa: E402
+
+POSITIONS = 12
+
+
+def random_position(size: int, player_count: int, rng: random.Random):
+    # Walls are placed without the path rule, so some pawns end up walled off from their goal.
+    # No pawns are placed on the board - batch distances are wall-only.
+    board = BitBoard(size=size)
+    for _ in range(rng.randrange(size * 2)):
+        slots = WallValidator.legal_wall_slots(board, [])
+        if not slots:
+            break
+        board.place_wall_at(*rng.choice(slots))
+    players = starting_players(size, player_count)
+    squares = rng.sample(range(size * size), player_count)
+    for player, square in zip(players, squares):
+        player.position = divmod(square, size)
+    return board, players
+
+
+def bfs_distance(board, player) -> int:
+    path = PathFinder.bfs(board, player.position, set(player.destination))
+    return UNREACHABLE if path is None else len(path) - 1
+
+
+@pytest.mark.parametrize("size", [5, 9, 13, 19])
+@pytest.mark.parametrize("player_count", [2, 4])
+def test_batch_distances_match_bfs(size: int, player_count: int) -> None:
+    rng = random.Random(size * 10 + player_count)
+    positions = [random_position(size, player_count, rng) for _ in range(POSITIONS)]
+    expected = np.array([[bfs_distance(board, player) for player in players] for board, players in positions])
+
+    boards = [board for board, _ in positions]
+    groups = [players for _, players in positions]
+    assert np.array_equal(batch_distances(batch_from_boards(boards, groups)), expected)
+
+    encoded = b"".join(encode_position(board, players, 0) for board, players in positions)
+    assert np.array_equal(batch_distances(batch_from_encoded(encoded)), expected)
+    # Chunking must not change anything
+    assert np.array_equal(batch_distances(batch_from_encoded(encoded), chunk_size=5), expected)
+
+
+def test_walled_off_pawn_is_unreachable() -> None:
+    board = BitBoard(size=9)
+    board.place_wall_at((0, 0), WallOrientation.HORIZONTAL)
+    board.place_wall_at((0, 1), WallOrientation.VERTICAL)
+    players = starting_players(9, 2)
+    players[0].position = (0, 1)
+    distances = batch_distances(batch_from_boards([board], [players]))
+    assert distances.tolist() == [[UNREACHABLE, bfs_distance(board, players[1])]]
+    assert bfs_distance(board, players[0]) == UNREACHABLE
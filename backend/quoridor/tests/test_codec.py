@@ -0,0 +1,117 @@
+import mmap
+import random
+
+import pytest
+
+from quoridor.codec import (
+    GameRecordView,
+    PositionView,
+    decode_position,
+    encode_game,
+    encode_game_moves,
+    encode_position,
+    iter_game_records,
+)
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.engine.policies import GreedyPolicy
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove
+
+LAYOUTS = [(5, 2), (9, 2), (9, 4), (19, 2), (19, 4)]
+
+
+def random_game(size: int, player_count: int, seed: int, steps: int = 40, backend=BoardBackend.BITBOARD) -> GameManager:
+    rng = random.Random(seed)
+    game = GameManager(size=size, backend=backend, player_count=player_count)
+    for _ in range(steps):
+        moves = game.legal_moves()
+        if not moves:
+            break
+        pawn_moves = [move for move in moves if isinstance(move, PawnMove)]
+        game.apply(rng.choice(pawn_moves if pawn_moves and rng.random() < 0.5 else moves))
+    return game
+
+
+def assert_same_position(game: GameManager, board, players, side: int) -> None:
+    assert side == game.current_player_index
+    assert [player.position for player in players] == [player.position for player in game.players]
+    assert [player.wall_count for player in players] == [player.wall_count for player in game.players]
+    for orientation in WallOrientation:
+        assert board.wall_mask(orientation) == game.board.wall_mask(orientation)
+    assert board.position_key(side) == game.position_key
+
+
+@pytest.mark.parametrize("size, player_count", LAYOUTS)
+@pytest.mark.parametrize("backend", [BoardBackend.PYDANTIC, BoardBackend.BITBOARD])
+def test_position_roundtrip(size: int, player_count: int, backend: BoardBackend) -> None:
+    game = random_game(size, player_count, seed=size + player_count, backend=backend)
+    assert game.board.walls
+    data = encode_position(game.board, game.players, game.current_player_index)
+    assert PositionView(data).nbytes == len(data)
+    assert_same_position(game, *decode_position(data))
+
+
+@pytest.mark.parametrize("size, player_count", LAYOUTS)
+def test_game_roundtrip(size: int, player_count: int) -> None:
+    game = random_game(size, player_count, seed=size * player_count)
+    game.pass_turn()
+    game.apply(game.legal_moves()[0])
+    data = encode_game(game)
+    record = GameRecordView(data)
+    assert (record.size, record.player_count, record.winner) == (size, player_count, None)
+    assert record.nbytes == len(data)
+    assert list(record.moves()) == [None if entry is None else entry.move for _, entry in game.history]
+    assert record.replay().position_key == game.position_key
+
+
+def test_finished_game_keeps_its_winner() -> None:
+    game = GameManager(size=5)
+    policy, rng = GreedyPolicy(), random.Random(0)
+    while game.winner() is None:
+        game.apply(policy.choose(game, rng))
+    record = GameRecordView(encode_game(game))
+    assert record.winner == game.players.index(game.winner())
+    assert record.replay().winner().name == game.winner().name
+
+
+@pytest.fixture(scope="module")
+def corpus() -> tuple[list[GameManager], bytes]:
+    games = [random_game(size, player_count, seed) for seed, (size, player_count) in enumerate(LAYOUTS)]
+    return games, b"".join(encode_game(game) for game in games)
+
+
+def test_records_decode_from_a_memoryview(corpus) -> None:
+    games, data = corpus
+    prefix = b"\0" * 7
+    view = memoryview(prefix + data)
+    records = list(iter_game_records(view, len(prefix)))
+    assert [record.replay().position_key for record in records] == [game.position_key for game in games]
+
+    game = games[-1]
+    encoded = encode_position(game.board, game.players, game.current_player_index)
+    assert_same_position(game, *decode_position(memoryview(prefix + encoded), len(prefix)))
+
+
+def test_records_decode_from_an_mmap(corpus, tmp_path) -> None:
+    games, data = corpus
+    positions = [encode_position(game.board, game.players, game.current_player_index) for game in games]
+    path = tmp_path / "corpus.bin"
+    path.write_bytes(data + b"".join(positions))
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        records = list(iter_game_records(buffer, 0, len(data)))
+        assert [record.move_count for record in records] == [len(game.history) for game in games]
+        assert [record.replay().position_key for record in records] == [game.position_key for game in games]
+
+        offset = len(data)
+        for game in games:
+            view = PositionView(buffer, offset)
+            assert_same_position(game, *view.build(), view.side)
+            offset += view.nbytes
+        assert offset == len(buffer)
+
+
+def test_encode_game_moves_matches_encode_game() -> None:
+    game = random_game(9, 2, seed=3)
+    moves = [entry.move for _, entry in game.history]
+    assert encode_game_moves(9, 2, None, moves) == encode_game(game)
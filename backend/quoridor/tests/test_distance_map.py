@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from quoridor.bitboard import BitBoard
+from quoridor.board import Board
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import starting_players
+from quoridor.move import PawnMove, WallMove
+from quoridor.utils.distance_map import DistanceMap
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+
+SIZE = 7
+
+
+def assert_cache_fresh(board, players) -> None:
+    for player in players:
+        cached = board.distance_map(player.destination)
+        assert cached.distances == DistanceMap.compute(board, player.destination).distances
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+@pytest.mark.parametrize("seed", range(6))
+def test_cached_maps_follow_wall_changes(board_type: type, seed: int) -> None:
+    # Random placements and removals, with every cached map checked against a fresh BFS after each step
+    rng = random.Random(seed)
+    board = board_type(size=SIZE)
+    players = starting_players(SIZE, 4)
+    board.set_occupation_state(set(players))
+    placed = []
+    for _ in range(80):
+        assert_cache_fresh(board, players)
+        if placed and rng.random() < 0.35:
+            board.remove_wall_at(*placed.pop(rng.randrange(len(placed))))
+            continue
+        position = (rng.randrange(SIZE - 1), rng.randrange(SIZE - 1))
+        orientation = rng.choice(list(WallOrientation))
+        if board.place_wall_at(position, orientation):
+            placed.append((position, orientation))
+    assert_cache_fresh(board, players)
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+@pytest.mark.parametrize("seed", range(4))
+def test_cached_maps_follow_apply_and_revert(board_type: type, seed: int) -> None:
+    rng = random.Random(seed)
+    board = board_type(size=SIZE)
+    players = starting_players(SIZE, 2)
+    board.set_occupation_state(set(players))
+    records = []
+    side = 0
+    for _ in range(40):
+        player = players[side]
+        slots = WallValidator.legal_wall_slots(board, players) if player.wall_count else []
+        if slots and rng.random() < 0.5:
+            move = WallMove(*rng.choice(slots))
+        else:
+            move = PawnMove(rng.choice(sorted(MovementValidator.get_player_valid_moves(board, player).values())))
+        records.append((player, board.apply(player, move)))
+        assert_cache_fresh(board, players)
+        side = 1 - side
+    while records:
+        player, record = records.pop()
+        board.revert(player, record)
+        assert_cache_fresh(board, players)
+    assert not board.walls
+
+
+def test_wall_off_the_shortest_paths_keeps_the_map() -> None:
+    # On an empty board every cell of a row is equally far from the far edge, so a vertical wall
+    # crosses no shortest path and the cached map survives. A horizontal one cuts it.
+    board = BitBoard(size=9)
+    destination = {(8, col) for col in range(9)}
+    cached = board.distance_map(destination)
+    board.place_wall_at((3, 3), WallOrientation.VERTICAL)
+    assert board.distance_map(destination) is cached
+    board.place_wall_at((5, 5), WallOrientation.HORIZONTAL)
+    assert board.distance_map(destination) is not cached
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from quoridor.bitboard import BitBoard
+from quoridor.engine import endgame
+from quoridor.game_manager import starting_players
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.wall_validator import WallValidator
+
+SIZE = 5
+CELLS = SIZE * SIZE
+
+
+def layout(seed: int) -> BitBoard:
+    rng = random.Random(seed)
+    board = BitBoard(size=SIZE)
+    players = starting_players(SIZE)
+    for _ in range(seed):
+        slots = WallValidator.legal_wall_slots(board, players)
+        if slots:
+            board.place_wall_at(*rng.choice(slots))
+    return board
+
+
+def minimax(board: BitBoard) -> dict[tuple[int, int, int], endgame.EndgameOutcome]:
+    # Win within n plies for the side to move iff some move reaches a loss within n - 1, and loss iff
+    # every move reaches a win within n - 1. Moves come from the full rules with both pawns placed.
+    players = starting_players(SIZE)
+    states, moves = [], {}
+    for side in range(2):
+        for mover in range(CELLS):
+            for other in range(CELLS):
+                if mover == other:
+                    continue
+                state = (side, mover, other)
+                states.append(state)
+                players[side].position = board.position(mover)
+                players[1 - side].position = board.position(other)
+                board.set_occupation_state(set(players))
+                destinations = MovementValidator.get_player_valid_moves(board, players[side]).values()
+                # A pawn with no move passes
+                moves[state] = [(1 - side, other, board.index(position)) for position in destinations] or [
+                    (1 - side, other, mover)
+                ]
+
+    def finished(state) -> int:
+        side, mover, other = state
+        if board.position(other) in players[1 - side].destination:
+            return endgame.LOSS
+        if board.position(mover) in players[side].destination:
+            return endgame.WIN
+        return endgame.DRAW
+
+    solved = {state: endgame.EndgameOutcome(finished(state), 0) for state in states if finished(state)}
+    plies = 0
+    while True:
+        plies += 1
+        found = {}
+        for state in states:
+            if state in solved:
+                continue
+            replies = [solved.get(reply) for reply in moves[state]]
+            if any(reply is not None and reply.result == endgame.LOSS for reply in replies):
+                found[state] = endgame.EndgameOutcome(endgame.WIN, plies)
+            elif all(reply is not None and reply.result == endgame.WIN for reply in replies):
+                found[state] = endgame.EndgameOutcome(endgame.LOSS, plies)
+        if not found:
+            break
+        solved.update(found)
+    return {state: solved.get(state, endgame.EndgameOutcome(endgame.DRAW, None)) for state in states}
+
+
+@pytest.mark.parametrize("seed", [0, 2, 4, 6, 8])
+def test_table_matches_minimax(seed: int) -> None:
+    # The seed is also the number of walls
+    board = layout(seed)
+    table = endgame.table_for(board)
+    expected = minimax(board)
+    assert {state: table.outcome(*state) for state in expected} == expected
+    assert any(outcome.result == endgame.WIN and outcome.plies > 2 for outcome in expected.values())
+    assert any(outcome.result == endgame.LOSS and outcome.plies > 2 for outcome in expected.values())
+
+
+@pytest.mark.parametrize("seed", [0, 4])
+def test_best_move_keeps_the_result(seed: int) -> None:
+    board = layout(seed)
+    players = starting_players(SIZE)
+    for player in players:
+        player.wall_count = 0
+    expected = minimax(board)
+    rng = random.Random(seed)
+    for side, mover, other in rng.sample(sorted(expected), 100):
+        players[side].position = board.position(mover)
+        players[1 - side].position = board.position(other)
+        board.set_occupation_state(set(players))
+        outcome = endgame.probe(board, players, side)
+        move = endgame.best_move(board, players, side)
+        if outcome.plies == 0 or move is None:
+            continue
+        reply = expected[(1 - side, other, board.index(move.destination))]
+        if outcome.result == endgame.WIN:
+            assert reply == endgame.EndgameOutcome(endgame.LOSS, outcome.plies - 1)
+        elif outcome.result == endgame.LOSS:
+            assert reply == endgame.EndgameOutcome(endgame.WIN, outcome.plies - 1)
+        else:
+            assert reply.result == endgame.DRAW
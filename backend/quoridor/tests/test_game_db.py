@@ -0,0 +1,112 @@
+import json
+from collections import Counter
+
+import pytest
+
+from quoridor.game_db import INDEX_HEADER, MAX_LOAD, MIN_SLOT_BITS, GameDatabase, position_keys
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove
+from quoridor.self_play import decode_move, play_game
+from quoridor.zobrist import MAX_PLAYERS
+
+
+def test_game_records_outlive_the_games_iterator(tmp_path) -> None:
+    game = GameManager()
+    game.submit_move(PawnMove((1, 4)))
+    with GameDatabase(str(tmp_path / "games.db")) as database:
+        database.append(game)
+        records = list(database.games())
+        database.append(game)
+        database.build_index()
+        assert list(records[0].moves()) == [PawnMove((1, 4))]
+        assert len(list(database.games())) == 2
+        assert database.position_stats(game).games == 2
+
+
+@pytest.fixture(scope="module")
+def self_play_lines() -> list[str]:
+    # Random 5x5 games are cheap and reach a few thousand distinct positions, enough to grow the index
+    return [json.dumps(play_game(seed, ["random", "random"], size=5)) for seed in range(150)]
+
+
+def expected_counts(database: GameDatabase) -> dict[int, list[int]]:
+    counts: dict[int, Counter] = {}
+    for record in database.games():
+        for key in position_keys(record):
+            entry = counts.setdefault(key, Counter())
+            entry["games"] += 1
+            if record.winner is not None:
+                entry[record.winner] += 1
+    return {key: [entry["games"]] + [entry[player] for player in range(MAX_PLAYERS)] for key, entry in counts.items()}
+
+
+def stored_counts(database: GameDatabase, keys) -> dict[int, list[int]]:
+    return {key: [stats.games, *stats.wins] for key in keys if (stats := database.lookup(key)) is not None}
+
+
+def slot_bits(database: GameDatabase) -> int:
+    with open(database.index_path, "rb") as f:
+        return INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))[2]
+
+
+def test_import_self_play(tmp_path, self_play_lines: list[str]) -> None:
+    with GameDatabase(str(tmp_path / "games.db")) as database:
+        assert database.import_self_play(self_play_lines[:5] + ["", "\n"]) == 5
+        for line, record in zip(self_play_lines, database.games()):
+            game = json.loads(line)
+            assert list(record.moves()) == [decode_move(code) for code in game["moves"]]
+            assert record.winner == (None if game["winner"] is None else "AB".index(game["winner"]))
+
+
+def test_counts_and_wins_per_player(tmp_path, self_play_lines: list[str]) -> None:
+    with GameDatabase(str(tmp_path / "games.db")) as database:
+        database.import_self_play(self_play_lines)
+        assert database.build_index() == len(self_play_lines)
+        expected = expected_counts(database)
+        assert stored_counts(database, expected) == expected
+
+        # Both players win some games, and every game passes through the opening
+        opening = database.position_stats(GameManager(size=5))
+        winners = Counter(json.loads(line)["winner"] for line in self_play_lines)
+        assert winners["A"] and winners["B"]
+        assert opening.games == len(self_play_lines)
+        assert opening.wins[:2] == (winners["A"], winners["B"])
+        assert opening.unfinished == winners[None]
+        assert database.lookup(1) is None
+
+
+def test_index_grows_past_max_load(tmp_path, self_play_lines: list[str]) -> None:
+    with GameDatabase(str(tmp_path / "games.db")) as database:
+        database.import_self_play(self_play_lines)
+        database.build_index()
+        expected = expected_counts(database)
+        assert len(expected) > MAX_LOAD * (1 << MIN_SLOT_BITS)
+        bits = slot_bits(database)
+        assert bits > MIN_SLOT_BITS
+        assert len(expected) <= MAX_LOAD * (1 << bits)
+        assert stored_counts(database, expected) == expected
+
+
+def test_small_pending_batches_merge_to_the_same_counts(tmp_path, self_play_lines: list[str]) -> None:
+    with GameDatabase(str(tmp_path / "batched.db")) as database:
+        database.import_self_play(self_play_lines)
+        database.build_index(max_pending=100)
+        expected = expected_counts(database)
+        assert stored_counts(database, expected) == expected
+
+
+def test_reopen_and_index_new_games(tmp_path, self_play_lines: list[str]) -> None:
+    path = str(tmp_path / "games.db")
+    with GameDatabase(path) as database:
+        database.import_self_play(self_play_lines[:100])
+        database.build_index()
+        first = expected_counts(database)
+
+    with GameDatabase(path) as database:
+        assert stored_counts(database, first) == first
+        database.import_self_play(self_play_lines[100:])
+        # Only games appended since the last build are indexed again
+        assert database.build_index() == len(self_play_lines) - 100
+        expected = expected_counts(database)
+        assert len(list(database.games())) == len(self_play_lines)
+        assert stored_counts(database, expected) == expected
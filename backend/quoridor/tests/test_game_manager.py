@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove
+from quoridor.utils.movement_validator import MovementValidator
+
+
+def test_submit_wall_rejects_unknown_orientation() -> None:
+    game = GameManager()
+    result = game.submit_wall(1, 1, "diagonal")
+    assert not result.ok
+    assert "diagonal" in result.error
+    assert game.current_player_index == 0
+    assert game.current_player.wall_count == 10
+
+
+def scripted_input(monkeypatch: pytest.MonkeyPatch, entries: list[str]) -> None:
+    answers = iter(entries)
+    monkeypatch.setattr("builtins.input", lambda message="": next(answers))
+
+
+def test_wall_turn_can_be_abandoned(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = GameManager()
+    scripted_input(monkeypatch, ["H", "9, 9", ""])
+    assert game.wall_turn() is False
+    assert game.current_player_index == 0
+
+
+def test_wall_turn_returns_when_no_wall_fits(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = GameManager()
+    monkeypatch.setattr(game, "legal_moves", lambda: [PawnMove((1, 4))])
+    scripted_input(monkeypatch, ["V"])
+    assert game.wall_turn() is False
+
+
+def test_wall_turn_places_a_wall(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = GameManager()
+    scripted_input(monkeypatch, ["V", "3, 3"])
+    assert game.wall_turn() is True
+    assert game.board.wall_mask(WallOrientation.VERTICAL) == 1 << 30
+    assert game.current_player_index == 1
+
+
+@pytest.mark.parametrize("backend", [BoardBackend.PYDANTIC, BoardBackend.BITBOARD])
+@pytest.mark.parametrize("size, player_count", [(5, 2), (5, 4), (9, 2), (9, 4)])
+@pytest.mark.parametrize("seed", range(4))
+def test_cached_movements_stay_fresh(backend: BoardBackend, size: int, player_count: int, seed: int) -> None:
+    # Every player's moves are read after every step, so a cache that _invalidate_movements should
+    # have dropped would be caught on the next comparison. Small crowded boards put pawns two squares
+    # apart often enough to catch a radius that is one short.
+    rng = random.Random(seed)
+    game = GameManager(size=size, backend=backend, player_count=player_count)
+    for step in range(200):
+        moves = game.legal_moves()
+        if not moves or (game.history and rng.random() < 0.25):
+            game.undo()
+        else:
+            pawn_moves = [move for move in moves if isinstance(move, PawnMove)]
+            # Walls outnumber pawn moves by far - pick the kind first so pawns keep moving
+            game.apply(rng.choice(pawn_moves if pawn_moves and rng.random() < 0.6 else moves))
+        for ps in game.player_states:
+            assert ps.possible_movements == MovementValidator.get_player_valid_moves(game.board, ps.player), step
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from quoridor.bitboard import BitBoard
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import starting_players
+from quoridor.utils.distance_map import DistanceMap
+from quoridor.utils.graph_analysis import GraphAnalysis
+from quoridor.wall import wall_edges
+
+
+def random_walled_board(size: int, walls: int, rng: random.Random) -> BitBoard:
+    # Walls are placed without the path rule, so some boards have closed-off regions
+    board = BitBoard(size=size)
+    placed = 0
+    while placed < walls:
+        position = (rng.randrange(size - 1), rng.randrange(size - 1))
+        placed += board.place_wall_at(position, rng.choice(list(WallOrientation)))
+    return board
+
+
+@pytest.mark.parametrize("size, walls", [(5, 4), (5, 8), (7, 6), (7, 14), (9, 12)])
+@pytest.mark.parametrize("seed", range(4))
+def test_disconnects_matches_bfs(size: int, walls: int, seed: int) -> None:
+    # Every free slot against every start square - disconnects must agree with a BFS over the board
+    # with the wall's edges removed
+    rng = random.Random(f"{seed}/{size}/{walls}")
+    board = random_walled_board(size, walls, rng)
+    for player in starting_players(size, 4):
+        analysis = GraphAnalysis(board, player.destination)
+        for row in range(size - 1):
+            for col in range(size - 1):
+                for orientation in WallOrientation:
+                    if board.wall_conflicts((row, col), orientation):
+                        continue
+                    edges = wall_edges((row, col), orientation, size)
+                    reachable = DistanceMap.compute(board, player.destination, edges)
+                    for start in range(size * size):
+                        position = divmod(start, size)
+                        assert analysis.disconnects(position, edges) == (reachable.distance(position) is None)
+
+
+def test_colliding_non_tree_labels_are_not_a_cut() -> None:
+    # Force two non-tree edges to share a label - removing both leaves the spanning tree intact
+    board = BitBoard(size=5)
+    analysis = GraphAnalysis(board, {(4, col) for col in range(5)})
+    non_tree = [edge for edge in analysis.non_tree_labels if analysis.root not in edge][:2]
+    assert len(non_tree) == 2
+    analysis.non_tree_labels[non_tree[1]] = analysis.non_tree_labels[non_tree[0]]
+    edges = [(divmod(a, 5), divmod(b, 5)) for a, b in non_tree]
+    for start in range(25):
+        assert not analysis.disconnects(divmod(start, 5), edges)
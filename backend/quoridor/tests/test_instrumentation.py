@@ -0,0 +1,102 @@
+import pytest
+
+from quoridor import instrumentation
+from quoridor.cell import Cell
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove
+from quoridor.utils.movement_validator import MovementValidator
+from quoridor.utils.path_finder import PathFinder
+from quoridor.utils.turn_validator import TurnValidator
+from quoridor.utils.wall_validator import WallValidator
+from quoridor.wall import Wall
+
+PATCHED_CLASSES = [GameManager, MovementValidator, PathFinder, TurnValidator, WallValidator]
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.enable()
+    instrumentation.GLOBAL_STATS.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.GLOBAL_STATS.reset()
+
+
+def class_attributes() -> dict[tuple[type, str], object]:
+    return {(owner, name): value for owner in PATCHED_CLASSES for name, value in vars(owner).items()}
+
+
+def test_disable_restores_the_original_objects() -> None:
+    before = class_attributes()
+    instrumentation.enable()
+    try:
+        patched = len(instrumentation._patched)
+        changed = {key for key, value in class_attributes().items() if before[key] is not value}
+        assert changed == {(owner, name) for owner, name, _ in instrumentation._patched}
+        # Static and class methods stay what they were, only wrapped
+        assert all(type(before[key]) is type(vars(key[0])[key[1]]) for key in changed)
+
+        instrumentation.enable()
+        assert len(instrumentation._patched) == patched
+    finally:
+        instrumentation.disable()
+
+    assert not instrumentation.is_enabled()
+    after = class_attributes()
+    assert after.keys() == before.keys()
+    assert all(after[key] is value for key, value in before.items())
+
+
+def test_counts_follow_a_known_sequence(enabled) -> None:
+    game = GameManager()
+    game.stats.reset()
+    instrumentation.GLOBAL_STATS.reset()
+
+    assert game.submit_move(PawnMove((1, 4))).ok
+    assert not game.submit_move(PawnMove((5, 5))).ok
+    assert game.submit_wall(4, 4, WallOrientation.HORIZONTAL).ok
+    game.legal_moves()
+    game_counts = {
+        "turn_validation": 3,
+        "turn_validation.accepted": 2,
+        "turn_validation.rejected.illegal_move": 1,
+        "game.apply": 2,
+        "game.legal_moves": 1,
+        "wall_validator.legal_wall_slots": 2,
+    }
+
+    # Outside any GameManager method, only the global stats see these
+    board = game.board
+    assert not WallValidator.validate_wall_placement(board, game.players, Wall(Cell((8, 8)), WallOrientation.VERTICAL))
+    assert not WallValidator.validate_wall_placement(board, game.players, Wall(Cell((4, 4)), WallOrientation.VERTICAL))
+    assert WallValidator.validate_wall_placement(board, game.players, Wall(Cell((0, 0)), WallOrientation.HORIZONTAL))
+    path = PathFinder.bfs(board, (1, 4), {(8, col) for col in range(9)})
+    game.undo()
+    global_counts = {
+        **game_counts,
+        "wall_validation": 3,
+        "wall_validation.accepted": 1,
+        "wall_validation.rejected.out_of_bounds": 1,
+        "wall_validation.rejected.overlap": 1,
+        "path_finder.bfs": 1,
+    }
+
+    counts = instrumentation.GLOBAL_STATS.snapshot()["counts"]
+    assert {name: counts.get(name) for name in global_counts} == global_counts
+    assert counts["path_finder.bfs.nodes"] >= len(path) - 1
+    assert "wall_validation.rejected.blocks_path" not in counts
+
+    scoped = game.stats.snapshot()
+    assert {name: scoped["counts"].get(name) for name in game_counts} == game_counts
+    assert not any(name.startswith(("wall_validation", "path_finder")) for name in scoped["counts"])
+    assert set(scoped["seconds"]) <= set(scoped["counts"])
+
+
+def test_disabled_engine_counts_nothing() -> None:
+    instrumentation.GLOBAL_STATS.reset()
+    game = GameManager()
+    game.submit_move(PawnMove((1, 4)))
+    game.legal_moves()
+    assert instrumentation.GLOBAL_STATS.snapshot() == {"counts": {}, "seconds": {}}
+    assert game.stats.snapshot() == {"counts": {}, "seconds": {}}
@@ -0,0 +1,91 @@
+import math
+
+import pytest
+
+from quoridor.codec import encode_position
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.engine.mcts import MCTS, ParallelMCTS, _count, _worker_search
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove, WallMove
+
+SETTINGS = {"playouts": 40, "time_budget": math.inf, "max_nodes": 1_000}
+
+
+def midgame(backend: BoardBackend = BoardBackend.BITBOARD, player_count: int = 2) -> GameManager:
+    game = GameManager(backend=backend, player_count=player_count)
+    for kind in [PawnMove, WallMove, PawnMove]:
+        game.apply(next(move for move in game.legal_moves() if isinstance(move, kind)))
+    return game
+
+
+def snapshot(game: GameManager) -> tuple:
+    board = game.board
+    masks = tuple(board.wall_mask(orientation) for orientation in WallOrientation)
+    pawns = tuple((player.position, player.wall_count) for player in game.players)
+    return board.position_key(game.current_player_index), masks, pawns, frozenset(board.walls)
+
+
+@pytest.mark.parametrize("backend", [BoardBackend.PYDANTIC, BoardBackend.BITBOARD])
+@pytest.mark.parametrize("player_count", [2, 4])
+def test_search_restores_the_board(backend: BoardBackend, player_count: int) -> None:
+    game = midgame(backend, player_count)
+    before = snapshot(game)
+    result = MCTS(seed=1, **SETTINGS).search(game.board, game.players, game.current_player_index)
+    assert result.move in game.legal_moves()
+    assert snapshot(game) == before
+
+
+def test_node_cap_holds() -> None:
+    game = midgame()
+    engine = MCTS(playouts=300, time_budget=math.inf, max_nodes=25, seed=2)
+    result = engine.search(game.board, game.players, game.current_player_index)
+    assert result.playouts == 300
+    assert result.nodes <= 25
+    assert _count(engine.root) == result.nodes
+    # Once the tree is full, playouts keep visiting it
+    assert engine.root.visits == 300
+
+
+def test_lanes_grow_separate_trees_and_are_summed() -> None:
+    game = midgame()
+    side = game.current_player_index
+    position = encode_position(game.board, game.players, side)
+    with ParallelMCTS(workers=3, seed=7, **SETTINGS) as engine:
+        result = engine.search(game.board, game.players, side)
+        settings = engine.settings
+
+    # The same lanes run in this process - one fresh tree per seed
+    reports = [_worker_search(position, settings, 7 + lane) for lane in range(3)]
+    assert len({tuple(report.stats) for report in reports}) > 1
+    for report in reports:
+        assert sum(visits for _, visits, _ in report.stats) == report.playouts
+        assert report.nodes <= SETTINGS["max_nodes"]
+
+    totals: dict = {}
+    for report in reports:
+        for move, visits, wins in report.stats:
+            total = totals.setdefault(move, [0, 0])
+            total[0] += visits
+            total[1] += wins
+    best = max(totals, key=lambda move: totals[move][0])
+    assert result.move == best
+    assert result.visits == totals[best][0]
+    assert result.value == totals[best][1] / totals[best][0]
+    # Playouts are split between the lanes, rounding up
+    assert result.playouts == 3 * -(-SETTINGS["playouts"] // 3)
+    assert result.playouts == sum(report.playouts for report in reports)
+    assert result.nodes == sum(report.nodes for report in reports)
+    assert result.workers == 3
+
+
+def test_parallel_search_respects_the_cap_and_leaves_the_board_alone() -> None:
+    game = midgame()
+    before = snapshot(game)
+    with ParallelMCTS(workers=2, playouts=200, time_budget=math.inf, max_nodes=15, seed=3) as engine:
+        first = engine.search(game.board, game.players, game.current_player_index)
+        second = engine.search(game.board, game.players, game.current_player_index)
+    assert first.nodes <= 2 * 15
+    assert second.nodes <= 2 * 15
+    # Every search starts new trees - nothing carries over between searches
+    assert second.playouts == first.playouts == 200
+    assert snapshot(game) == before
@@ -0,0 +1,38 @@
+import pytest
+
+from quoridor.consts import BoardBackend
+from quoridor.game_manager import GameManager
+from quoridor.perft import divide, perft
+
+# 9x9 opening: 3 pawn moves and 128 walls. After a wall the reply loses the slots it rules out (4,
+# or 3 at the ends of its axis) and, for the four walls next to B, one pawn move.
+OPENING_PERFT = {1: 131, 2: 16677}
+
+
+def opening(backend: BoardBackend, size: int = 9) -> GameManager:
+    return GameManager(size=size, backend=backend)
+
+
+@pytest.mark.parametrize("backend", list(BoardBackend))
+@pytest.mark.parametrize("depth, nodes", OPENING_PERFT.items())
+def test_opening_perft(backend: BoardBackend, depth: int, nodes: int) -> None:
+    game = opening(backend)
+    key = game.position_key
+    assert perft(game.board, game.players, game.current_player_index, depth) == nodes
+    # Every move is reverted
+    assert game.position_key == key
+
+
+def test_divide_matches_perft() -> None:
+    game = opening(BoardBackend.BITBOARD)
+    result = divide(game.board, game.players, game.current_player_index, 2)
+    assert result.nodes == OPENING_PERFT[2]
+    assert len(result.divide) == OPENING_PERFT[1]
+
+
+def test_backends_agree_deeper_on_a_small_board() -> None:
+    counts = [
+        perft(game.board, game.players, game.current_player_index, 3)
+        for game in (opening(backend, size=5) for backend in BoardBackend)
+    ]
+    assert counts[0] == counts[1]
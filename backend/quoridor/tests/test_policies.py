@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from quoridor.codec import GameRecordView, encode_game
+from quoridor.consts import WallOrientation
+from quoridor.engine.policies import POLICIES, GreedyPolicy, MovePolicy, RandomPolicy
+from quoridor.game_manager import GameManager
+from quoridor.move import WallMove
+from quoridor.self_play import play_game
+
+
+def cornered_game(wall_count: int = 5) -> GameManager:
+    # A is cornered - the wall shuts the square to the right and the side-step past B, and C stops the
+    # jump over B. A still has a path once the pawns move, so walls stay legal.
+    game = GameManager(player_count=4)
+    a, b, c, _ = game.players
+    game.board.move_player(a, (0, 0))
+    game.board.move_player(b, (1, 0))
+    game.board.move_player(c, (2, 0))
+    game.board.place_wall_at((0, 0), WallOrientation.VERTICAL)
+    for player in game.players:
+        player.wall_count = wall_count
+    game.reload_state()
+    assert not game.current_player_state.possible_movements
+    return game
+
+
+def test_move_policy_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        MovePolicy()
+
+
+@pytest.mark.parametrize("policy", [GreedyPolicy(), RandomPolicy(), RandomPolicy(wall_probability=0)])
+def test_cornered_pawn_places_a_wall(policy: MovePolicy) -> None:
+    game = cornered_game()
+    for seed in range(10):
+        move = policy.choose(game, random.Random(seed))
+        assert isinstance(move, WallMove)
+        assert move in game.legal_moves()
+
+
+@pytest.mark.parametrize("policy", [GreedyPolicy(), RandomPolicy(), RandomPolicy(wall_probability=1)])
+def test_cornered_pawn_without_walls_passes(policy: MovePolicy) -> None:
+    game = cornered_game(wall_count=0)
+    assert game.legal_moves() == []
+    assert policy.choose(game, random.Random(0)) is None
+
+
+def test_pass_turn_is_undone() -> None:
+    game = cornered_game(wall_count=0)
+    key = game.position_key
+    game.pass_turn()
+    assert game.current_player_index == 1
+    assert game.turn == 2
+    game.undo()
+    assert game.current_player_index == 0
+    assert game.turn == 1
+    assert game.position_key == key
+
+
+def test_passes_survive_the_binary_record() -> None:
+    game = GameManager()
+    game.apply(game.legal_moves()[0])
+    game.pass_turn()
+    game.apply(game.legal_moves()[0])
+    record = GameRecordView(encode_game(game))
+    assert list(record.moves())[1] is None
+    replayed = record.replay()
+    assert replayed.position_key == game.position_key
+    assert [record is None for _, record in replayed.history] == [False, True, False]
+
+
+class PassPolicy(MovePolicy):
+    def choose(self, game: GameManager, rng: random.Random) -> None:
+        return None
+
+
+def test_play_game_ends_once_everyone_passes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(POLICIES, "pass", PassPolicy)
+    record = play_game(0, ["pass"] * 4, max_turns=50)
+    assert record["winner"] is None
+    assert record["moves"] == [None] * 4
+
+
+def test_play_game_keeps_going_after_a_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(POLICIES, "pass", PassPolicy)
+    record = play_game(0, ["pass", "greedy"], max_turns=50)
+    assert record["winner"] == GameManager().players[1].name
+    assert record["moves"][::2] == [None] * len(record["moves"][::2])
@@ -0,0 +1,168 @@
+import io
+import random
+import re
+
+import pytest
+
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove
+from quoridor.renderer import CLEAR_BELOW, CLEAR_SCREEN, CURSOR_HOME, TerminalRenderer, render_frame
+
+TOKEN = re.compile(r"\x1b\[(\d+);(\d+)H|\x1b\[H|\x1b\[2J|\x1b\[J|\n|[^\x1b\n]+")
+
+
+class Screen:
+    # Just enough of a terminal to replay what TerminalRenderer writes
+
+    def __init__(self) -> None:
+        self.rows: list[list[str]] = []
+        self.row = self.col = 0
+
+    def feed(self, output: str) -> None:
+        position = 0
+        while position < len(output):
+            match = TOKEN.match(output, position)
+            assert match is not None, f"unexpected output at {output[position:position + 10]!r}"
+            token = match.group(0)
+            position = match.end()
+            if match.group(1):
+                self.row, self.col = int(match.group(1)) - 1, int(match.group(2)) - 1
+            elif token == CURSOR_HOME:
+                self.row = self.col = 0
+            elif token == CLEAR_SCREEN:
+                self.rows = []
+            elif token == CLEAR_BELOW:
+                del self.rows[self.row + 1 :]
+                if self.row < len(self.rows):
+                    del self.rows[self.row][self.col :]
+            elif token == "\n":
+                self.row, self.col = self.row + 1, 0
+            else:
+                self._write(token)
+
+    def _write(self, text: str) -> None:
+        while len(self.rows) <= self.row:
+            self.rows.append([])
+        line = self.rows[self.row]
+        line.extend(" " * (self.col + len(text) - len(line)))
+        line[self.col : self.col + len(text)] = text
+        self.col += len(text)
+
+    def lines(self) -> list[str]:
+        lines = ["".join(row).rstrip() for row in self.rows]
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+
+def frame_lines(frame: str) -> list[str]:
+    return [line.rstrip() for line in frame.split("\n")[:-1]]
+
+
+def frame(game: GameManager) -> str:
+    state = game.current_player_state
+    return render_frame(game.board, game.players, game.current_player_index, state.possible_movements.values())
+
+
+def test_two_player_frame() -> None:
+    game = GameManager(size=5)
+    game.submit_wall(1, 1, WallOrientation.HORIZONTAL)
+    game.submit_wall(2, 3, WallOrientation.VERTICAL)
+    assert frame(game) == (
+        " .   a   A   a   . \n"
+        "                   \n"
+        " .   .   a   .   . \n"
+        "    --- ---        \n"
+        " .   .   .   . | . \n"
+        "                   \n"
+        " .   .   .   . | . \n"
+        "                   \n"
+        " .   .   B   .   . \n"
+        "A's turn\n"
+    )
+
+
+def test_four_player_frame() -> None:
+    game = GameManager(size=5, player_count=4)
+    game.submit_move(PawnMove((1, 2)))
+    game.submit_wall(2, 0, WallOrientation.VERTICAL)
+    assert frame(game) == (
+        " .   .   .   .   . \n"
+        "                   \n"
+        " c   .   A   .   . \n"
+        "                   \n"
+        " C | .   .   .   D \n"
+        "                   \n"
+        " c | .   .   .   . \n"
+        "                   \n"
+        " .   .   B   .   . \n"
+        "C's turn\n"
+    )
+
+
+def test_plain_renderer_writes_whole_frames() -> None:
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream)
+    game = GameManager(size=5)
+    renderer.draw(frame(game))
+    renderer.draw(frame(game))
+    assert stream.getvalue() == frame(game) * 2
+
+
+@pytest.mark.parametrize("size, player_count", [(5, 2), (5, 4), (9, 2), (9, 4)])
+def test_ansi_diffs_reproduce_every_frame(size: int, player_count: int) -> None:
+    rng = random.Random(size * player_count)
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream, ansi=True)
+    screen = Screen()
+    game = GameManager(size=size, player_count=player_count)
+    for step in range(60):
+        current = frame(game)
+        renderer.draw(current)
+        screen.feed(stream.getvalue())
+        stream.seek(0)
+        stream.truncate()
+        assert screen.lines() == frame_lines(current), step
+        # The cursor is left below the frame
+        assert (screen.row, screen.col) == (len(frame_lines(current)), 0)
+
+        moves = game.legal_moves()
+        if not moves:
+            break
+        pawn_moves = [move for move in moves if isinstance(move, PawnMove)]
+        game.apply(rng.choice(pawn_moves if pawn_moves and rng.random() < 0.7 else moves))
+
+
+def test_ansi_diff_of_a_pawn_step_is_small() -> None:
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream, ansi=True)
+    game = GameManager()
+    renderer.draw(frame(game))
+    full = len(stream.getvalue())
+    stream.seek(0)
+    stream.truncate()
+    game.submit_move(PawnMove((1, 4)))
+    renderer.draw(frame(game))
+    assert CLEAR_SCREEN not in stream.getvalue()
+    assert len(stream.getvalue()) < full // 4
+
+
+def test_smaller_frame_and_reset() -> None:
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream, ansi=True)
+    screen = Screen()
+    large, small = frame(GameManager(size=9)), frame(GameManager(size=5))
+
+    renderer.draw(large)
+    renderer.draw(small)
+    screen.feed(stream.getvalue())
+    assert screen.lines() == frame_lines(small)
+
+    renderer.reset()
+    stream.seek(0)
+    stream.truncate()
+    renderer.draw(large)
+    assert stream.getvalue().startswith(CURSOR_HOME + CLEAR_SCREEN)
+    screen.feed(stream.getvalue())
+    assert screen.lines() == frame_lines(large)
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.engine.search import Searcher, TranspositionTable
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove
+
+
+class NoTable(TranspositionTable):
+    # Stores nothing, so every node is searched in full
+    def probe(self, key: int):
+        return None
+
+
+def random_position(seed: int, backend: BoardBackend, size: int = 5, plies: int = 6) -> GameManager:
+    rng = random.Random(seed)
+    game = GameManager(size=size, backend=backend)
+    for _ in range(plies):
+        moves = game.legal_moves()
+        pawn_moves = [move for move in moves if isinstance(move, PawnMove)]
+        # Keep some walls in hand so the search is not handed straight to the endgame table
+        game.submit_move(rng.choice(pawn_moves if game.current_player.wall_count < 3 else moves))
+        if game.winner() is not None:
+            break
+    return game
+
+
+def state(game: GameManager) -> tuple:
+    board = game.board
+    return (
+        board.zobrist_key,
+        game.position_key,
+        board.wall_mask(WallOrientation.HORIZONTAL),
+        board.wall_mask(WallOrientation.VERTICAL),
+        tuple((player.position, player.wall_count) for player in game.players),
+        tuple(board.is_occupied(divmod(index, board.size)) for index in range(board.size * board.size)),
+    )
+
+
+@pytest.mark.parametrize("backend", list(BoardBackend))
+@pytest.mark.parametrize("seed", range(4))
+def test_search_restores_the_board(backend: BoardBackend, seed: int) -> None:
+    game = random_position(seed, backend)
+    before = state(game)
+    Searcher(time_budget=float("inf"), max_depth=3).search(game.board, game.players, game.current_player_index)
+    assert state(game) == before
+
+
+def test_timed_out_search_restores_the_board() -> None:
+    game = GameManager(backend=BoardBackend.BITBOARD)
+    before = state(game)
+    result = Searcher(time_budget=0.05).search(game.board, game.players, 0)
+    assert result.move is not None
+    assert state(game) == before
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_table_hits_match_a_full_search(seed: int) -> None:
+    game = random_position(seed, BoardBackend.BITBOARD)
+    if game.winner() is not None:
+        pytest.skip("game already over")
+    with_table = Searcher(time_budget=float("inf"), max_depth=3)
+    without_table = Searcher(time_budget=float("inf"), max_depth=3)
+    without_table.table = NoTable()
+    expected = without_table.search(game.board, game.players, game.current_player_index)
+    # Searched twice so the second search runs on a table already holding every position
+    with_table.search(game.board, game.players, game.current_player_index)
+    result = with_table.search(game.board, game.players, game.current_player_index)
+    assert result.score == expected.score
+    assert result.nodes <= expected.nodes
+
+
+def test_unreachable_pawn_moves_are_ordered_last(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = GameManager(backend=BoardBackend.BITBOARD)
+    searcher = Searcher()
+    searcher._board, searcher._players = game.board, game.players
+    real_map = game.board.distance_map(game.players[0].destination)
+
+    class PartialMap:
+        # The square straight ahead reads as unreachable
+        def distance(self, position):
+            return None if position == (1, 4) else real_map.distance(position)
+
+        def is_cut_by(self, edges):
+            return real_map.is_cut_by(edges)
+
+    monkeypatch.setattr(game.board, "distance_map", lambda destination: PartialMap())
+    pawn_moves = [move for move in searcher._ordered_moves(0, None) if isinstance(move, PawnMove)]
+    assert pawn_moves[-1] == PawnMove((1, 4))
@@ -0,0 +1,144 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+import quoridor
+from quoridor.bitboard import BitBoard
+from quoridor.board import Board
+from quoridor.cell import Cell
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import GameManager
+from quoridor.move import PawnMove, WallMove
+from quoridor.player import Player
+from quoridor.player_state import PlayerState
+from quoridor.schemas import GameStateSchema, MoveSchema, PlayerSchema, SquareSchema, WallSchema
+from quoridor.wall import Wall
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+# Slotted core types
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        Cell((1, 2)),
+        Wall(Cell((1, 2)), WallOrientation.VERTICAL),
+        Player(name="A", position=(0, 4)),
+        PlayerState(Player(name="A", position=(0, 4))),
+    ],
+    ids=lambda value: type(value).__name__,
+)
+def test_core_types_have_no_instance_dict(value) -> None:
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.colour = "red"
+
+
+def test_walls_compare_by_square_and_orientation() -> None:
+    wall = Wall(Cell((1, 2)), WallOrientation.VERTICAL)
+    same = Wall(Cell((1, 2)), WallOrientation.VERTICAL)
+    assert wall == same
+    assert hash(wall) == hash(same)
+    assert wall != Wall(Cell((1, 2)), WallOrientation.HORIZONTAL)
+    assert wall != Wall(Cell((2, 1)), WallOrientation.VERTICAL)
+    assert wall != (1, 2)
+    assert len({wall, same, Wall(Cell((2, 1)), WallOrientation.VERTICAL)}) == 2
+
+
+def test_players_hash_by_name_position_and_walls() -> None:
+    player = Player(name="A", position=(0, 4), destination={(8, 4)})
+    assert hash(player) == hash(Player(name="A", position=(0, 4)))
+    moved = Player(name="A", position=(1, 4))
+    assert hash(player) != hash(moved)
+    assert player != moved
+
+
+# Lazy package import
+
+
+def run_python(code: str) -> str:
+    env = {**os.environ, "PYTHONPATH": SRC}
+    return subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+
+
+def test_import_loads_no_submodules() -> None:
+    loaded = run_python(
+        "import sys, quoridor; print(sorted(m for m in sys.modules if m.startswith(('quoridor', 'pydantic'))))"
+    )
+    assert loaded.strip() == "['quoridor']"
+
+
+def test_engine_import_does_not_load_pydantic() -> None:
+    loaded = run_python(
+        "import sys; from quoridor import GameManager; GameManager().legal_moves(); print('pydantic' in sys.modules)"
+    )
+    assert loaded.strip() == "False"
+
+
+@pytest.mark.parametrize("name", quoridor.__all__)
+def test_exports_resolve_to_their_modules(name: str) -> None:
+    module = importlib.import_module(quoridor._EXPORTS[name], "quoridor")
+    assert getattr(quoridor, name) is getattr(module, name)
+    assert name in dir(quoridor)
+
+
+def test_unknown_export_raises() -> None:
+    with pytest.raises(AttributeError, match="no_such_name"):
+        quoridor.no_such_name
+
+
+# Wire schemas
+
+
+def test_move_schema_builds_engine_moves() -> None:
+    assert MoveSchema.model_validate({"type": "move", "row": 1, "col": 4}).to_move() == PawnMove((1, 4))
+    wall = MoveSchema.model_validate({"type": "wall", "row": 2, "col": 3, "orientation": "horizontal"})
+    assert wall.to_move() == WallMove((2, 3), WallOrientation.HORIZONTAL)
+
+    with pytest.raises(ValueError, match="needs an orientation"):
+        MoveSchema.model_validate({"type": "wall", "row": 2, "col": 3}).to_move()
+    with pytest.raises(ValueError, match="unknown move type"):
+        MoveSchema.model_validate({"type": "jump", "row": 2, "col": 3}).to_move()
+    with pytest.raises(ValidationError):
+        MoveSchema.model_validate({"type": "wall", "row": 2, "col": 3, "orientation": "diagonal"})
+    with pytest.raises(ValidationError):
+        MoveSchema.model_validate({"type": "move", "row": "north"})
+
+
+@pytest.mark.parametrize("board_type", [Board, BitBoard])
+def test_wall_schema_reads_both_backends(board_type: type) -> None:
+    board = board_type(size=9)
+    board.place_wall_at((2, 3), WallOrientation.VERTICAL)
+    (wall,) = board.walls
+    assert WallSchema.from_wall(wall).model_dump(mode="json") == {"row": 2, "col": 3, "orientation": "vertical"}
+
+
+def test_state_schema_shape() -> None:
+    game = GameManager()
+    game.submit_move(PawnMove((1, 4)))
+    game.submit_wall(4, 4, WallOrientation.HORIZONTAL)
+    state = GameStateSchema(
+        id="game",
+        size=game.board.size,
+        turn=game.turn,
+        current_player=game.current_player_index,
+        winner=None,
+        players=[PlayerSchema.from_player(player) for player in game.players],
+        walls=[WallSchema.from_wall(wall) for wall in game.board.walls],
+        moves=[
+            SquareSchema.from_position(position) for position in game.current_player_state.possible_movements.values()
+        ],
+    ).model_dump(mode="json")
+    assert json.loads(json.dumps(state)) == state
+    assert state["type"] == "state"
+    assert state["players"][0] == {"name": "A", "row": 1, "col": 4, "wall_count": 10}
+    assert state["players"][1]["wall_count"] == 9
+    assert state["walls"] == [{"row": 4, "col": 4, "orientation": "horizontal"}]
+    assert {"row": 1, "col": 4} not in state["moves"]
@@ -0,0 +1,130 @@
+import pytest
+
+from quoridor.consts import BoardBackend, WallOrientation
+from quoridor.game_manager import GameManager
+from quoridor.utils.wall_validator import WallValidator
+
+BACKENDS = list(BoardBackend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_empty_board_has_128_wall_slots(backend: BoardBackend) -> None:
+    game = GameManager(backend=backend)
+    slots = WallValidator.legal_wall_slots(game.board, game.players)
+    assert len(slots) == 128
+    assert all(row < 8 and col < 8 for (row, col), _ in slots)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("position", [(0, 8), (8, 0), (8, 8), (3, 8), (8, 3)])
+@pytest.mark.parametrize("orientation", list(WallOrientation))
+def test_walls_cannot_start_on_the_last_row_or_column(
+    backend: BoardBackend, position: tuple[int, int], orientation: WallOrientation
+) -> None:
+    game = GameManager(backend=backend)
+    result = game.submit_wall(*position, orientation)
+    assert result.error == "wall out of bounds"
+    assert game.current_player.wall_count == 10
+    assert not game.board.walls
+    assert not WallValidator.validate_wall_placement(
+        game.board, game.players, game.board.wall_at(position, orientation)
+    )
+
+
+# Official crossing rules, checked against an existing horizontal or vertical wall anchored at (3, 3).
+# A horizontal wall at (r, c) lies under squares (r, c) and (r, c + 1); a vertical one right of (r, c)
+# and (r + 1, c). Both pass through the midpoint at the corner of (r, c) and (r + 1, c + 1).
+H, V = WallOrientation.HORIZONTAL, WallOrientation.VERTICAL
+ANCHOR = (3, 3)
+
+CONFLICTS = [
+    pytest.param(H, (3, 3), H, id="exact-horizontal"),
+    pytest.param(V, (3, 3), V, id="exact-vertical"),
+    pytest.param(H, (3, 3), V, id="cross-vertical-over-horizontal"),
+    pytest.param(V, (3, 3), H, id="cross-horizontal-over-vertical"),
+    pytest.param(H, (3, 2), H, id="partial-horizontal-left"),
+    pytest.param(H, (3, 4), H, id="partial-horizontal-right"),
+    pytest.param(V, (2, 3), V, id="partial-vertical-above"),
+    pytest.param(V, (4, 3), V, id="partial-vertical-below"),
+]
+
+ALLOWED = [
+    pytest.param(H, (3, 1), H, id="end-to-end-horizontal-left"),
+    pytest.param(H, (3, 5), H, id="end-to-end-horizontal-right"),
+    pytest.param(V, (1, 3), V, id="end-to-end-vertical-above"),
+    pytest.param(V, (5, 3), V, id="end-to-end-vertical-below"),
+    pytest.param(H, (2, 3), V, id="t-vertical-above-midpoint"),
+    pytest.param(H, (4, 3), V, id="t-vertical-below-midpoint"),
+    pytest.param(H, (3, 2), V, id="t-vertical-at-left-end"),
+    pytest.param(H, (3, 4), V, id="t-vertical-at-right-end"),
+    pytest.param(V, (3, 2), H, id="t-horizontal-left-of-midpoint"),
+    pytest.param(V, (3, 4), H, id="t-horizontal-right-of-midpoint"),
+    pytest.param(V, (2, 3), H, id="t-horizontal-at-top-end"),
+    pytest.param(V, (4, 3), H, id="t-horizontal-at-bottom-end"),
+    pytest.param(H, (4, 3), H, id="parallel-horizontal-below"),
+    pytest.param(V, (3, 4), V, id="parallel-vertical-right"),
+]
+
+
+def board_with_wall(backend: BoardBackend, orientation: WallOrientation) -> GameManager:
+    game = GameManager(backend=backend)
+    assert game.board.place_wall_at(ANCHOR, orientation)
+    return game
+
+
+def placement_allowed(game: GameManager, position: tuple[int, int], orientation: WallOrientation) -> bool:
+    board = game.board
+    overlaps = WallValidator._overlaps_with_existing_wall(board, board.wall_at(position, orientation))
+    slot_legal = (position, orientation) in WallValidator.legal_wall_slots(board, game.players)
+    assert slot_legal == (not overlaps) == (not board.wall_conflicts(position, orientation))
+    return slot_legal
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("existing, position, orientation", CONFLICTS)
+def test_overlapping_walls_are_rejected(
+    backend: BoardBackend, existing: WallOrientation, position: tuple[int, int], orientation: WallOrientation
+) -> None:
+    game = board_with_wall(backend, existing)
+    assert not placement_allowed(game, position, orientation)
+    assert not game.board.place_wall_at(position, orientation)
+    assert game.submit_wall(*position, orientation).error == "illegal wall"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("existing, position, orientation", ALLOWED)
+def test_touching_walls_are_allowed(
+    backend: BoardBackend, existing: WallOrientation, position: tuple[int, int], orientation: WallOrientation
+) -> None:
+    game = board_with_wall(backend, existing)
+    assert placement_allowed(game, position, orientation)
+    assert game.submit_wall(*position, orientation).ok
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("existing, position, orientation", CONFLICTS)
+def test_removed_wall_frees_its_slots(
+    backend: BoardBackend, existing: WallOrientation, position: tuple[int, int], orientation: WallOrientation
+) -> None:
+    game = board_with_wall(backend, existing)
+    key = game.board.zobrist_key
+    game.board.remove_wall_at(ANCHOR, existing)
+    assert placement_allowed(game, position, orientation)
+    assert game.board.place_wall_at(position, orientation)
+    game.board.remove_wall_at(position, orientation)
+    # Re-adding the original wall restores the same slots and key
+    assert game.board.place_wall_at(ANCHOR, existing)
+    assert game.board.zobrist_key == key
+    assert not placement_allowed(game, position, orientation)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_conflicts_from_two_walls_are_counted(backend: BoardBackend) -> None:
+    # (3, 4) horizontal is ruled out by both walls - removing one must not free it
+    game = GameManager(backend=backend)
+    assert game.board.place_wall_at((3, 3), H)
+    assert game.board.place_wall_at((3, 5), H)
+    game.board.remove_wall_at((3, 3), H)
+    assert not placement_allowed(game, (3, 4), H)
+    game.board.remove_wall_at((3, 5), H)
+    assert placement_allowed(game, (3, 4), H)
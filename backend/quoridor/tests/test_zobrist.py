@@ -0,0 +1,70 @@
+import pytest
+
+from quoridor.bitboard import BitBoard
+from quoridor.board import Board
+from quoridor.consts import WallOrientation
+from quoridor.game_manager import starting_players
+from quoridor.move import PawnMove, WallMove
+
+BOARD_TYPES = [Board, BitBoard]
+
+
+def opening(board_type: type, player_count: int = 2):
+    board = board_type(size=9)
+    players = starting_players(9, player_count)
+    board.set_occupation_state(set(players))
+    return board, players
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+@pytest.mark.parametrize(
+    "move", [PawnMove((1, 4)), WallMove((4, 4), WallOrientation.HORIZONTAL), WallMove((0, 7), WallOrientation.VERTICAL)]
+)
+def test_apply_then_revert_restores_the_key(board_type: type, move) -> None:
+    board, players = opening(board_type)
+    key = board.zobrist_key
+    record = board.apply(players[0], move)
+    assert board.zobrist_key != key
+    board.revert(players[0], record)
+    assert board.zobrist_key == key
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_side_to_move_changes_the_position_key(board_type: type) -> None:
+    board, _ = opening(board_type, player_count=4)
+    keys = {board.position_key(side) for side in range(4)}
+    assert len(keys) == 4
+    assert all(key != board.zobrist_key for key in keys)
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_walls_left_change_the_key(board_type: type) -> None:
+    # Same pawns and walls on the board, only the walls in hand differ
+    board, players = opening(board_type)
+    key = board.zobrist_key
+    players[0].wall_count -= 1
+    board.set_occupation_state(set(players))
+    assert board.zobrist_key != key
+
+    # Moving a wall from one player's hand to the other's is a different position too
+    players[1].wall_count += 1
+    board.set_occupation_state(set(players))
+    assert board.zobrist_key != key
+    players[0].wall_count += 1
+    players[1].wall_count -= 1
+    board.set_occupation_state(set(players))
+    assert board.zobrist_key == key
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_transposed_moves_reach_the_same_key(board_type: type) -> None:
+    board, players = opening(board_type)
+    first = [WallMove((2, 2), WallOrientation.HORIZONTAL), WallMove((5, 5), WallOrientation.VERTICAL)]
+    for move in first:
+        board.apply(players[0], move)
+    key = board.zobrist_key
+
+    other, other_players = opening(board_type)
+    for move in reversed(first):
+        other.apply(other_players[0], move)
+    assert other.zobrist_key == key
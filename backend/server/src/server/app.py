@@ -0,0 +1,244 @@
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from quoridor import instrumentation
+from quoridor.consts import SIZE
+
+from server.session import GameSession, SessionRegistry, parse_move
+from server.websocket import ConnectionClosed, WebSocket, accept_key
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+}
+
+
+class HTTPError(Exception):
+    # A request the server answers with an error status instead of routing it
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    def __init__(self, method: str, target: str, headers: dict[str, str], body: bytes) -> None:
+        url = urlsplit(target)
+        self.method = method
+        self.path = url.path.rstrip("/") or "/"
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> dict:
+        return json.loads(self.body or b"{}")
+
+
+class GameServer:
+    # Single-process asyncio HTTP + WebSocket server. Sessions live in memory, state changes are pushed
+    # to every WebSocket subscriber, and rule validation runs on `executor` so the loop never blocks on it.
+    #
+    #   POST /games                  create a session - {"players": 2 | 4}, optional
+    #   GET  /games/<id>             current state
+    #   POST /games/<id>/moves       {"player", "type": "move" | "wall", "row", "col", "orientation"?}
+    #   GET  /games/<id>/ws?player=  WebSocket - pushes state, accepts the same move messages
+    #   GET  /metrics                engine counters, when quoridor.instrumentation is enabled
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 8000, size: int = SIZE, executor: Optional[Executor] = None
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.registry = SessionRegistry(size)
+        self.executor = executor or ThreadPoolExecutor()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            try:
+                request = await self._read_request(reader)
+            except HTTPError as e:
+                await self._respond(writer, e.status, {"error": str(e)})
+                return
+            if request is None:
+                return
+            if request.headers.get("upgrade", "").lower() == "websocket":
+                await self._handle_websocket(request, reader, writer)
+            elif request.path == "/metrics" and request.method == "GET":
+                await self._send(writer, 200, instrumentation.export_text().encode(), METRICS_CONTENT_TYPE)
+            else:
+                status, payload = await self._route(request)
+                await self._respond(writer, status, payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return None
+        if len(head) > MAX_HEADER_BYTES:
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        request_line = lines[0].split(" ", 2)
+        if len(request_line) != 3:
+            raise HTTPError(400, "malformed request line")
+        method, target, _ = request_line
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        length = headers.get("content-length", "0")
+        if not length.isdecimal():
+            raise HTTPError(400, "invalid Content-Length")
+        length = int(length)
+        # The connection closes after every response, so an oversized body is never read
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"request body over {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method, target, headers, body)
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Optional[dict]) -> None:
+        await self._send(writer, status, b"" if payload is None else json.dumps(payload).encode(), "application/json")
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str) -> None:
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+            "Access-Control-Allow-Headers: Content-Type\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode() + body)
+        await writer.drain()
+
+    async def _route(self, request: Request) -> tuple[int, Optional[dict]]:
+        if request.method == "OPTIONS":
+            return 204, None
+        parts = request.path.strip("/").split("/")
+        if parts[0] != "games":
+            return 404, {"error": "not found"}
+
+        if len(parts) == 1:
+            if request.method != "POST":
+                return 405, {"error": "method not allowed"}
+            try:
+                session = self.registry.create(int(request.json().get("players", 2)))
+            except (AttributeError, TypeError, ValueError) as e:
+                return 400, {"error": str(e)}
+            return 201, session.state()
+
+        session = self.registry.get(parts[1])
+        if session is None:
+            return 404, {"error": "no such game"}
+        if len(parts) == 2 and request.method == "GET":
+            return 200, session.state()
+        if len(parts) == 3 and parts[2] == "moves" and request.method == "POST":
+            try:
+                message = request.json()
+                player_index = int(message["player"])
+                move = parse_move(message)
+            except (KeyError, TypeError, ValueError) as e:
+                return 400, {"error": str(e)}
+            error = await session.submit(player_index, move, self.executor)
+            if error is not None:
+                return 409, {"error": error}
+            return 200, session.state()
+        return 404, {"error": "not found"}
+
+    async def _handle_websocket(
+        self, request: Request, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        parts = request.path.strip("/").split("/")
+        session = self.registry.get(parts[1]) if len(parts) == 3 and parts[0] == "games" else None
+        key = request.headers.get("sec-websocket-key")
+        if session is None or parts[2] != "ws" or key is None:
+            await self._respond(writer, 404, {"error": "not found"})
+            return
+
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+            ).encode()
+        )
+        await writer.drain()
+
+        socket = WebSocket(reader, writer)
+        player = request.query.get("player", "")
+        player_index = int(player) if player.isdigit() else None
+        queue = session.subscribe()
+        sender = asyncio.create_task(self._push_updates(socket, queue))
+        try:
+            while True:
+                message = await socket.receive()
+                error = await self._handle_message(session, player_index, message)
+                if error is not None and not queue.full():
+                    queue.put_nowait(json.dumps({"type": "error", "error": error}))
+        except ConnectionClosed:
+            pass
+        finally:
+            session.unsubscribe(queue)
+            sender.cancel()
+            await socket.close()
+
+    async def _handle_message(self, session: GameSession, player_index: Optional[int], message: str) -> Optional[str]:
+        if player_index is None:
+            return "spectators cannot move"
+        try:
+            move = parse_move(json.loads(message))
+        except ValueError as e:
+            return str(e)
+        return await session.submit(player_index, move, self.executor)
+
+    @staticmethod
+    async def _push_updates(socket: WebSocket, queue: asyncio.Queue) -> None:
+        try:
+            while True:
+                await socket.send(await queue.get())
+        except (ConnectionClosed, ConnectionError):
+            pass
@@ -0,0 +1,79 @@
+import asyncio
+import json
+from typing import Optional
+
+from server.websocket import WebSocket, accept_key, client_key
+
+
+class LocalClient:
+    # Talks to a GameServer over loopback from the same process - used to exercise the full HTTP and
+    # WebSocket path without a browser
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+
+    async def request(self, method: str, path: str, payload: Optional[dict] = None) -> tuple[int, dict]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else json.dumps(payload).encode()
+        writer.write(
+            (
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + body
+        )
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        return status, json.loads(body) if body else {}
+
+    async def create_game(self, player_count: int = 2) -> dict:
+        return (await self.request("POST", "/games", {"players": player_count}))[1]
+
+    async def get_state(self, game_id: str) -> dict:
+        return (await self.request("GET", f"/games/{game_id}"))[1]
+
+    async def submit(self, game_id: str, player: int, move: dict) -> tuple[int, dict]:
+        return await self.request("POST", f"/games/{game_id}/moves", {"player": player, **move})
+
+    async def connect(self, game_id: str, player: Optional[int] = None) -> "ClientConnection":
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        key = client_key()
+        query = "" if player is None else f"?player={player}"
+        writer.write(
+            (
+                f"GET /games/{game_id}/ws{query} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Key: {key}\r\n"
+                "Sec-WebSocket-Version: 13\r\n\r\n"
+            ).encode()
+        )
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        if b" 101 " not in head.split(b"\r\n", 1)[0] or accept_key(key).encode() not in head:
+            writer.close()
+            raise ConnectionError(f"WebSocket handshake failed: {head!r}")
+        return ClientConnection(WebSocket(reader, writer, is_client=True))
+
+
+class ClientConnection:
+    def __init__(self, socket: WebSocket) -> None:
+        self.socket = socket
+
+    async def send_move(self, move: dict) -> None:
+        await self.socket.send(json.dumps(move))
+
+    async def receive(self) -> dict:
+        return json.loads(await self.socket.receive())
+
+    async def close(self) -> None:
+        await self.socket.close()
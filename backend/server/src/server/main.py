@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from quoridor import instrumentation
+from quoridor.consts import SIZE
+
+from server.app import GameServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Quoridor game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--processes", action="store_true", help="validate moves in worker processes")
+    parser.add_argument("--instrument", action="store_true", help="count and time engine calls for /metrics")
+    args = parser.parse_args()
+
+    if args.instrument:
+        instrumentation.enable()
+
+    executor_type = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+    server = GameServer(args.host, args.port, args.size, executor_type(max_workers=args.workers))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
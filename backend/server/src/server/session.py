@@ -0,0 +1,132 @@
+import asyncio
+import json
+import time
+import uuid
+from concurrent.futures import Executor
+from typing import Optional
+
+from pydantic import ValidationError
+from quoridor.consts import SIZE, BoardBackend
+from quoridor.game_manager import GameManager
+from quoridor.move import Move
+from quoridor.schemas import GameStateSchema, MoveSchema, PlayerSchema, SquareSchema, WallSchema
+
+from server.validation import snapshot, validate_move
+
+SUBSCRIBER_QUEUE_SIZE = 16
+# Seconds a session is kept without a move or a request - finished games go sooner
+SESSION_TTL = 60 * 60
+FINISHED_SESSION_TTL = 5 * 60
+
+
+def parse_move(message: dict) -> Move:
+    try:
+        schema = MoveSchema.model_validate(message)
+    except ValidationError as e:
+        raise ValueError(f"malformed move: {message}") from e
+    return schema.to_move()
+
+
+class GameSession:
+    def __init__(self, session_id: str, size: int = SIZE, player_count: int = 2) -> None:
+        self.id = session_id
+        self.game = GameManager(size=size, backend=BoardBackend.BITBOARD, player_count=player_count)
+        self.lock = asyncio.Lock()
+        self.subscribers: set[asyncio.Queue] = set()
+        self.last_active = time.monotonic()
+
+    def touch(self) -> None:
+        self.last_active = time.monotonic()
+
+    def is_expired(self, now: float, ttl: float, finished_ttl: float) -> bool:
+        # Sessions someone is still watching are never dropped
+        if self.subscribers:
+            return False
+        idle = now - self.last_active
+        return idle > (finished_ttl if self.game.winner() is not None else ttl)
+
+    def state(self) -> dict:
+        game = self.game
+        winner = game.winner()
+        return GameStateSchema(
+            id=self.id,
+            size=game.board.size,
+            turn=game.turn,
+            current_player=game.current_player_index,
+            winner=None if winner is None else winner.name,
+            players=[PlayerSchema.from_player(ps.player) for ps in game.player_states],
+            walls=[WallSchema.from_wall(wall) for wall in game.board.walls],
+            moves=[
+                SquareSchema.from_position(position)
+                for position in game.current_player_state.possible_movements.values()
+            ],
+        ).model_dump(mode="json")
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        queue.put_nowait(json.dumps(self.state()))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    def publish(self) -> None:
+        message = json.dumps(self.state())
+        for queue in self.subscribers:
+            # Every message is a full snapshot, so a slow subscriber only needs the newest ones
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def submit(self, player_index: int, move: Move, executor: Optional[Executor]) -> Optional[str]:
+        async with self.lock:
+            if self.game.winner() is not None:
+                return "game is over"
+            if player_index != self.game.current_player_index:
+                return "not your turn"
+            loop = asyncio.get_running_loop()
+            error = await loop.run_in_executor(executor, validate_move, snapshot(self.game), player_index, move)
+            if error is not None:
+                return error
+            self.game.apply(move)
+            self.touch()
+        self.publish()
+        return None
+
+
+class SessionRegistry:
+    # Idle sessions are dropped whenever a new one is created, so the registry only grows with the
+    # number of games played within `ttl`
+
+    def __init__(self, size: int = SIZE, ttl: float = SESSION_TTL, finished_ttl: float = FINISHED_SESSION_TTL) -> None:
+        self.size = size
+        self.ttl = ttl
+        self.finished_ttl = finished_ttl
+        self.sessions: dict[str, GameSession] = {}
+
+    def create(self, player_count: int = 2) -> GameSession:
+        self.evict_expired()
+        session = GameSession(uuid.uuid4().hex, self.size, player_count)
+        self.sessions[session.id] = session
+        return session
+
+    def get(self, session_id: str) -> Optional[GameSession]:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.touch()
+        return session
+
+    def evict_expired(self) -> int:
+        now = time.monotonic()
+        expired = [
+            session_id
+            for session_id, session in self.sessions.items()
+            if session.is_expired(now, self.ttl, self.finished_ttl)
+        ]
+        for session_id in expired:
+            del self.sessions[session_id]
+        return len(expired)
+
+    def remove(self, session_id: str) -> None:
+        self.sessions.pop(session_id, None)
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from quoridor.codec import PositionView, encode_position
+from quoridor.game_manager import GameManager
+from quoridor.move import Move
+from quoridor.utils.turn_validator import TurnValidator
+
+# Rule checks run in a worker pool, so they take the compact binary position rather than the live game
+
+
+def snapshot(game: GameManager) -> bytes:
+    return encode_position(game.board, game.players, game.current_player_index)
+
+
+def validate_move(state: bytes, player_index: int, move: Move) -> Optional[str]:
+    board, players = PositionView(state).build()
+    return TurnValidator.move_error(board, players, players[player_index], move)
@@ -0,0 +1,128 @@
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+from typing import Optional
+
+# Minimal RFC 6455 framing - text, close, ping and pong frames, no extensions or fragmentation
+
+HANDSHAKE_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+TEXT = 0x1
+CLOSE = 0x8
+PING = 0x9
+PONG = 0xA
+
+# Game states are a few kilobytes - anything near this is not a client of ours
+MAX_FRAME_BYTES = 64 * 1024
+
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_TOO_BIG = 1009
+
+
+class ConnectionClosed(Exception):
+    pass
+
+
+class FrameError(ConnectionClosed):
+    # A frame the peer should not have sent - the connection is closed with `code`
+
+    def __init__(self, code: int, reason: str) -> None:
+        super().__init__(reason)
+        self.code = code
+
+
+def accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + HANDSHAKE_GUID).encode()).digest()).decode()
+
+
+def client_key() -> str:
+    return base64.b64encode(os.urandom(16)).decode()
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool = False) -> bytes:
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if mask:
+        masking_key = os.urandom(4)
+        header += masking_key
+        payload = bytes(byte ^ masking_key[i % 4] for i, byte in enumerate(payload))
+    return bytes(header) + payload
+
+
+async def read_frame(
+    reader: asyncio.StreamReader, require_mask: bool = False, max_bytes: int = MAX_FRAME_BYTES
+) -> tuple[int, bytes]:
+    # The length is checked before the payload is read, so an oversized frame never reaches memory
+    try:
+        first, second = await reader.readexactly(2)
+        if require_mask and not second & 0x80:
+            raise FrameError(CLOSE_PROTOCOL_ERROR, "client frames must be masked")
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        if length > max_bytes:
+            raise FrameError(CLOSE_TOO_BIG, f"frame over {max_bytes} bytes")
+        masking_key: Optional[bytes] = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+    except (asyncio.IncompleteReadError, ConnectionError) as e:
+        raise ConnectionClosed() from e
+    if masking_key is not None:
+        payload = bytes(byte ^ masking_key[i % 4] for i, byte in enumerate(payload))
+    return first & 0x0F, payload
+
+
+class WebSocket:
+    # One side of an upgraded connection. Clients must mask their frames, servers must not.
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, is_client: bool = False) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.is_client = is_client
+        self.closed = False
+
+    async def send(self, text: str) -> None:
+        if self.closed:
+            raise ConnectionClosed()
+        self.writer.write(encode_frame(TEXT, text.encode(), mask=self.is_client))
+        await self.writer.drain()
+
+    async def receive(self) -> str:
+        while True:
+            try:
+                opcode, payload = await read_frame(self.reader, require_mask=not self.is_client)
+            except FrameError as e:
+                await self.close(e.code)
+                raise
+            if opcode == TEXT:
+                return payload.decode()
+            if opcode == PING:
+                self.writer.write(encode_frame(PONG, payload, mask=self.is_client))
+                await self.writer.drain()
+            elif opcode == CLOSE:
+                await self.close()
+                raise ConnectionClosed()
+
+    async def close(self, code: Optional[int] = None) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        payload = b"" if code is None else struct.pack("!H", code)
+        try:
+            self.writer.write(encode_frame(CLOSE, payload, mask=self.is_client))
+            await self.writer.drain()
+        except ConnectionError:
+            pass
+        self.writer.close()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Neither package is required to be installed to run the tests
+BACKEND = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(BACKEND, "quoridor", "src"))
+sys.path.insert(0, os.path.join(BACKEND, "server", "src"))
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import struct
+from typing import Awaitable, Callable
+
+from server.app import GameServer
+from server.client import ClientConnection, LocalClient
+from server.websocket import (
+    CLOSE,
+    CLOSE_PROTOCOL_ERROR,
+    CLOSE_TOO_BIG,
+    MAX_FRAME_BYTES,
+    TEXT,
+    encode_frame,
+    read_frame,
+)
+
+FIRST_MOVE = {"type": "move", "row": 1, "col": 4}
+
+
+def run(scenario: Callable[[LocalClient], Awaitable[None]]) -> None:
+    async def main() -> None:
+        server = GameServer(port=0)
+        await server.start()
+        try:
+            await asyncio.wait_for(scenario(LocalClient(server.host, server.port)), timeout=10)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+async def close_code(connection: ClientConnection) -> int:
+    # Skips pushed states up to the server's close frame
+    while True:
+        opcode, payload = await read_frame(connection.socket.reader)
+        if opcode == CLOSE:
+            return struct.unpack("!H", payload)[0]
+
+
+def test_create_and_join() -> None:
+    async def scenario(client: LocalClient) -> None:
+        state = await client.create_game(4)
+        assert len(state["players"]) == 4
+        assert state["current_player"] == 0
+        assert await client.get_state(state["id"]) == state
+
+        connection = await client.connect(state["id"], player=0)
+        assert await connection.receive() == state
+        await connection.close()
+
+        status, _ = await client.request("GET", "/games/missing")
+        assert status == 404
+
+    run(scenario)
+
+
+def test_move_over_http() -> None:
+    async def scenario(client: LocalClient) -> None:
+        game_id = (await client.create_game())["id"]
+        status, state = await client.submit(game_id, 0, FIRST_MOVE)
+        assert status == 200
+        assert state["current_player"] == 1
+        assert (state["players"][0]["row"], state["players"][0]["col"]) == (1, 4)
+
+    run(scenario)
+
+
+def test_illegal_move_is_a_conflict() -> None:
+    async def scenario(client: LocalClient) -> None:
+        game_id = (await client.create_game())["id"]
+        status, body = await client.submit(game_id, 0, {"type": "move", "row": 5, "col": 5})
+        assert status == 409
+        assert body["error"]
+
+        status, body = await client.submit(game_id, 1, FIRST_MOVE)
+        assert status == 409
+        assert body == {"error": "not your turn"}
+
+        status, _ = await client.submit(game_id, 0, {"type": "jump", "row": 1, "col": 4})
+        assert status == 400
+
+    run(scenario)
+
+
+def test_moves_are_pushed_to_spectators() -> None:
+    async def scenario(client: LocalClient) -> None:
+        game_id = (await client.create_game())["id"]
+        spectator = await client.connect(game_id)
+        player = await client.connect(game_id, player=0)
+        assert (await spectator.receive())["turn"] == 1
+        await player.receive()
+
+        await player.send_move(FIRST_MOVE)
+        state = await spectator.receive()
+        assert state["current_player"] == 1
+        assert state == await player.receive()
+
+        await spectator.send_move(FIRST_MOVE)
+        assert await spectator.receive() == {"type": "error", "error": "spectators cannot move"}
+        await spectator.close()
+        await player.close()
+
+    run(scenario)
+
+
+def test_oversize_frame_is_refused() -> None:
+    async def scenario(client: LocalClient) -> None:
+        game_id = (await client.create_game())["id"]
+        connection = await client.connect(game_id, player=0)
+        # Only the header is sent - the server has to give up before waiting for the payload
+        header = encode_frame(TEXT, b"x" * (MAX_FRAME_BYTES + 1), mask=True)[:14]
+        connection.socket.writer.write(header)
+        await connection.socket.writer.drain()
+        assert await close_code(connection) == CLOSE_TOO_BIG
+        assert (await client.get_state(game_id))["turn"] == 1
+
+    run(scenario)
+
+
+def test_unmasked_client_frame_is_refused() -> None:
+    async def scenario(client: LocalClient) -> None:
+        game_id = (await client.create_game())["id"]
+        connection = await client.connect(game_id, player=0)
+        connection.socket.writer.write(encode_frame(TEXT, json.dumps(FIRST_MOVE).encode()))
+        await connection.socket.writer.drain()
+        assert await close_code(connection) == CLOSE_PROTOCOL_ERROR
+        assert (await client.get_state(game_id))["turn"] == 1
+
+    run(scenario)
+
+
+def test_close_cancels_open_connections() -> None:
+    async def main() -> None:
+        server = GameServer(port=0)
+        await server.start()
+        client = LocalClient(server.host, server.port)
+        connection = await client.connect((await client.create_game())["id"])
+        await connection.receive()
+        tasks = list(server._connections)
+        assert tasks
+        await asyncio.wait_for(server.close(), timeout=5)
+        assert all(task.cancelled() for task in tasks)
+
+    asyncio.run(main())